@@ -0,0 +1,173 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.cdo import translate_validation_errors_to_cdos
+from stamp.extract import ExtractedMetadata
+from stamp.schema import load_schema
+from stamp.validate import compiled_validator, validate_artifact
+
+
+PERSON: Dict[str, Any] = {
+    "type": "object",
+    "required": ["name"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string"},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+        "orcid": {"type": "string", "format": "uri"},
+        "url": {"type": "string", "format": "uri"},
+    },
+}
+
+# A fixed governance schema of the kind repository runs validate against
+SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.org/bench-governance.schema.json",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["title", "filetype", "version", "status", "created", "author", "license"],
+    "properties": {
+        "title": {"type": "string"},
+        "filetype": {"enum": ["documentation", "operational", "data"]},
+        "type": {"enum": ["specification", "report", "dataset", "guide"]},
+        "domain": {"type": "string"},
+        "version": {"type": "string", "pattern": "^[0-9]+\\.[0-9]+\\.[0-9]+$"},
+        "doi": {"type": "string", "pattern": "^10\\.[0-9]{4,9}/"},
+        "status": {"enum": ["Draft", "Active", "Deprecated"]},
+        "created": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "updated": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "author": PERSON,
+        "maintainer": PERSON,
+        "license": {"type": "string"},
+        "ai_assisted": {"enum": ["none", "partial", "full"]},
+        "ai_assistance_details": {"type": "string"},
+        "dependencies": {"type": "array", "items": {"type": "string"}},
+        "anchors": {"type": "array", "items": {"type": "string"}},
+    },
+    "if": {"properties": {"ai_assisted": {"const": "partial"}}, "required": ["ai_assisted"]},
+    "then": {"required": ["ai_assistance_details"]},
+}
+
+
+def build_corpus(count: int, failing: bool) -> List[ExtractedMetadata]:
+    """
+    Metadata for `count` artifacts, all passing or all with a handful
+    of violations.
+    """
+    corpus: List[ExtractedMetadata] = []
+    for i in range(count):
+        metadata: Dict[str, Any] = {
+            "title": f"Calibration Run {i}",
+            "filetype": "documentation",
+            "type": "report",
+            "domain": "instrumentation",
+            "version": f"1.{i % 10}.0",
+            "doi": "10.5281/zenodo.18436622",
+            "status": "Active",
+            "created": "2026-01-27",
+            "updated": "2026-02-14",
+            "author": {"name": "A. Researcher", "email": "a@example.org", "orcid": "https://orcid.org/0000"},
+            "maintainer": {"name": "Waveframe Labs", "url": "https://waveframelabs.org"},
+            "license": "Apache-2.0",
+            "ai_assisted": "partial",
+            "ai_assistance_details": "Drafting.",
+            "dependencies": ["calibration-protocol-v3", "sensor-array-spec"],
+            "anchors": [f"RUN-{i}"],
+        }
+        if failing:
+            metadata["version"] = "v1"
+            metadata["status"] = "Unknown"
+            metadata["author"] = {"email": "not-an-email"}
+            del metadata["ai_assistance_details"]
+            metadata["extra"] = True
+        corpus.append(ExtractedMetadata(Path(f"run-{i:05d}.md"), metadata, None, None))
+    return corpus
+
+
+def artifacts_per_second(validate, corpus: List[ExtractedMetadata], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for extracted in corpus:
+            validate(extracted)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark validation engines on passing and failing artifacts.")
+    parser.add_argument("--artifacts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    resolved_schema = load_schema(SCHEMA)
+    generated = compiled_validator(resolved_schema, "codegen")
+    if generated is compiled_validator(resolved_schema, "jsonschema"):
+        print("❌ The benchmark schema was not compiled.")
+        sys.exit(1)
+
+    for group, failing in (("passing", False), ("failing", True)):
+        corpus = build_corpus(args.artifacts, failing)
+
+        rates = {}
+        for engine in ("jsonschema", "codegen"):
+            validator = compiled_validator(resolved_schema, engine)
+            rates[f"{engine} iter_errors"] = artifacts_per_second(
+                lambda extracted: list(validator.iter_errors(extracted.metadata)),
+                corpus,
+                args.repeat,
+            )
+            rates[f"{engine} single-phase"] = artifacts_per_second(
+                # Full error collection and translation for every artifact
+                lambda extracted: translate_validation_errors_to_cdos(
+                    errors=list(validator.iter_errors(extracted.metadata)),
+                    instance=extracted.metadata,
+                    schema=resolved_schema.schema,
+                ),
+                corpus,
+                args.repeat,
+            )
+            rates[f"{engine} validate_artifact"] = artifacts_per_second(
+                lambda extracted: validate_artifact(
+                    extracted=extracted,
+                    resolved_schema=resolved_schema,
+                    engine=engine,
+                ),
+                corpus,
+                args.repeat,
+            )
+            rates[f"{engine} counts_only"] = artifacts_per_second(
+                # What summary and repo runs need: no CDOs built
+                lambda extracted: validate_artifact(
+                    extracted=extracted,
+                    resolved_schema=resolved_schema,
+                    engine=engine,
+                    counts_only=True,
+                ),
+                corpus,
+                args.repeat,
+            )
+
+        print(f"{group} artifacts ({args.artifacts}):")
+        for name, rate in rates.items():
+            print(f"  {name:30s}: {rate:10.0f} artifacts/s {1e6 / rate:8.1f} µs/artifact")
+        for engine in ("jsonschema", "codegen"):
+            speedup = rates[f"{engine} validate_artifact"] / rates[f"{engine} single-phase"]
+            print(f"  {engine + ' two-phase gain':30s}: {speedup:10.2f}x")
+            speedup = rates[f"{engine} counts_only"] / rates[f"{engine} validate_artifact"]
+            print(f"  {engine + ' counts-only gain':30s}: {speedup:10.2f}x")
+        for kind in ("iter_errors", "validate_artifact"):
+            speedup = rates[f"codegen {kind}"] / rates[f"jsonschema {kind}"]
+            print(f"  {'speedup ' + kind:30s}: {speedup:10.1f}x")
+        print()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,128 @@
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.discovery import DiscoveredArtifact, _is_excluded, discover_artifacts, iter_artifacts
+
+
+# ----------------------------
+# Baseline (pre-pruning) walker
+# ----------------------------
+
+def discover_artifacts_rglob(root: Path) -> List[DiscoveredArtifact]:
+    """
+    The original rglob-then-filter traversal, kept here as the baseline.
+    """
+    artifacts: List[DiscoveredArtifact] = []
+    for path in root.resolve().rglob("*"):
+        if not path.is_file():
+            continue
+        if _is_excluded(path):
+            continue
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        artifacts.append(DiscoveredArtifact(path=path, size_bytes=size))
+    return artifacts
+
+
+# ----------------------------
+# Synthetic tree
+# ----------------------------
+
+def build_tree(root: Path, packages: int, files_per_package: int, sources: int) -> None:
+    """
+    Build a small governed tree next to a large node_modules directory.
+    """
+    for i in range(sources):
+        directory = root / "docs" / f"section-{i % 20:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"note-{i:05d}.md").write_text(
+            "---\ntitle: \"Note\"\n---\nBody\n",
+            encoding="utf-8",
+        )
+
+    for p in range(packages):
+        package = root / "node_modules" / f"pkg-{p:05d}" / "lib"
+        package.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_package):
+            (package / f"mod-{f:03d}.js").write_text("module.exports = {};\n", encoding="utf-8")
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_to_first(fn) -> float:
+    start = time.perf_counter()
+    next(iter(fn()))
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark artifact discovery.")
+    parser.add_argument("--packages", type=int, default=2000)
+    parser.add_argument("--files-per-package", type=int, default=20)
+    parser.add_argument("--sources", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stamp-bench-") as tmp:
+        root = Path(tmp)
+        build_tree(root, args.packages, args.files_per_package, args.sources)
+
+        excluded = args.packages * args.files_per_package
+        print(f"Synthetic tree: {args.sources} governed files, {excluded} files under node_modules\n")
+
+        baseline = discover_artifacts_rglob(root)
+        current = discover_artifacts([root])
+
+        if sorted(a.path for a in baseline) != sorted(a.path for a in current):
+            print("❌ Walkers disagree on the discovered artifact set.")
+            sys.exit(1)
+
+        rglob_time = best_of(lambda: discover_artifacts_rglob(root), args.repeat)
+        scandir_time = best_of(lambda: discover_artifacts([root]), args.repeat)
+
+        print(f"rglob + filter   : {rglob_time * 1000:9.1f} ms")
+        print(f"scandir + prune  : {scandir_time * 1000:9.1f} ms")
+        print(f"speedup          : {rglob_time / scandir_time:9.1f}x")
+
+        list_first = time_to_first(lambda: discover_artifacts([root]))
+        stream_first = time_to_first(lambda: iter_artifacts([root]))
+
+        print(f"\nfirst artifact (discover_artifacts): {list_first * 1000:9.3f} ms")
+        print(f"first artifact (iter_artifacts)    : {stream_first * 1000:9.3f} ms")
+        if shutil.which("git"):
+            # Track only the governed files, as a monorepo would
+            subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+            subprocess.run(["git", "add", "docs"], cwd=root, check=True)
+
+            indexed = discover_artifacts([root], from_git_index=True)
+            if [a.path for a in indexed] != [a.path for a in current]:
+                print("❌ Git index discovery disagrees with the walker.")
+                sys.exit(1)
+
+            index_time = best_of(lambda: discover_artifacts([root], from_git_index=True), args.repeat)
+            print(f"\ngit index        : {index_time * 1000:9.1f} ms")
+
+        print(f"\n✅ {len(current)} artifacts discovered by both walkers.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,125 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import stamp.discovery as discovery
+from stamp.discovery import discover_artifacts
+
+
+# ----------------------------
+# Slow filesystem stand-in
+# ----------------------------
+
+class SlowEntry:
+    """
+    DirEntry proxy whose stat() pays a simulated network round trip.
+    """
+
+    def __init__(self, entry: os.DirEntry, latency: float):
+        self._entry = entry
+        self._latency = latency
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        time.sleep(self._latency)
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+
+class SlowScandir:
+    """
+    os.scandir stand-in where every directory listing and every stat
+    pays a fixed latency, approximating an NFS mount.
+    """
+
+    def __init__(self, latency: float):
+        self._latency = latency
+        self._real = os.scandir
+
+    def __call__(self, path):
+        time.sleep(self._latency)
+        with self._real(path) as it:
+            entries = [SlowEntry(e, self._latency) for e in it]
+        return _Listing(entries)
+
+
+class _Listing:
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __enter__(self):
+        return iter(self._entries)
+
+    def __exit__(self, *exc):
+        return False
+
+
+def build_tree(root: Path, subtrees: int, dirs_per_subtree: int, files_per_dir: int) -> None:
+    for t in range(subtrees):
+        for d in range(dirs_per_subtree):
+            directory = root / f"project-{t:02d}" / f"data-{d:03d}"
+            directory.mkdir(parents=True, exist_ok=True)
+            for f in range(files_per_dir):
+                (directory / f"artifact-{f:03d}.md").write_text("---\ntitle: \"x\"\n---\n", encoding="utf-8")
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parallel discovery on a slowed filesystem.")
+    parser.add_argument("--subtrees", type=int, default=16)
+    parser.add_argument("--dirs-per-subtree", type=int, default=10)
+    parser.add_argument("--files-per-dir", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stamp-bench-") as tmp:
+        root = Path(tmp)
+        build_tree(root, args.subtrees, args.dirs_per_subtree, args.files_per_dir)
+
+        expected = [a.path for a in discover_artifacts([root])]
+        print(
+            f"Synthetic tree: {args.subtrees} subtrees, {len(expected)} files, "
+            f"{args.latency_ms} ms per listing/stat\n"
+        )
+
+        real_scandir = os.scandir
+        discovery.os.scandir = SlowScandir(args.latency_ms / 1000.0)
+        try:
+            baseline = None
+            for workers in args.workers:
+                result = []
+                elapsed = timed(lambda: result.extend(discover_artifacts([root], workers=workers)))
+
+                if [a.path for a in result] != expected:
+                    print(f"❌ workers={workers} changed the discovery order.")
+                    sys.exit(1)
+
+                baseline = baseline or elapsed
+                print(f"workers={workers:<3d}: {elapsed * 1000:9.1f} ms  ({baseline / elapsed:5.1f}x)")
+        finally:
+            discovery.os.scandir = real_scandir
+
+    print("\n✅ Parallel discovery matches serial order for every worker count.")
+
+
+if __name__ == "__main__":
+    run()
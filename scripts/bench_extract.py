@@ -0,0 +1,130 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.extract import ExtractedMetadata, _yaml, extract_metadata
+
+
+# ----------------------------
+# Baseline (whole-file) extractor
+# ----------------------------
+
+def extract_metadata_full_read(path: Path) -> ExtractedMetadata:
+    """
+    The original extractor's read pattern, kept here as the baseline:
+    the whole file is decoded (twice for Markdown without frontmatter)
+    and split or stripped before metadata is looked for.
+    """
+    if path.suffix.lower() == ".md":
+        lines = path.read_text(encoding="utf-8").splitlines()
+        if lines and lines[0].strip() == "---":
+            for i in range(1, len(lines)):
+                if lines[i].strip() == "---":
+                    raw_block = "\n".join(lines[1:i])
+                    return ExtractedMetadata(path, _yaml.load(raw_block), raw_block, None)
+
+    stripped = path.read_text(encoding="utf-8").lstrip()
+    for quote in ('"""', "'''"):
+        if stripped.startswith(quote):
+            stripped = stripped[len(quote):stripped.find(quote, len(quote))].lstrip()
+            break
+
+    if stripped.startswith("<!--"):
+        raw_block = stripped[4:stripped.find("-->")].strip()
+        return ExtractedMetadata(path, _yaml.load(raw_block), raw_block, None)
+
+    return ExtractedMetadata(path, None, None, None)
+
+
+# ----------------------------
+# Synthetic corpus
+# ----------------------------
+
+def build_corpus(root: Path, data_files: int, data_mb: int, governed: int) -> List[Path]:
+    """
+    A few large ungoverned data files (CSV, JSON, Markdown logs) next to
+    many small governed documents.
+    """
+    paths: List[Path] = []
+
+    row = "2026-01-01,sensor-17,23.5,ok\n"
+    rows = row * (data_mb * 1024 * 1024 // len(row))
+    for i in range(data_files):
+        kind = i % 3
+        if kind == 0:
+            path = root / f"data-{i:03d}.csv"
+            path.write_text("date,sensor,value,status\n" + rows, encoding="utf-8")
+        elif kind == 1:
+            path = root / f"data-{i:03d}.json"
+            path.write_text('{"rows": "' + rows.replace("\n", " ") + '"}', encoding="utf-8")
+        else:
+            path = root / f"log-{i:03d}.md"
+            path.write_text("# Run log\n\n" + rows, encoding="utf-8")
+        paths.append(path)
+
+    for i in range(governed):
+        path = root / f"note-{i:05d}.md"
+        path.write_text(
+            "---\ntitle: \"Note\"\nstatus: \"Active\"\n---\n" + "Body text.\n" * 200,
+            encoding="utf-8",
+        )
+        paths.append(path)
+
+    return paths
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark metadata extraction.")
+    parser.add_argument("--data-files", type=int, default=30)
+    parser.add_argument("--data-mb", type=int, default=20)
+    parser.add_argument("--governed", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stamp-bench-") as tmp:
+        paths = build_corpus(Path(tmp), args.data_files, args.data_mb, args.governed)
+        print(
+            f"Synthetic corpus: {args.data_files} data files of ~{args.data_mb} MiB, "
+            f"{args.governed} governed notes\n"
+        )
+
+        for path in paths:
+            baseline = extract_metadata_full_read(path)
+            current = extract_metadata(path)
+            if (baseline.metadata, baseline.raw_block) != (current.metadata, current.raw_block):
+                print(f"❌ Extractors disagree on {path.name}.")
+                sys.exit(1)
+
+        data = paths[:args.data_files]
+        notes = paths[args.data_files:]
+
+        for label, subset in (("data files", data), ("governed notes", notes)):
+            full_time = best_of(lambda: [extract_metadata_full_read(p) for p in subset], args.repeat)
+            head_time = best_of(lambda: [extract_metadata(p) for p in subset], args.repeat)
+
+            print(f"{label}")
+            print(f"  whole-file read : {full_time * 1000:9.1f} ms")
+            print(f"  bounded head    : {head_time * 1000:9.1f} ms")
+            print(f"  speedup         : {full_time / head_time:9.1f}x\n")
+
+        print(f"✅ {len(paths)} artifacts extracted identically by both readers.")
+
+
+if __name__ == "__main__":
+    run()
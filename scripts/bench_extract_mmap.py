@@ -0,0 +1,117 @@
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp import extract
+from stamp.extract import extract_metadata
+
+
+# ----------------------------
+# Buffered (chunked read) backend
+# ----------------------------
+
+def _no_mmap(*args, **kwargs):
+    raise OSError("mmap disabled for benchmarking")
+
+
+class BufferedBackend:
+    """
+    Make mapping fail so extraction falls back to the chunked reader,
+    which was the only backend before the mmap scanner.
+    """
+
+    def __enter__(self):
+        self._real = extract.mmap
+        extract.mmap = SimpleNamespace(mmap=_no_mmap, ACCESS_READ=self._real.ACCESS_READ)
+        return self
+
+    def __exit__(self, *exc):
+        extract.mmap = self._real
+
+
+# ----------------------------
+# Synthetic artifacts
+# ----------------------------
+
+def build_artifacts(root: Path, body_mb: int) -> Dict[str, Path]:
+    """
+    Large text artifacts whose metadata question is not settled by the
+    first block.
+    """
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * (
+        body_mb * 1024 * 1024 // 57
+    )
+    table = "| a | b |\n|---|---|\n| 1 | 2 |\n" * (body_mb * 1024 * 1024 // 30)
+
+    artifacts = {
+        "large frontmatter": root / "large-frontmatter.md",
+        "unterminated docstring": root / "unterminated.py",
+        "thematic break + tables": root / "tables.md",
+        "late HTML comment end": root / "late-comment.html",
+    }
+
+    entries = "".join(f"key_{i:06d}: \"value {i}\"\n" for i in range(2000))
+    artifacts["large frontmatter"].write_text("---\n" + entries + "---\n" + body, encoding="utf-8")
+    artifacts["unterminated docstring"].write_text('"""\n' + body, encoding="utf-8")
+    artifacts["thematic break + tables"].write_text("---\n" + table, encoding="utf-8")
+    artifacts["late HTML comment end"].write_text(
+        "<!--\ntitle: \"x\"\n" + "# padding\n" * 50000 + "-->\n" + body,
+        encoding="utf-8",
+    )
+    return artifacts
+
+
+def measure(path: Path, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_metadata(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = extract_metadata(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the mmap extraction backend.")
+    parser.add_argument("--body-mb", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stamp-bench-") as tmp:
+        artifacts = build_artifacts(Path(tmp), args.body_mb)
+        print(f"Synthetic artifacts with ~{args.body_mb} MiB bodies\n")
+
+        for label, path in artifacts.items():
+            with BufferedBackend():
+                buffered, buffered_time, buffered_peak = measure(path, args.repeat)
+            mapped, mapped_time, mapped_peak = measure(path, args.repeat)
+
+            if (buffered.metadata, buffered.raw_block, buffered.error) != (
+                mapped.metadata, mapped.raw_block, mapped.error,
+            ):
+                print(f"❌ Backends disagree on {label}.")
+                sys.exit(1)
+
+            print(label)
+            print(f"  buffered : {buffered_time * 1000:8.2f} ms  peak {buffered_peak / 1024:9.1f} KiB")
+            print(f"  mmap     : {mapped_time * 1000:8.2f} ms  peak {mapped_peak / 1024:9.1f} KiB\n")
+
+        print(f"✅ {len(artifacts)} artifacts extracted identically by both backends.")
+
+
+if __name__ == "__main__":
+    run()
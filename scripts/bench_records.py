@@ -0,0 +1,135 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.records import (
+    normalization_proposals,
+    remediation_summary,
+    validate_record,
+    validate_records,
+)
+from stamp.schema import load_schema
+
+
+SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.org/bench-records.schema.json",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["title", "filetype", "version", "status", "created", "license"],
+    "properties": {
+        "title": {"type": "string"},
+        "filetype": {"enum": ["documentation", "operational", "data"]},
+        "version": {"type": "string", "pattern": "^[0-9]+\\.[0-9]+\\.[0-9]+$"},
+        "status": {"enum": ["Draft", "Active", "Deprecated"]},
+        "created": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "license": {"type": "string"},
+        "anchors": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def build_records(count: int) -> List[Dict[str, Any]]:
+    """
+    `count` metadata records: mostly valid, every fourth with a few
+    violations.
+    """
+    records: List[Dict[str, Any]] = []
+    for i in range(count):
+        record: Dict[str, Any] = {
+            "title": f"Ingested Record {i}",
+            "filetype": "data",
+            "version": f"1.{i % 10}.0",
+            "status": "Active",
+            "created": "2026-01-27",
+            "license": "CC-BY-4.0",
+            "anchors": [f"REC-{i}"],
+        }
+        if i % 4 == 0:
+            record["status"] = "Unknown"
+            record["extra"] = True
+        records.append(record)
+    return records
+
+
+def to_yaml(record: Dict[str, Any]) -> str:
+    lines = []
+    for key, value in record.items():
+        if isinstance(value, list):
+            lines.append(f"{key}: [{', '.join(value)}]")
+        else:
+            lines.append(f"{key}: {json.dumps(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def records_per_second(validate, records: List[Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate(records)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark in-memory record validation.")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engine", default="codegen")
+    args = parser.parse_args()
+
+    resolved_schema = load_schema(SCHEMA)
+    dicts = build_records(args.records)
+    inputs = {
+        "yaml": [to_yaml(record) for record in dicts],
+        "json": [json.dumps(record) for record in dicts],
+    }
+
+    # Parsed text must validate exactly like the dicts it came from
+    expected = [r.diagnostics for r in validate_records(dicts, resolved_schema, engine=args.engine)]
+    for format, texts in inputs.items():
+        actual = [r.diagnostics for r in validate_records(texts, resolved_schema, format=format, engine=args.engine)]
+        if actual != expected:
+            print(f"❌ {format} records validate differently from the same dicts")
+            sys.exit(1)
+
+    rates = {
+        "dict validate_record()": lambda records: [
+            validate_record(record, resolved_schema, engine=args.engine) for record in records
+        ],
+        "dict validate_records()": lambda records: list(
+            validate_records(records, resolved_schema, engine=args.engine)
+        ),
+        "dict validate_records(columnar)": lambda records: list(
+            validate_records(records, resolved_schema, engine=args.engine, columnar=True)
+        ),
+        "dict + remediation + NPO": lambda records: [
+            (
+                remediation_summary(result),
+                normalization_proposals(result, resolved_schema, stamp_version="0.1.0", record=record),
+            )
+            for record, result in zip(records, validate_records(records, resolved_schema, engine=args.engine))
+        ],
+    }
+
+    print(f"{args.records} records, every fourth with violations ({args.engine} engine):")
+    for name, validate in rates.items():
+        print(f"  {name:34s}: {records_per_second(validate, dicts, args.repeat):10.0f} records/s")
+    for format, texts in inputs.items():
+        rate = records_per_second(
+            lambda records: list(validate_records(records, resolved_schema, format=format, engine=args.engine)),
+            texts,
+            args.repeat,
+        )
+        print(f"  {format + ' text validate_records()':34s}: {rate:10.0f} records/s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,151 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from jsonschema import Draft202012Validator
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.extract import ExtractedMetadata
+from stamp.schema import load_schema
+from stamp.validate import compiled_validator, validate_artifact
+
+
+# Research-artifact metadata schema with shared definitions, so that
+# validators have references to resolve
+SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.org/bench-metadata.schema.json",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["title", "version", "status", "created", "author", "license"],
+    "properties": {
+        "title": {"type": "string", "minLength": 1},
+        "filetype": {"enum": ["documentation", "operational", "data"]},
+        "version": {"$ref": "#/$defs/semver"},
+        "doi": {"type": "string", "pattern": "^10\\.[0-9]{4,9}/"},
+        "status": {"enum": ["Draft", "Active", "Deprecated"]},
+        "created": {"$ref": "#/$defs/date"},
+        "updated": {"$ref": "#/$defs/date"},
+        "author": {"$ref": "#/$defs/person"},
+        "maintainer": {"$ref": "#/$defs/person"},
+        "license": {"type": "string"},
+        "dependencies": {"type": "array", "items": {"type": "string"}},
+        "anchors": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+    },
+    "$defs": {
+        "semver": {"type": "string", "pattern": "^[0-9]+\\.[0-9]+\\.[0-9]+$"},
+        "date": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "person": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "orcid": {"type": "string", "format": "uri"},
+                "url": {"type": "string", "format": "uri"},
+            },
+        },
+    },
+}
+
+
+def build_corpus(count: int) -> List[ExtractedMetadata]:
+    """
+    Metadata for `count` artifacts: mostly valid, every fourth with a
+    few violations.
+    """
+    corpus: List[ExtractedMetadata] = []
+    for i in range(count):
+        metadata: Dict[str, Any] = {
+            "title": f"Calibration Run {i}",
+            "filetype": "documentation",
+            "version": f"1.{i % 10}.0",
+            "doi": "10.5281/zenodo.18436622",
+            "status": "Active",
+            "created": "2026-01-27",
+            "updated": "2026-02-14",
+            "author": {"name": "A. Researcher", "orcid": "https://orcid.org/0000"},
+            "license": "Apache-2.0",
+            "dependencies": ["calibration-protocol-v3"],
+            "anchors": [f"RUN-{i}"],
+        }
+        if i % 4 == 0:
+            metadata["version"] = "v1"
+            metadata["status"] = "Unknown"
+            del metadata["license"]
+            metadata["extra"] = True
+        corpus.append(ExtractedMetadata(Path(f"run-{i:05d}.md"), metadata, None, None))
+    return corpus
+
+
+def per_artifact_seconds(validate, corpus: List[ExtractedMetadata], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for extracted in corpus:
+            validate(extracted)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-artifact validation overhead.")
+    parser.add_argument("--artifacts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    resolved_schema = load_schema(SCHEMA)
+    corpus = build_corpus(args.artifacts)
+
+    def rebuilt(extracted: ExtractedMetadata) -> List[Any]:
+        # The original pattern: a new validator for every artifact
+        return list(Draft202012Validator(resolved_schema.schema).iter_errors(extracted.metadata))
+
+    def checked(extracted: ExtractedMetadata) -> List[Any]:
+        # Checking the schema for every artifact instead of once
+        Draft202012Validator.check_schema(resolved_schema.schema)
+        return rebuilt(extracted)
+
+    def compiled(extracted: ExtractedMetadata) -> List[Any]:
+        return list(compiled_validator(resolved_schema).iter_errors(extracted.metadata))
+
+    def full(extracted: ExtractedMetadata) -> List[Dict[str, Any]]:
+        return validate_artifact(extracted=extracted, resolved_schema=resolved_schema).diagnostics
+
+    for extracted in corpus:
+        expected = sorted(str(e) for e in rebuilt(extracted))
+        if sorted(str(e) for e in compiled(extracted)) != expected:
+            print(f"❌ Compiled validator disagrees on {extracted.artifact_path}")
+            sys.exit(1)
+
+    serial = [full(extracted) for extracted in corpus]
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        threaded = list(pool.map(full, corpus))
+    if threaded != serial:
+        print(f"❌ Diagnostics differ when validating on {args.workers} threads")
+        sys.exit(1)
+
+    print(f"{args.artifacts} artifacts, {sum(1 for d in serial if d)} with violations")
+    print(f"{args.workers} threads sharing one validator produced the serial diagnostics\n")
+
+    before = per_artifact_seconds(rebuilt, corpus, args.repeat)
+    checked_each = per_artifact_seconds(checked, corpus, args.repeat)
+    after = per_artifact_seconds(compiled, corpus, args.repeat)
+    end_to_end = per_artifact_seconds(full, corpus, args.repeat)
+
+    print(f"validator per artifact : {before * 1e6:8.1f} µs/artifact")
+    print(f"+ check_schema()       : {checked_each * 1e6:8.1f} µs/artifact")
+    print(f"compiled validator     : {after * 1e6:8.1f} µs/artifact")
+    print(f"validate_artifact()    : {end_to_end * 1e6:8.1f} µs/artifact (including CDO translation)")
+    print(f"\nspeedup                : {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
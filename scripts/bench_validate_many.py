@@ -0,0 +1,128 @@
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.extract import ExtractedMetadata
+from stamp.schema import load_schema
+from stamp.validate import ValidationResult, validate_artifact, validate_many
+
+
+# A governance schema both engines can run (see bench_codegen.py)
+SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.org/bench-many.schema.json",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["title", "filetype", "version", "status", "created", "author", "license"],
+    "properties": {
+        "title": {"type": "string"},
+        "filetype": {"enum": ["documentation", "operational", "data"]},
+        "version": {"type": "string", "pattern": "^[0-9]+\\.[0-9]+\\.[0-9]+$"},
+        "status": {"enum": ["Draft", "Active", "Deprecated"]},
+        "created": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "author": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string"}, "email": {"type": "string"}},
+        },
+        "license": {"type": "string"},
+        "anchors": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def build_corpus(count: int) -> List[ExtractedMetadata]:
+    """
+    Metadata for `count` artifacts: mostly valid, every fourth with a
+    few violations.
+    """
+    corpus: List[ExtractedMetadata] = []
+    for i in range(count):
+        metadata: Dict[str, Any] = {
+            "title": f"Calibration Run {i}",
+            "filetype": "documentation",
+            "version": f"1.{i % 10}.0",
+            "status": "Active",
+            "created": "2026-01-27",
+            "author": {"name": "A. Researcher", "email": "a@example.org"},
+            "license": "Apache-2.0",
+            "anchors": [f"RUN-{i}"],
+        }
+        if i % 4 == 0:
+            metadata["version"] = "v1"
+            metadata["status"] = "Unknown"
+            metadata["extra"] = True
+        corpus.append(ExtractedMetadata(Path(f"run-{i:06d}.md"), metadata, None, None))
+    return corpus
+
+
+def artifacts_per_second(validate, corpus: List[ExtractedMetadata], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate(corpus)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch validation with validate_many().")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    resolved_schema = load_schema(SCHEMA)
+
+    # validate_many() must pull artifacts only as results are taken
+    pulled = []
+
+    def stream() -> Iterator[ExtractedMetadata]:
+        for extracted in build_corpus(10):
+            pulled.append(extracted)
+            yield extracted
+
+    first = list(itertools.islice(validate_many(stream(), resolved_schema), 2))
+    if len(first) != 2 or len(pulled) != 2:
+        print(f"❌ validate_many() read {len(pulled)} artifacts to produce 2 results")
+        sys.exit(1)
+
+    for size in args.sizes:
+        corpus = build_corpus(size)
+        print(f"{size} artifacts, every fourth with violations:")
+
+        for engine in ("jsonschema", "codegen"):
+            def one_by_one(corpus: List[ExtractedMetadata]) -> List[ValidationResult]:
+                return [
+                    validate_artifact(extracted=extracted, resolved_schema=resolved_schema, engine=engine)
+                    for extracted in corpus
+                ]
+
+            def batched(corpus: List[ExtractedMetadata]) -> List[ValidationResult]:
+                return list(validate_many(corpus, resolved_schema, engine=engine))
+
+            def columnar(corpus: List[ExtractedMetadata]) -> List[ValidationResult]:
+                return list(validate_many(corpus, resolved_schema, engine=engine, columnar=True))
+
+            expected = one_by_one(corpus)
+            if batched(corpus) != expected or columnar(corpus) != expected:
+                print(f"❌ validate_many() and validate_artifact() differ on the {engine} engine")
+                sys.exit(1)
+
+            single = artifacts_per_second(one_by_one, corpus, args.repeat)
+            many = artifacts_per_second(batched, corpus, args.repeat)
+            columns = artifacts_per_second(columnar, corpus, args.repeat)
+            print(f"  {engine + ' validate_artifact()':36s}: {single:10.0f} artifacts/s")
+            print(f"  {engine + ' validate_many()':36s}: {many:10.0f} artifacts/s ({many / single:.2f}x)")
+            print(f"  {engine + ' validate_many(columnar)':36s}: {columns:10.0f} artifacts/s ({columns / single:.2f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    run()
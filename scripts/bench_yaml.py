@@ -0,0 +1,114 @@
+import argparse
+import functools
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.discovery import iter_artifacts
+from stamp.extract import (
+    DEFAULT_RESOURCE_LIMITS,
+    YAML_BACKEND,
+    YAML_BACKENDS,
+    _load_flat,
+    _NotFlat,
+    extract_metadata,
+    load_yaml_block,
+)
+
+
+# Representative research-artifact frontmatter
+SYNTHETIC_BLOCK = """\
+title: "Calibration Run 42 — Summary"
+filetype: "documentation"
+type: "report"
+domain: "instrumentation"
+version: "1.4.2"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: 2026-01-27
+updated: 2026-10-17
+author:
+  name: "A. Researcher"
+  email: "a.researcher@example.org"
+  orcid: "https://orcid.org/0000-0000-0000-0000"
+license: "Apache-2.0"
+ai_assisted: "partial"
+dependencies:
+  - "calibration-protocol-v3"
+  - "sensor-array-spec"
+anchors:
+  - RUN-42-SUMMARY-v1.4.2
+tags: [calibration, sensors, quarterly]
+metrics:
+  samples: 12000
+  drift_ppm: 0.35
+  passed: true
+"""
+
+
+def collect_blocks() -> List[str]:
+    blocks = [SYNTHETIC_BLOCK]
+    for artifact in iter_artifacts([ROOT]):
+        extracted = extract_metadata(artifact.path)
+        if extracted.raw_block is not None:
+            blocks.append(extracted.raw_block)
+    return blocks
+
+
+def blocks_per_second(load, blocks: List[str], rounds: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for block in blocks:
+                load(block)
+        best = min(best, time.perf_counter() - start)
+    return rounds * len(blocks) / best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark YAML parser backends and the flat fast path.")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    blocks = collect_blocks()
+    print(f"{len(blocks)} metadata blocks (repository artifacts + synthetic frontmatter)")
+    print(f"default backend: {YAML_BACKEND}\n")
+
+    # Extraction holds every block to resource limits while it is
+    # composed: that guarded load is the rate compared below
+    rates = {}
+    for name, load in YAML_BACKENDS.items():
+        unguarded = blocks_per_second(load, blocks, args.rounds, args.repeat)
+        guarded = functools.partial(load, limits=DEFAULT_RESOURCE_LIMITS)
+        rates[name] = blocks_per_second(guarded, blocks, args.rounds, args.repeat)
+        print(
+            f"{name:8s}: {rates[name]:10.0f} blocks/s  "
+            f"({unguarded:.0f} blocks/s without limits, {unguarded / rates[name] - 1:+.0%} for the limits)"
+        )
+
+    flat = sum(1 for block in blocks if _is_flat(block))
+    rates["flat"] = blocks_per_second(load_yaml_block, blocks, args.rounds, args.repeat)
+    print(f"{'flat':8s}: {rates['flat']:10.0f} blocks/s  ({flat}/{len(blocks)} blocks on the fast path)")
+
+    if "libyaml" in rates:
+        print(f"\nspeedup  : {rates['libyaml'] / rates['ruamel']:10.1f}x libyaml over ruamel")
+    print(f"speedup  : {rates['flat'] / rates[YAML_BACKEND]:10.1f}x flat fast path over {YAML_BACKEND}")
+
+
+def _is_flat(block: str) -> bool:
+    try:
+        _load_flat(block)
+    except _NotFlat:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    run()
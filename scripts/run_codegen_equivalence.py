@@ -0,0 +1,206 @@
+import argparse
+import datetime
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.cdo import translate_validation_errors_to_cdos
+from stamp.codegen import compile_schema
+
+
+FIXTURE_PATHS = [
+    ROOT / "fixtures" / "fixtures-v1.json",
+]
+
+KEYS = ["title", "status", "version", "author", "name", "tags", "count", "ai_assisted", "x", "1"]
+STRINGS = ["", "Active", "Draft", "partial", "1.0.0", "v1", "a b", "2026-01-31", "ø", "1"]
+PATTERNS = ["^[0-9]+\\.[0-9]+\\.[0-9]+$", "^v", "a", "^$", "[A-Z]", "^\\d{4}-\\d{2}-\\d{2}$"]
+UNSUPPORTED = [("minLength", 1), ("$ref", "#"), ("allOf", [{}]), ("patternProperties", {"^x": {}})]
+TYPES = ["string", "integer", "number", "boolean", "null", "object", "array"]
+
+
+# ----------------------------
+# Corpus
+# ----------------------------
+
+def fixture_cases() -> Iterator[Tuple[Any, Any]]:
+    for path in FIXTURE_PATHS:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for case in data["cases"]:
+            yield case["schema"], case["instance"]
+
+
+def random_value(rng: random.Random, depth: int = 0) -> Any:
+    """
+    Metadata-shaped values, including the non-JSON types YAML loaders
+    produce (dates, datetimes) and non-string keys.
+    """
+    roll = rng.random()
+    if depth < 3 and roll < 0.2:
+        return {
+            rng.choice(KEYS + [1, True]) if rng.random() < 0.05 else rng.choice(KEYS): random_value(rng, depth + 1)
+            for _ in range(rng.randint(0, 5))
+        }
+    if depth < 3 and roll < 0.3:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return rng.choice(
+        [
+            rng.choice(STRINGS), rng.choice(STRINGS), rng.randint(-2, 3), 1.0, 1.5, 0.0,
+            True, False, None, datetime.date(2026, 1, 31),
+            datetime.datetime(2026, 1, 31, 10, 0, tzinfo=datetime.timezone.utc),
+        ]
+    )
+
+
+def random_schema(rng: random.Random, depth: int = 0) -> Any:
+    """
+    Schemas built from the supported keywords, plus annotations and the
+    occasional unsupported keyword (which must fall back).
+    """
+    if depth > 0 and rng.random() < 0.1:
+        return rng.choice([True, False])
+
+    schema: Dict[str, Any] = {}
+    keywords = [
+        "type", "required", "enum", "const", "pattern", "properties",
+        "additionalProperties", "items", "if", "format", "title",
+    ]
+    rng.shuffle(keywords)
+    for keyword in keywords[: rng.randint(0, 5)]:
+        if keyword == "type":
+            schema["type"] = rng.choice(TYPES) if rng.random() < 0.7 else rng.sample(TYPES, rng.randint(1, 3))
+        elif keyword == "required":
+            schema["required"] = rng.sample(KEYS, rng.randint(0, 3))
+        elif keyword == "enum":
+            pool = STRINGS if rng.random() < 0.7 else STRINGS + [1, 1.0, True, None, [1], {"a": 1}]
+            schema["enum"] = rng.sample(pool, rng.randint(1, 4))
+        elif keyword == "const":
+            schema["const"] = rng.choice(STRINGS + [1, 0, False, None, [1]])
+        elif keyword == "pattern":
+            schema["pattern"] = rng.choice(PATTERNS)
+        elif keyword == "properties" and depth < 3:
+            schema["properties"] = {
+                key: random_schema(rng, depth + 1) for key in rng.sample(KEYS, rng.randint(1, 4))
+            }
+        elif keyword == "additionalProperties" and depth < 3:
+            schema["additionalProperties"] = rng.choice([False, False, True]) if rng.random() < 0.7 else random_schema(rng, depth + 1)
+        elif keyword == "items" and depth < 3:
+            schema["items"] = random_schema(rng, depth + 1)
+        elif keyword == "if" and depth < 3:
+            schema["if"] = random_schema(rng, depth + 1)
+            if rng.random() < 0.8:
+                schema["then"] = random_schema(rng, depth + 1)
+            if rng.random() < 0.5:
+                schema["else"] = random_schema(rng, depth + 1)
+        elif keyword == "format":
+            schema["format"] = rng.choice(["date", "uri", "email"])
+        elif keyword == "title":
+            schema["title"] = "annotation"
+
+    if rng.random() < 0.03:
+        keyword, value = rng.choice(UNSUPPORTED)
+        schema[keyword] = value
+    return schema
+
+
+def random_cases(count: int, seed: int) -> Iterator[Tuple[Any, Any]]:
+    rng = random.Random(seed)
+    produced = 0
+    while produced < count:
+        schema = random_schema(rng)
+        try:
+            Draft202012Validator.check_schema(schema)
+        except SchemaError:
+            continue
+        for _ in range(5):
+            yield schema, random_value(rng)
+        produced += 1
+
+
+# ----------------------------
+# Comparison
+# ----------------------------
+
+def error_fields(errors: List[Any]) -> List[Tuple[Any, ...]]:
+    return [
+        (
+            e.validator,
+            list(e.path),
+            list(e.schema_path),
+            e.message,
+            repr(e.validator_value),
+            repr(e.instance),
+            repr(e.schema),
+        )
+        for e in errors
+    ]
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Differential check of generated validators against jsonschema.")
+    parser.add_argument("--random", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    suites = [
+        ("fixtures", list(fixture_cases())),
+        ("random", list(random_cases(args.random, args.seed))),
+    ]
+
+    failures = 0
+    for suite, cases in suites:
+        compiled_cases = 0
+        fallbacks = 0
+        mismatched = 0
+        compiled: Dict[str, Any] = {}
+        for schema, instance in cases:
+            # Keyword order decides error order: keep it in the key
+            key = json.dumps(schema)
+            if key not in compiled:
+                compiled[key] = compile_schema(schema)
+                if compiled[key] is None:
+                    fallbacks += 1
+            generated = compiled[key]
+            if generated is None:
+                continue
+            compiled_cases += 1
+
+            expected = list(Draft202012Validator(schema).iter_errors(instance))
+            actual = list(generated.iter_errors(instance))
+            same = (
+                error_fields(actual) == error_fields(expected)
+                and generated.is_valid(instance) == (not expected)
+                and translate_validation_errors_to_cdos(errors=actual, schema=schema, instance=instance)
+                == translate_validation_errors_to_cdos(errors=expected, schema=schema, instance=instance)
+            )
+            if not same:
+                mismatched += 1
+                if mismatched <= 5:
+                    print(f"❌ [{suite}] generated code differs for {instance!r}")
+                    print(f"   schema    : {json.dumps(schema)}")
+                    print(f"   jsonschema: {error_fields(expected)}")
+                    print(f"   codegen   : {error_fields(actual)}")
+        failures += mismatched
+        print(
+            f"{suite:10s} {compiled_cases - mismatched}/{compiled_cases} cases identical "
+            f"({fallbacks} of {len(compiled)} schemas left to jsonschema)"
+        )
+
+    if failures:
+        print(f"\n❌ {failures} cases validated differently.")
+        sys.exit(1)
+
+    print("\n✅ Generated validators agree with jsonschema.")
+
+
+if __name__ == "__main__":
+    run()
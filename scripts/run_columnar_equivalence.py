@@ -0,0 +1,150 @@
+import argparse
+import datetime
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.columnar import compile_columnar
+from stamp.extract import ExtractedMetadata
+from stamp.schema import load_schema
+from stamp.validate import VALIDATION_ENGINES, validate_artifact, validate_many
+
+
+KEYS = ["title", "status", "version", "author", "tags", "count", "created", "x"]
+
+# Property subschemas, including references into the root's $defs and
+# keywords the columnar root does not accept itself
+SUBSCHEMAS: List[Any] = [
+    {"type": "string"},
+    {"type": "integer"},
+    {"type": ["string", "null"]},
+    {"enum": ["Active", "Draft", 1, True, None, [1], {"a": 1}]},
+    {"const": 1},
+    {"const": [1]},
+    {"pattern": "^v"},
+    {"type": "string", "minLength": 2},
+    {"type": "array", "items": {"type": "string"}},
+    {"type": "array", "uniqueItems": True},
+    {"type": "object", "required": ["name"], "additionalProperties": False, "properties": {"name": {}}},
+    {"$ref": "#/$defs/date"},
+    {"$ref": "#/$defs/person"},
+    {"not": {"const": "x"}},
+    True,
+    False,
+]
+
+DEFS = {
+    "date": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+    "person": {"type": "object", "required": ["name"]},
+}
+
+VALUES: List[Any] = [
+    "", "Active", "Draft", "v1", "2026-01-31", "x", "ab", 1, 0, 1.0, 2.5, True, False, None,
+    [1], [True], [1.0], ["a", "a"], ["a", "b"], [], {"a": 1}, {"a": True}, {"name": "A"}, {"name": 1},
+    {}, (1,), datetime.date(2026, 1, 31), float("nan"),
+]
+
+# Columns of scalars take the (type, value) fast path
+SCALARS: List[Any] = [value for value in VALUES if not isinstance(value, (list, tuple, dict))]
+
+
+def random_schema(rng: random.Random) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"$defs": DEFS}
+    roll = rng.random()
+    if roll < 0.6:
+        schema["type"] = "object"
+    elif roll < 0.7:
+        schema["type"] = ["object", "null"]
+    elif roll < 0.75:
+        schema["type"] = "array"
+    schema["properties"] = {key: rng.choice(SUBSCHEMAS) for key in rng.sample(KEYS, rng.randint(0, 6))}
+    if rng.random() < 0.7:
+        schema["required"] = rng.sample(KEYS, rng.randint(0, 3))
+    roll = rng.random()
+    if roll < 0.5:
+        schema["additionalProperties"] = False
+    elif roll < 0.6:
+        schema["additionalProperties"] = True
+    elif roll < 0.65:
+        schema["additionalProperties"] = {"type": "string"}
+    if rng.random() < 0.05:
+        schema["minProperties"] = 1
+    return schema
+
+
+def random_artifact(rng: random.Random, i: int, values: List[Any]) -> ExtractedMetadata:
+    path = Path(f"artifact-{i}.md")
+    roll = rng.random()
+    if roll < 0.05:
+        return ExtractedMetadata(path, rng.choice([None, "text", [1], 1]), None, None)
+    if roll < 0.07:
+        return ExtractedMetadata(
+            path, None, None, "Resource limit exceeded",
+            limit_exceeded={"limit": "max_depth", "maximum": 1},
+        )
+    metadata = {key: rng.choice(values) for key in rng.sample(KEYS, rng.randint(0, 6))}
+    if rng.random() < 0.02:
+        metadata[1] = "non-string key"
+    return ExtractedMetadata(path, metadata, None, None)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Differential check of columnar batch validation.")
+    parser.add_argument("--schemas", type=int, default=400)
+    parser.add_argument("--batch", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    compared = 0
+    columnar = 0
+    mismatched = 0
+    for _ in range(args.schemas):
+        schema = random_schema(rng)
+        try:
+            Draft202012Validator.check_schema(schema)
+        except SchemaError:
+            continue
+        resolved_schema = load_schema(schema)
+        if compile_columnar(schema) is not None:
+            columnar += 1
+
+        values = rng.choice([VALUES, SCALARS])
+        batch = [random_artifact(rng, i, values) for i in range(args.batch)]
+        for engine in VALIDATION_ENGINES:
+            expected = [
+                validate_artifact(extracted=extracted, resolved_schema=resolved_schema, engine=engine)
+                for extracted in batch
+            ]
+            actual = list(validate_many(batch, resolved_schema, engine=engine, columnar=True))
+            compared += len(batch)
+            for want, got in zip(expected, actual):
+                if got != want:
+                    mismatched += 1
+                    if mismatched <= 5:
+                        print(f"❌ [{engine}] columnar result differs for {got.artifact_path}")
+                        print(f"   schema  : {schema}")
+                        print(f"   expected: {want.diagnostics}")
+                        print(f"   columnar: {got.diagnostics}")
+
+    print(
+        f"{compared - mismatched}/{compared} results identical "
+        f"({columnar} of {args.schemas} schemas split into columns)"
+    )
+    if mismatched:
+        print(f"\n❌ {mismatched} results differ.")
+        sys.exit(1)
+
+    print("\n✅ Columnar validation agrees with per-instance validation.")
+
+
+if __name__ == "__main__":
+    run()
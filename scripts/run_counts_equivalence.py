@@ -0,0 +1,133 @@
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from run_codegen_equivalence import fixture_cases, random_cases
+
+from stamp.cache import ValidationCache
+from stamp.cli.validate import _is_passed
+from stamp.codegen import compile_schema
+from stamp.extract import ExtractedMetadata
+from stamp.schema import load_schema
+from stamp.validate import VALIDATION_ENGINES, ValidationResult, validate_artifact, validate_many
+
+
+MAX_DIAGNOSTICS: List[Optional[int]] = [None, 1, 2]
+
+
+def counts(result: ValidationResult) -> Tuple[int, bool, bool]:
+    """
+    Everything a summary or repo run reports for an artifact.
+    """
+    return result.diagnostic_count, result.truncated, _is_passed(result)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Differential check of counts-only validation.")
+    parser.add_argument("--random", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Random schemas the generated engine leaves to jsonschema may
+    # recurse without bound (`$ref: "#"`): only the rest are used
+    cases: List[Tuple[Any, Any]] = list(fixture_cases()) + [
+        (schema, instance)
+        for schema, instance in random_cases(args.random, args.seed)
+        if compile_schema(schema) is not None
+    ]
+
+    # Cases sharing a schema are validated as one batch
+    batches: List[Tuple[Any, List[ExtractedMetadata]]] = []
+    for schema, instance in cases:
+        if not batches or batches[-1][0] is not schema:
+            batches.append((schema, []))
+        artifacts = batches[-1][1]
+        # The block text keys the cache; any text unique to the
+        # instance will do (instances hold datetimes, so not JSON)
+        artifacts.append(
+            ExtractedMetadata(Path(f"artifact-{len(artifacts)}.md"), instance, repr(instance), None)
+        )
+
+    compared = 0
+    mismatched = 0
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ValidationCache(Path(directory), tool_version="counts-equivalence")
+        for batch, (schema, artifacts) in enumerate(batches):
+            resolved_schema = load_schema(schema)
+            for engine in VALIDATION_ENGINES:
+                for max_diagnostics in MAX_DIAGNOSTICS:
+                    full = [
+                        validate_artifact(
+                            extracted=extracted,
+                            resolved_schema=resolved_schema,
+                            engine=engine,
+                            max_diagnostics=max_diagnostics,
+                        )
+                        for extracted in artifacts
+                    ]
+                    candidates = {
+                        "validate_artifact": [
+                            validate_artifact(
+                                extracted=extracted,
+                                resolved_schema=resolved_schema,
+                                engine=engine,
+                                max_diagnostics=max_diagnostics,
+                                counts_only=True,
+                            )
+                            for extracted in artifacts
+                        ],
+                        "validate_many(columnar)": list(
+                            validate_many(
+                                artifacts,
+                                resolved_schema,
+                                engine=engine,
+                                max_diagnostics=max_diagnostics,
+                                columnar=True,
+                                counts_only=True,
+                            )
+                        ),
+                    }
+                    # Counts are cached apart from the diagnostics stored
+                    # first; the second pass reads them back
+                    for attempt in ("full", "cache", "cache hit"):
+                        cached = [
+                            cache.validate(
+                                extracted=extracted,
+                                resolved_schema=resolved_schema,
+                                engine=engine,
+                                max_diagnostics=max_diagnostics,
+                                counts_only=attempt != "full",
+                            )
+                            for extracted in artifacts
+                        ]
+                        if attempt != "full":
+                            candidates[attempt] = cached
+
+                    for path, candidate in candidates.items():
+                        for want, got in zip(full, candidate):
+                            compared += 1
+                            if counts(got) != counts(want) or got.diagnostics:
+                                mismatched += 1
+                                if mismatched <= 5:
+                                    print(f"❌ [{engine}, {path}, max_diagnostics={max_diagnostics}] counts differ")
+                                    print(f"   schema     : {schema}")
+                                    print(f"   instance   : {want.artifact_path}")
+                                    print(f"   full       : {counts(want)}")
+                                    print(f"   counts-only: {counts(got)}")
+
+    print(f"{compared - mismatched}/{compared} counts identical ({len(batches)} schemas)")
+    if mismatched:
+        print(f"\n❌ {mismatched} counts differ.")
+        sys.exit(1)
+
+    print("\n✅ Counts-only validation reports the same counts as full validation.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,146 @@
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.discovery import iter_artifacts
+from stamp.extract import YAML_BACKENDS, _load_flat, _NotFlat, extract_metadata
+
+
+# ----------------------------
+# Corpus
+# ----------------------------
+
+KEYS = [
+    "title", "status", "version", "created", "author", "name", "x-y", "_", "a_1",
+    "true", "True", "null", "Null", "y", "no", "on", "key", "Key",
+    # Either side of YAML's 1024-character implicit key limit
+    "k" * 1024, "k" * 1025,
+]
+
+SCALARS = [
+    '"Stamp — Module"', '"10.5281/zenodo.18436622"', '"Apache-2.0"', '""', '"  padded  "',
+    "'single'", "''", '"a # not a comment"',
+    "plain text", "plain #hash", "https://orcid.org/0000", "a:b", "0.1.0", "v1.2",
+    "2026-01-27", "2026-1-3", "2026-01-27T10:00:00Z", "2026-13-45", "12", "-12", "+3",
+    "0x1F", "0o17", "0b101", "012", "1_000", "_", "1.5", "1e3", ".5", "1.", ".inf",
+    "-.Inf", ".NaN", "1:20", "true", "False", "TRUE", "yes", "no", "null", "NULL", "~",
+    "-x", "?x", ":x", "[]", "{}", "#", "value # trailing", "value  #  two",
+    "ø unicode", "emoji 🙂", "a,b", "--", "...",
+]
+
+# Scalars the fast path must refuse (or that ruamel rejects)
+EDGE_SCALARS = [
+    "'it''s'", '"esc\\"aped"', '"tab\\there"', "-", "a: b", "x:", "[a]", "{a: 1}",
+    "&a x", "*a", "!!str 1", "|", ">-", "%x", "@x", "`x", "a]b", "---", "<<", "=", '"open',
+]
+
+COMMENTS = ["", "", "", " # note", "  #x", "#glued"]
+
+
+def random_blocks(count: int, seed: int) -> Iterator[str]:
+    """
+    Frontmatter-shaped blocks: mostly inside the flat subset, with
+    scalars, keys and indentation that sit on or just past its edges.
+    """
+    rng = random.Random(seed)
+
+    def scalar() -> str:
+        pool = EDGE_SCALARS if rng.random() < 0.02 else SCALARS
+        return rng.choice(pool) + rng.choice(COMMENTS)
+
+    for _ in range(count):
+        lines: List[str] = []
+        for _ in range(rng.randint(1, 8)):
+            key = rng.choice(KEYS)
+            shape = rng.random()
+            if shape < 0.6:
+                lines.append(f"{key}: {scalar()}")
+            elif shape < 0.75:
+                lines.append(f"{key}:{rng.choice(COMMENTS)}")
+                indent = " " * rng.choice([2, 2, 4, 1])
+                for _ in range(rng.randint(0, 3)):
+                    child_indent = indent if rng.random() < 0.9 else " " * rng.choice([0, 3, 6])
+                    lines.append(f"{child_indent}{rng.choice(KEYS)}: {scalar()}")
+            elif shape < 0.9:
+                lines.append(f"{key}:")
+                indent = " " * rng.choice([0, 2, 2, 4])
+                for _ in range(rng.randint(0, 3)):
+                    lines.append(f"{indent}- {scalar()}")
+            elif shape < 0.95:
+                lines.append(rng.choice(["", "# comment", "   # indented comment", "  "]))
+            else:
+                lines.append(rng.choice(["  continued line", "\ttab: 1", "key : x", "key:x", "- item"]))
+        yield "\n".join(lines)
+
+
+def artifact_blocks() -> Iterator[str]:
+    """
+    Metadata blocks declared by artifacts in this repository.
+    """
+    for artifact in iter_artifacts([ROOT]):
+        extracted = extract_metadata(artifact.path)
+        if extracted.raw_block is not None:
+            yield extracted.raw_block
+
+
+# ----------------------------
+# Comparison
+# ----------------------------
+
+def outcome(load, block: str) -> Tuple[str, str]:
+    try:
+        return "value", repr(load(block))
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Differential fuzz of the flat YAML fast path.")
+    parser.add_argument("--random", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reference = YAML_BACKENDS["ruamel"]
+    suites = [
+        ("repository artifacts", list(artifact_blocks())),
+        ("random", list(random_blocks(args.random, args.seed))),
+    ]
+
+    failures = 0
+    for suite, blocks in suites:
+        flat = 0
+        mismatched = 0
+        for block in blocks:
+            try:
+                actual = ("value", repr(_load_flat(block)))
+            except _NotFlat:
+                continue
+            flat += 1
+            expected = outcome(reference, block)
+            if actual != expected:
+                mismatched += 1
+                if mismatched <= 5:
+                    print(f"❌ [{suite}] fast path differs on {block!r}")
+                    print(f"   ruamel: {expected}")
+                    print(f"   flat  : {actual}")
+        failures += mismatched
+        print(
+            f"{suite:22s} {flat - mismatched}/{flat} fast-path blocks equivalent "
+            f"({len(blocks) - flat} of {len(blocks)} left to the YAML backend)"
+        )
+
+    if failures:
+        print(f"\n❌ {failures} blocks parsed differently by the fast path.")
+        sys.exit(1)
+
+    print("\n✅ The flat fast path agrees with ruamel.")
+
+
+if __name__ == "__main__":
+    run()
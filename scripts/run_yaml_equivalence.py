@@ -0,0 +1,148 @@
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import yaml
+
+# Ensure repo root is on path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from stamp.discovery import iter_artifacts
+from stamp.extract import YAML_BACKENDS, extract_metadata
+
+
+FIXTURE_PATHS = [
+    ROOT / "fixtures" / "fixtures-v1.json",
+    ROOT / "fixtures" / "npo-fixtures-v1.json",
+]
+
+
+# ----------------------------
+# Corpus
+# ----------------------------
+
+# Scalars where YAML 1.1 (PyYAML's defaults) and YAML 1.2 (ruamel) differ,
+# plus constructs the libyaml backend leaves to ruamel
+CORNER_CASES = [
+    "a: yes", "a: No", "a: on", "a: OFF", "a: y", "a: n", "a: True", "a: FALSE",
+    "a: 012", "a: 0o12", "a: 0b101", "a: 0x1F", "a: 1_000", "a: -0", "a: +12", "a: _",
+    "a: 1:20", "a: 1:20.5", "a: 1e3", "a: 1.5E-3", "a: .5", "a: -.inf", "a: .NaN", "a: 1.",
+    "a: 2026-01-31", "a: 2026-1-3 4:05:06", "a: 2026-01-31T10:00:00Z",
+    "a: 2026-01-31 10:00:00.123 +02:00", "a: 2026-13-45",
+    "a: ~", "a: null", "a: Null", "a:", "a: ''", "a: =", "= : 1",
+    "a: 1\na: 2", "a: 1\nb:\n  c: 1\n  c: 2", "1: a\ntrue: b",
+    "base: &b {x: 1}\nderived:\n  <<: *b\n  y: 2", "<<: [{a: 1}, {b: 2}]",
+    "a: !!set {x, y}", "a: !!omap [{x: 1}]", "a: !!pairs [{x: 1}]", "a: !!binary aGVsbG8=",
+    "a: !!str 12", "a: !!int '12'", "a: !!float '1'", "a: !!bool 'yes'", "a: !custom x",
+    "? [1, 2]\n: x", "a: [1, [2, 3], {b: c}]", "a: |\n  line\n  line\n", "a: >-\n  folded\n  text\n",
+    "a: 'it''s'", "a: \"\\u00e9\\t\"", "- a\n- b", "just a string", "", "---\na: 1\n...",
+    "a: 1\n---\nb: 2", "%YAML 1.1\n---\na: yes", "a: [unclosed", "a: b: c", "\ta: 1",
+    "a: *missing", "a: &x 1\nb: *x", "a: @reserved", "a: `reserved", "k: v # comment",
+    "a: 1\u2028b: 2", "a: x\x85b: 2", "a: \"x\u2029y\"", "title: a\n\u2028<!-- a: 1",
+    "title: \"Stamp — Module\"\nauthor:\n  name: \"X\"\n  orcid: \"https://orcid.org/0\"",
+]
+
+
+def fixture_blocks() -> Iterator[str]:
+    """
+    Fixture instances rendered as block and flow YAML.
+    """
+    for path in FIXTURE_PATHS:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for case in data["cases"]:
+            for value in case.values():
+                if isinstance(value, (dict, list)):
+                    yield yaml.safe_dump(value, sort_keys=False, allow_unicode=True)
+                    yield json.dumps(value)
+
+
+def artifact_blocks() -> Iterator[str]:
+    """
+    Metadata blocks declared by artifacts in this repository.
+    """
+    for artifact in iter_artifacts([ROOT]):
+        extracted = extract_metadata(artifact.path)
+        if extracted.raw_block is not None:
+            yield extracted.raw_block
+
+
+def random_blocks(count: int, seed: int) -> Iterator[str]:
+    """
+    Random recombinations of corner-case lines, keys and indentation.
+    """
+    rng = random.Random(seed)
+    values = [case.split(": ", 1)[1] for case in CORNER_CASES if case.startswith("a: ")]
+    pieces = ["-", ":", " ", "  ", "\n", "#", "[", "]", "{", "}", ",", "'", '"', "&a", "*a", "!!str", "?", "|", ">"]
+
+    for _ in range(count):
+        lines: List[str] = []
+        for _ in range(rng.randint(1, 6)):
+            indent = " " * rng.choice([0, 0, 2, 4])
+            key = rng.choice(["a", "b", "c", "<<", "1", "true", "x y"])
+            value = rng.choice(values)
+            if rng.random() < 0.3:
+                value = "".join(rng.choice(pieces + values) for _ in range(rng.randint(1, 4)))
+            lines.append(f"{indent}{key}: {value}")
+        yield "\n".join(lines)
+
+
+# ----------------------------
+# Comparison
+# ----------------------------
+
+def outcome(load, block: str) -> Tuple[str, str]:
+    try:
+        return "value", repr(load(block))
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Check YAML backends for equivalence.")
+    parser.add_argument("--random", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reference = YAML_BACKENDS["ruamel"]
+    others = {name: load for name, load in YAML_BACKENDS.items() if name != "ruamel"}
+
+    if not others:
+        print("⚠️  Only the ruamel backend is available (PyYAML without libyaml); nothing to compare.")
+        return
+
+    suites = [
+        ("corner cases", CORNER_CASES),
+        ("fixtures", list(fixture_blocks())),
+        ("repository artifacts", list(artifact_blocks())),
+        ("random", list(random_blocks(args.random, args.seed))),
+    ]
+
+    failures = 0
+    for suite, blocks in suites:
+        for name, load in others.items():
+            mismatched = 0
+            for block in blocks:
+                expected = outcome(reference, block)
+                actual = outcome(load, block)
+                if actual != expected:
+                    mismatched += 1
+                    if mismatched <= 5:
+                        print(f"❌ [{suite}] {name} differs on {block!r}")
+                        print(f"   ruamel: {expected}")
+                        print(f"   {name}: {actual}")
+            failures += mismatched
+            print(f"{suite:22s} {name}: {len(blocks) - mismatched}/{len(blocks)} equivalent")
+
+    if failures:
+        print(f"\n❌ {failures} blocks parsed differently.")
+        sys.exit(1)
+
+    print("\n✅ All YAML backends agree.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,313 @@
+"""
+<!--
+title: "Stamp — Content-Addressed Validation Cache Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of cache keying, eviction, and concurrency handling, with human-defined equivalence guarantees, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from stamp.dedup import block_digest
+from stamp.extract import ExtractedMetadata
+from stamp.manifest import set_default_mode
+from stamp.schema import ResolvedSchema
+from stamp.validate import DEFAULT_VALIDATION_ENGINE, ValidationResult, validate_artifact
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".json"
+
+
+class ValidationCache:
+    """
+    On-disk cache of CDO lists (or, for counts-only validation, CDO
+    counts) keyed by metadata block.
+
+    A key combines the block's format and content hash, the schema
+    fingerprint and the Stamp tool version, so entries survive fresh
+    checkouts (where every mtime changes) but never outlive a schema or
+    tool change. The extracted block, not the file, is what gets
+    validated: the same bytes read by different extractors, or with
+    different extraction parameters, never share an entry.
+
+    Entries are single JSON files written atomically (temp file +
+    rename), so concurrent readers and writers in parallel jobs never
+    observe partial entries; unreadable entries are treated as misses.
+    Entries get the mode open() would give them (0666 less the umask),
+    so jobs running as other users can read a shared cache.
+    Recency is tracked through entry mtimes, and prune() evicts least
+    recently used entries until the cache fits in max_bytes.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        tool_version: str,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.tool_version = tool_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # --- Keys ----------------------------------------------------------
+
+    def key(
+        self,
+        content_hash: str,
+        resolved_schema: ResolvedSchema,
+        max_diagnostics: Optional[int] = None,
+        counts_only: bool = False,
+        block_format: Optional[str] = None,
+    ) -> str:
+        parts = [str(block_format), content_hash, resolved_schema.fingerprint, self.tool_version]
+        if max_diagnostics is not None:
+            # Truncated results are cached apart from complete ones
+            parts.append(f"max_diagnostics={max_diagnostics}")
+        if counts_only:
+            parts.append("counts_only")
+        raw = "\0".join(parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / (key + _ENTRY_SUFFIX)
+
+    # --- Entries -------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the ValidationResult fields cached under `key`
+        (diagnostics, truncated, error_count), or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Complete diagnostics are stored as a bare list
+        if isinstance(entry, list):
+            fields: Dict[str, Any] = {"diagnostics": entry}
+        elif not isinstance(entry, dict) or not isinstance(entry.get("truncated"), bool):
+            fields = None
+        elif isinstance(entry.get("diagnostics"), list):
+            fields = {"diagnostics": entry["diagnostics"], "truncated": entry["truncated"]}
+        elif isinstance(entry.get("error_count"), int):
+            fields = {"diagnostics": [], "truncated": entry["truncated"], "error_count": entry["error_count"]}
+        else:
+            fields = None
+
+        if fields is None:
+            self.misses += 1
+            return None
+
+        try:
+            # Mark as recently used for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return fields
+
+    def put(self, key: str, result: ValidationResult) -> None:
+        """
+        Store a result's diagnostics (or counts) under `key`.
+
+        Diagnostics that do not survive a JSON round trip unchanged
+        (e.g. dates or non-string keys echoed from metadata) are not
+        cached, so a hit always reproduces the uncached result exactly.
+        """
+        if result.error_count is not None:
+            text = json.dumps(
+                {"truncated": result.truncated, "error_count": result.error_count},
+                separators=(",", ":"),
+            )
+        else:
+            diagnostics = result.diagnostics
+            try:
+                text = json.dumps(diagnostics, separators=(",", ":"))
+            except (TypeError, ValueError):
+                return
+            if json.loads(text) != diagnostics:
+                return
+            if result.truncated:
+                text = '{"truncated":true,"diagnostics":' + text + "}"
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".entry-", suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            set_default_mode(tmp)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def validate(
+        self,
+        *,
+        extracted: ExtractedMetadata,
+        resolved_schema: ResolvedSchema,
+        content_hash: Optional[str] = None,
+        engine: str = DEFAULT_VALIDATION_ENGINE,
+        max_diagnostics: Optional[int] = None,
+        counts_only: bool = False,
+    ) -> ValidationResult:
+        """
+        validate_artifact() with a content-addressed cache in front.
+
+        `content_hash` defaults to the SHA-256 of the metadata block
+        (`raw_block`); it is keyed together with the block's format.
+        Engines produce identical diagnostics and share entries.
+        Blocks that exceeded a resource limit bypass the cache: the
+        outcome depends on the limits, not only on the content. So do
+        results without a block, whose outcome depends on how (or
+        whether) the file was read.
+        """
+        if content_hash is None and extracted.raw_block is not None:
+            content_hash = block_digest(extracted.raw_block).hex()
+
+        if extracted.limit_exceeded is not None or content_hash is None:
+            return validate_artifact(
+                extracted=extracted,
+                resolved_schema=resolved_schema,
+                engine=engine,
+                max_diagnostics=max_diagnostics,
+                counts_only=counts_only,
+            )
+
+        key = self.key(content_hash, resolved_schema, max_diagnostics, counts_only, extracted.block_format)
+
+        cached = self.get(key)
+        if cached is not None:
+            return ValidationResult(
+                artifact_path=extracted.artifact_path,
+                schema_id=resolved_schema.identifier,
+                error=extracted.error,
+                **cached,
+            )
+
+        result = validate_artifact(
+            extracted=extracted,
+            resolved_schema=resolved_schema,
+            engine=engine,
+            max_diagnostics=max_diagnostics,
+            counts_only=counts_only,
+        )
+        self.put(key, result)
+        return result
+
+    # --- Eviction ------------------------------------------------------
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache fits in
+        max_bytes. Returns the number of entries removed.
+
+        Eviction is serialized across processes where file locking is
+        available; entries removed concurrently by another process are
+        skipped.
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        lock_path = self.directory / ".lock"
+        try:
+            lock = open(lock_path, "a+")
+        except PermissionError:
+            # Made by another user: a read-only descriptor locks as well
+            try:
+                lock = open(lock_path, "r")
+            except OSError:
+                return 0
+        except OSError:
+            return 0
+
+        with lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    # Another process is already pruning
+                    return 0
+
+            entries: List[Tuple[int, int, str]] = []
+            total = 0
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir(follow_symlinks=False):
+                    continue
+                for entry in os.scandir(shard.path):
+                    if not entry.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+
+            return removed
@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -98,6 +98,40 @@ def translate_validation_errors_to_cdos(
     return diagnostics
 
 
+def count_cdos(*, errors: List[ValidationError]) -> int:
+    """
+    The number of CDOs translate_validation_errors_to_cdos() emits for
+    `errors`, without building them.
+
+    Translation emits exactly one CDO per error, and every CDO has
+    severity "error", so outputs that only report pass/fail and
+    diagnostic counts may count errors instead. Keep this in step with
+    the translation above.
+    """
+    return len(errors)
+
+
+def translate_resource_limit_to_cdo(
+    *,
+    limit_exceeded: Dict[str, Any],
+    message: str,
+) -> Dict[str, Any]:
+    """
+    Canonical Diagnostic Object for a metadata block that exceeded a
+    resource limit and was therefore never validated.
+    """
+    return {
+        "id": "resource.limit_exceeded",
+        "severity": "error",
+        "schema_keyword": "resourceLimit",
+        "instance_path": "",
+        "schema_path": "",
+        "message": message,
+        "details": dict(limit_exceeded),
+        "fix": None,
+    }
+
+
 # --- Internals ---------------------------------------------------------
 
 def _is_conditional_violation(error: ValidationError) -> bool:
@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-16"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -55,7 +55,7 @@ def apply(
       - never mutates in place
     """
 
-    extracted = extract_metadata(artifact)
+    extracted = extract_metadata(artifact, sniff_unknown=True)
     resolved_schema = load_schema(schema)
 
     result = validate_artifact(
@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -28,24 +28,48 @@ anchors: []
 """
 from __future__ import annotations
 
+import dataclasses
+import functools
 import json
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-
-from stamp.extract import extract_metadata
-from stamp.schema import load_schema
-from stamp.validate import validate_artifact, ValidationResult
+from jsonschema.exceptions import SchemaError
+
+from stamp.extract import (
+    DEFAULT_MAX_HEADER_BYTES,
+    DEFAULT_RESOURCE_LIMITS,
+    SKIP_BINARY,
+    SKIP_OVERSIZED,
+    SKIP_UNSUPPORTED,
+    ResourceLimits,
+    extract_metadata,
+    extractor_table,
+    with_extractors,
+)
+from stamp.schema import ResolvedSchema, load_schema
+from stamp.validate import (
+    DEFAULT_VALIDATION_ENGINE,
+    VALIDATION_ENGINES,
+    compiled_validator,
+    validate_artifact,
+    ValidationResult,
+)
 from stamp.fix import build_fix_proposals
 from stamp.remediation import build_remediation_summary
-from stamp.discovery import discover_artifacts
+from stamp.discovery import iter_artifacts, iter_changed_artifacts
+from stamp.gitchanges import GitError, collect_changes
+from stamp.manifest import DiscoveryManifest
+from stamp.cache import DEFAULT_CACHE_MAX_BYTES, ValidationCache
+from stamp.dedup import BlockDeduplicator, block_digest
 from stamp.trace import (
     ExecutionTrace,
     ArtifactTrace,
     now_utc,
 )
-from stamp.trace_schema import validate_trace
+from stamp.trace_schema import TRACE_SCHEMA_VERSION, validate_trace
+from stamp.watch import watch as watch_artifacts
 
 
 # -----------------------------
@@ -54,7 +78,7 @@ from stamp.trace_schema import validate_trace
 
 STAMP_TOOL_NAME = "stamp"
 STAMP_TOOL_VERSION = "0.1.0"
-TRACE_VERSION = "0.0.1"
+TRACE_VERSION = TRACE_SCHEMA_VERSION
 
 
 app = typer.Typer(
@@ -75,9 +99,34 @@ def _is_passed(result: ValidationResult) -> bool:
     """
     A validation passes iff there are no error-severity diagnostics.
     """
+    if result.error_count is not None:
+        # Counts-only results count error-severity diagnostics alone
+        return result.error_count == 0
     return not any(d.get("severity") == "error" for d in result.diagnostics)
 
 
+def _load_checked_schema(schema: Path, engine: str = DEFAULT_VALIDATION_ENGINE) -> ResolvedSchema:
+    """
+    Load a schema and check it against the Draft 2020-12 meta-schema
+    once, before any artifact is validated.
+    """
+    if engine not in VALIDATION_ENGINES:
+        typer.secho(
+            f"--engine: expected one of {', '.join(VALIDATION_ENGINES)}",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    resolved_schema = load_schema(schema)
+    try:
+        compiled_validator(resolved_schema, engine)
+    except SchemaError as e:
+        typer.secho(f"--schema: invalid schema: {e.message}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=2)
+    return resolved_schema
+
+
 def _write_validated_trace(trace: ExecutionTrace, path: Path) -> None:
     """
     Validate a trace artifact against the trace schema before writing.
@@ -115,6 +164,63 @@ def run(
     remediation: bool = typer.Option(False, "--remediation"),
     fix_proposals: bool = typer.Option(False, "--fix-proposals"),
     trace_out: Optional[Path] = typer.Option(None, "--trace-out"),
+    extractor: List[str] = typer.Option(
+        [],
+        "--extractor",
+        help="Register an extractor for a suffix, e.g. .vue=comment; * matches every unregistered suffix.",
+    ),
+    sniff_frontmatter: bool = typer.Option(
+        False,
+        "--sniff-frontmatter",
+        help="Also read ---/+++ frontmatter from files without a suffix.",
+    ),
+    max_header_bytes: int = typer.Option(
+        DEFAULT_MAX_HEADER_BYTES,
+        "--max-header-bytes",
+        min=1,
+        help="Read at most this many bytes from the top of a file when looking for metadata.",
+    ),
+    max_block_bytes: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_block_bytes,
+        "--max-block-bytes",
+        min=1,
+        help="Reject metadata blocks larger than this.",
+    ),
+    max_aliases: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_aliases,
+        "--max-aliases",
+        min=0,
+        help="Reject YAML blocks with more alias references than this.",
+    ),
+    max_depth: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_depth,
+        "--max-depth",
+        min=1,
+        help="Reject metadata nested deeper than this.",
+    ),
+    max_nodes: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_nodes,
+        "--max-nodes",
+        min=1,
+        help="Reject metadata with more nodes than this once aliases are expanded.",
+    ),
+    max_parse_seconds: float = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_parse_seconds,
+        "--max-parse-seconds",
+        min=0.0,
+        help="Abandon a metadata block that takes longer than this to parse.",
+    ),
+    engine: str = typer.Option(
+        DEFAULT_VALIDATION_ENGINE,
+        "--engine",
+        help="Validation engine: jsonschema, or codegen (generated Python, same diagnostics).",
+    ),
+    max_diagnostics: Optional[int] = typer.Option(
+        None,
+        "--max-diagnostics",
+        min=1,
+        help="Stop collecting an artifact's diagnostics after this many (recorded in the trace).",
+    ),
 ):
     """
     Validate a single artifact.
@@ -124,12 +230,37 @@ def run(
     """
     started_at = now_utc()
 
-    extracted = extract_metadata(artifact)
-    resolved_schema = load_schema(schema)
+    try:
+        extractors = with_extractors(extractor)
+    except ValueError as e:
+        typer.secho(f"--extractor: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=2)
+
+    limits = ResourceLimits(
+        max_block_bytes=max_block_bytes,
+        max_aliases=max_aliases,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        max_parse_seconds=max_parse_seconds,
+    )
+
+    extracted = extract_metadata(
+        artifact,
+        max_header_bytes=max_header_bytes,
+        limits=limits,
+        sniff_unknown=True,
+        extractors=extractors,
+        sniff_frontmatter=sniff_frontmatter,
+    )
+    resolved_schema = _load_checked_schema(schema, engine)
 
+    # A summary reports only counts, so CDOs are never built for it
     result = validate_artifact(
         extracted=extracted,
         resolved_schema=resolved_schema,
+        engine=engine,
+        max_diagnostics=max_diagnostics,
+        counts_only=summary and not (fix_proposals or remediation),
     )
 
     passed = _is_passed(result)
@@ -145,7 +276,7 @@ def run(
                 "artifact": str(artifact),
                 "schema": str(schema),
                 "passed": passed,
-                "diagnostic_count": len(result.diagnostics),
+                "diagnostic_count": result.diagnostic_count,
             }
         )
     else:
@@ -167,9 +298,16 @@ def run(
                 ArtifactTrace(
                     artifact=str(artifact),
                     passed=passed,
-                    diagnostic_count=len(result.diagnostics),
+                    diagnostic_count=result.diagnostic_count,
+                    truncated=result.truncated,
                 )
             ],
+            truncation=None if max_diagnostics is None else {
+                "fail_fast": False,
+                "stopped_early": False,
+                "max_diagnostics": max_diagnostics,
+                "truncated_artifacts": int(result.truncated),
+            },
         )
         _write_validated_trace(trace, trace_out)
 
@@ -185,6 +323,111 @@ def repo(
     root: Path,
     schema: Path = typer.Option(..., "--schema"),
     trace_out: Optional[Path] = typer.Option(None, "--trace-out"),
+    discovery_workers: int = typer.Option(
+        1,
+        "--discovery-workers",
+        min=1,
+        help="Walk top-level subtrees on N threads (useful on network filesystems).",
+    ),
+    ignore_files: bool = typer.Option(
+        True,
+        "--ignore-files/--no-ignore-files",
+        help="Honour .gitignore and .stampignore files during discovery.",
+    ),
+    from_git_index: bool = typer.Option(
+        False,
+        "--from-git-index",
+        help="Enumerate tracked files from the git index instead of walking the tree.",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse results for artifacts unchanged since the last run (manifest in <root>/.stamp/).",
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Content-addressed validation cache directory (safe to share between jobs).",
+    ),
+    cache_max_bytes: int = typer.Option(
+        DEFAULT_CACHE_MAX_BYTES,
+        "--cache-max-bytes",
+        min=0,
+        help="Evict least recently used cache entries beyond this size.",
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Only validate files changed relative to the merge base with this git ref.",
+    ),
+    extractor: List[str] = typer.Option(
+        [],
+        "--extractor",
+        help="Register an extractor for a suffix, e.g. .vue=comment; * matches every unregistered suffix.",
+    ),
+    sniff_frontmatter: bool = typer.Option(
+        False,
+        "--sniff-frontmatter",
+        help="Also read ---/+++ frontmatter from files without a suffix.",
+    ),
+    max_header_bytes: int = typer.Option(
+        DEFAULT_MAX_HEADER_BYTES,
+        "--max-header-bytes",
+        min=1,
+        help="Read at most this many bytes from the top of a file when looking for metadata.",
+    ),
+    max_file_bytes: Optional[int] = typer.Option(
+        None,
+        "--max-file-bytes",
+        min=0,
+        help="Skip files larger than this without reading them.",
+    ),
+    max_block_bytes: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_block_bytes,
+        "--max-block-bytes",
+        min=1,
+        help="Reject metadata blocks larger than this.",
+    ),
+    max_aliases: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_aliases,
+        "--max-aliases",
+        min=0,
+        help="Reject YAML blocks with more alias references than this.",
+    ),
+    max_depth: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_depth,
+        "--max-depth",
+        min=1,
+        help="Reject metadata nested deeper than this.",
+    ),
+    max_nodes: int = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_nodes,
+        "--max-nodes",
+        min=1,
+        help="Reject metadata with more nodes than this once aliases are expanded.",
+    ),
+    max_parse_seconds: float = typer.Option(
+        DEFAULT_RESOURCE_LIMITS.max_parse_seconds,
+        "--max-parse-seconds",
+        min=0.0,
+        help="Abandon a metadata block that takes longer than this to parse.",
+    ),
+    engine: str = typer.Option(
+        DEFAULT_VALIDATION_ENGINE,
+        "--engine",
+        help="Validation engine: jsonschema, or codegen (generated Python, same diagnostics).",
+    ),
+    max_diagnostics: Optional[int] = typer.Option(
+        None,
+        "--max-diagnostics",
+        min=1,
+        help="Stop collecting an artifact's diagnostics after this many (recorded in the trace).",
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Stop at the first failing artifact (recorded in the trace).",
+    ),
 ):
     """
     Validate all governed artifacts under a root path.
@@ -194,49 +437,240 @@ def repo(
     """
     started_at = now_utc()
 
-    resolved_schema = load_schema(schema)
-    artifacts = discover_artifacts([root])
+    # --since lists changed files from git instead of discovering them
+    if since is not None and (from_git_index or discovery_workers != 1):
+        option = "--from-git-index" if from_git_index else "--discovery-workers"
+        typer.secho(f"--since: cannot be combined with {option}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        extractors = with_extractors(extractor)
+    except ValueError as e:
+        typer.secho(f"--extractor: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=2)
+
+    resolved_schema = _load_checked_schema(schema, engine)
+    limits = ResourceLimits(
+        max_block_bytes=max_block_bytes,
+        max_aliases=max_aliases,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        max_parse_seconds=max_parse_seconds,
+    )
+
+    manifest: Optional[DiscoveryManifest] = None
+    if incremental:
+        manifest = DiscoveryManifest.for_root(
+            root,
+            context={
+                "tool_version": STAMP_TOOL_VERSION,
+                "schema_fingerprint": resolved_schema.fingerprint,
+                "max_header_bytes": max_header_bytes,
+                "max_file_bytes": max_file_bytes,
+                "extractors": extractor_table(extractors),
+                "sniff_frontmatter": sniff_frontmatter,
+                "resource_limits": dataclasses.asdict(limits),
+                "max_diagnostics": max_diagnostics,
+            },
+        )
+
+    cache: Optional[ValidationCache] = None
+    if cache_dir is not None:
+        cache = ValidationCache(
+            cache_dir,
+            tool_version=STAMP_TOOL_VERSION,
+            max_bytes=cache_max_bytes,
+        )
+
+    scope = None
+    if since is not None:
+        try:
+            changes = collect_changes(root.resolve(), since)
+        except GitError as e:
+            typer.secho(f"--since: {e}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=2)
+
+        artifacts = iter_changed_artifacts(
+            [root],
+            changes,
+            respect_ignore_files=ignore_files,
+        )
+        scope = {
+            "partial": True,
+            "since": since,
+            "merge_base": changes.merge_base,
+        }
+    else:
+        artifacts = iter_artifacts(
+            [root],
+            workers=discovery_workers,
+            respect_ignore_files=ignore_files,
+            from_git_index=from_git_index,
+        )
+
+    # Identical metadata blocks are parsed and validated once per run
+    dedup = BlockDeduplicator(limits=limits)
 
     artifact_traces: List[ArtifactTrace] = []
     passed_count = 0
     failed_count = 0
+    truncated_count = 0
+    stopped_early = False
+    skipped_counts = {SKIP_BINARY: 0, SKIP_OVERSIZED: 0, SKIP_UNSUPPORTED: 0}
 
+    # Discovery is streamed: validation starts with the first artifact
     for artifact in artifacts:
-        extracted = extract_metadata(artifact.path)
+        signature = None
+        if manifest is not None:
+            signature = manifest.signature(artifact)
+            previous = manifest.lookup(artifact, signature)
+        else:
+            previous = None
+
+        if previous is not None:
+            # Unchanged since the last run: reuse its outcome
+            manifest.record(
+                artifact,
+                signature,
+                governed=previous.governed,
+                passed=previous.passed,
+                diagnostic_count=previous.diagnostic_count,
+                skip_reason=previous.skip_reason,
+                truncated=previous.truncated,
+                block_format=previous.block_format,
+                block_digest=previous.block_digest,
+            )
+            if not previous.governed:
+                if previous.skip_reason is not None:
+                    skipped_counts[previous.skip_reason] += 1
+                continue
+            dedup.count_reused(
+                previous.block_format,
+                None if previous.block_digest is None else bytes.fromhex(previous.block_digest),
+                resolved_schema,
+            )
+            passed = previous.passed
+            diagnostic_count = previous.diagnostic_count
+            truncated = previous.truncated
+        else:
+            # Sizes from the git index (no stat data) may be stale
+            size_bytes = artifact.size_bytes if artifact.mtime_ns is not None else None
+
+            extracted = extract_metadata(
+                artifact.path,
+                max_header_bytes=max_header_bytes,
+                max_file_bytes=max_file_bytes,
+                size_bytes=size_bytes,
+                limits=limits,
+                load_yaml=dedup.load_yaml,
+                extractors=extractors,
+                sniff_frontmatter=sniff_frontmatter,
+            )
 
-        # GOVERNANCE GATE:
-        # Only artifacts that explicitly declare metadata are governed
-        if extracted.metadata is None:
-            continue
+            if extracted.skip_reason is not None:
+                skipped_counts[extracted.skip_reason] += 1
+
+            # GOVERNANCE GATE:
+            # Only artifacts that explicitly declare metadata are governed;
+            # a block rejected by a resource limit still declared it
+            if extracted.metadata is None and extracted.limit_exceeded is None:
+                if manifest is not None:
+                    manifest.record(
+                        artifact,
+                        signature,
+                        governed=False,
+                        skip_reason=extracted.skip_reason,
+                    )
+                continue
+
+            # Only counts are reported, so CDOs are never built
+            result = dedup.validate(
+                extracted=extracted,
+                resolved_schema=resolved_schema,
+                compute=functools.partial(
+                    cache.validate if cache is not None else validate_artifact,
+                    engine=engine,
+                    max_diagnostics=max_diagnostics,
+                    counts_only=True,
+                ),
+            )
 
-        result = validate_artifact(
-            extracted=extracted,
-            resolved_schema=resolved_schema,
-        )
+            passed = _is_passed(result)
+            diagnostic_count = result.diagnostic_count
+            truncated = result.truncated
 
-        passed = _is_passed(result)
+            if manifest is not None:
+                manifest.record(
+                    artifact,
+                    signature,
+                    governed=True,
+                    passed=passed,
+                    diagnostic_count=diagnostic_count,
+                    truncated=truncated,
+                    block_format=extracted.block_format,
+                    block_digest=(
+                        None if extracted.raw_block is None
+                        else block_digest(extracted.raw_block).hex()
+                    ),
+                )
 
         artifact_traces.append(
             ArtifactTrace(
                 artifact=str(artifact.path),
                 passed=passed,
-                diagnostic_count=len(result.diagnostics),
+                diagnostic_count=diagnostic_count,
+                truncated=truncated,
             )
         )
 
+        if truncated:
+            truncated_count += 1
         if passed:
             passed_count += 1
         else:
             failed_count += 1
-
-    _emit(
-        {
-            "root": str(root),
-            "total_artifacts": len(artifact_traces),
-            "passed": passed_count,
-            "failed": failed_count,
+            if fail_fast:
+                # Remaining artifacts are neither validated nor traced
+                stopped_early = True
+                break
+
+    if manifest is not None:
+        # A narrowed or stopped run keeps the entries of artifacts it
+        # did not visit
+        manifest.save(partial=scope is not None or stopped_early)
+
+    summary = {
+        "root": str(root),
+        "total_artifacts": len(artifact_traces),
+        "passed": passed_count,
+        "failed": failed_count,
+        "skipped": skipped_counts,
+        "dedup": {
+            "blocks": dedup.blocks,
+            "unique": dedup.unique,
+            "ratio": round(dedup.ratio, 3),
+        },
+    }
+
+    truncation = None
+    if fail_fast or max_diagnostics is not None:
+        truncation = {
+            "fail_fast": fail_fast,
+            "stopped_early": stopped_early,
+            "truncated_artifacts": truncated_count,
+        }
+        if max_diagnostics is not None:
+            truncation["max_diagnostics"] = max_diagnostics
+        summary["truncation"] = truncation
+
+    if cache is not None:
+        cache.prune()
+        summary["cache"] = {
+            "hits": cache.hits,
+            "misses": cache.misses,
         }
-    )
+
+    _emit(summary)
 
     finished_at = now_utc()
     exit_code = 0 if failed_count == 0 else 1
@@ -252,7 +686,83 @@ def repo(
             finished_at=finished_at,
             exit_code=exit_code,
             artifacts=artifact_traces,
+            scope=scope,
+            truncation=truncation,
         )
         _write_validated_trace(trace, trace_out)
 
     raise typer.Exit(code=exit_code)
+
+
+# -----------------------------
+# Watch mode
+# -----------------------------
+
+@app.command("watch")
+def watch(
+    root: Path,
+    schema: Path = typer.Option(..., "--schema"),
+    debounce: float = typer.Option(
+        0.2,
+        "--debounce",
+        min=0.0,
+        help="Seconds of quiet before a burst of changes is revalidated.",
+    ),
+    polling: bool = typer.Option(
+        False,
+        "--polling",
+        help="Poll for changes instead of using inotify.",
+    ),
+    interval: float = typer.Option(
+        1.0,
+        "--interval",
+        min=0.05,
+        help="Polling interval in seconds.",
+    ),
+    ignore_files: bool = typer.Option(
+        True,
+        "--ignore-files/--no-ignore-files",
+        help="Honour .gitignore and .stampignore files during discovery.",
+    ),
+    extractor: List[str] = typer.Option(
+        [],
+        "--extractor",
+        help="Register an extractor for a suffix, e.g. .vue=comment; * matches every unregistered suffix.",
+    ),
+    sniff_frontmatter: bool = typer.Option(
+        False,
+        "--sniff-frontmatter",
+        help="Also read ---/+++ frontmatter from files without a suffix.",
+    ),
+):
+    """
+    Validate governed artifacts under a root path, then revalidate
+    artifacts as they change.
+
+    Emits one JSON object per line: first for every governed artifact,
+    then for each artifact that changes. Stop with Ctrl-C.
+    """
+    try:
+        extractors = with_extractors(extractor)
+    except ValueError as e:
+        typer.secho(f"--extractor: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=2)
+
+    resolved_schema = _load_checked_schema(schema)
+
+    try:
+        for record in watch_artifacts(
+            root.resolve(),
+            resolved_schema,
+            polling=polling,
+            interval=interval,
+            debounce=debounce,
+            respect_ignore_files=ignore_files,
+            extractors=extractors,
+            sniff_frontmatter=sniff_frontmatter,
+        ):
+            typer.echo(json.dumps(record))
+    except KeyboardInterrupt:
+        pass
+
+    raise typer.Exit(code=0)
@@ -0,0 +1,571 @@
+"""
+<!--
+title: "Stamp — Schema Code Generation Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of schema-specialised validation code generation, with human-defined equivalence guarantees, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import numbers
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import ValidationError
+
+
+# Keywords with generated checks. `format` is an annotation unless a
+# format checker is configured, which Stamp never does.
+SUPPORTED_KEYWORDS = frozenset(
+    {
+        "type",
+        "required",
+        "enum",
+        "const",
+        "pattern",
+        "additionalProperties",
+        "properties",
+        "items",
+        "if",
+        "format",
+    }
+)
+
+# Any other keyword jsonschema acts on sends the schema to jsonschema.
+# Keywords it ignores (title, $defs, then/else without if, ...) are
+# ignored here too.
+_UNSUPPORTED_KEYWORDS = frozenset(Draft202012Validator.VALIDATORS) - SUPPORTED_KEYWORDS
+
+_TYPE_CHECKER = Draft202012Validator.TYPE_CHECKER
+
+# Draft 2020-12 type checks, inlined; {0} is the instance expression
+_TYPE_CHECKS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": (
+        "(isinstance({0}, int) and not isinstance({0}, bool)"
+        " or isinstance({0}, float) and {0}.is_integer())"
+    ),
+    "null": "{0} is None",
+    "number": "(isinstance({0}, _Number) and not isinstance({0}, bool))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+
+class _Unsupported(Exception):
+    """
+    A schema construct without generated code.
+    """
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """
+    A schema compiled to specialised Python functions.
+
+    iter_errors() yields the ValidationErrors, in the same order and
+    with the same validator, paths, message, instance, validator_value
+    and schema as Draft202012Validator(schema).iter_errors();
+    is_valid() is its boolean form.
+    """
+    schema: Any
+    source: str
+    iter_errors: Callable[[Any], Iterator[ValidationError]]
+    is_valid: Callable[[Any], bool]
+
+
+def compile_schema(schema: Any) -> Optional[CompiledSchema]:
+    """
+    Generate validation code for a schema already checked against the
+    Draft 2020-12 meta-schema.
+
+    Returns None when the schema uses a keyword (or construct) without
+    generated code; such schemas are left to jsonschema.
+    """
+    generator = _Generator()
+    try:
+        errors = generator.errors_function(schema, ())
+        valid = generator.valid_function(schema, root=True)
+    except _Unsupported:
+        return None
+
+    source = "\n".join(generator.lines) + "\n"
+    namespace: Dict[str, Any] = dict(generator.constants)
+    namespace.update(
+        _Number=numbers.Number,
+        _equal=_equal,
+        _extras_msg=_extras_msg,
+        _error=_error,
+        _false=_false,
+    )
+    exec(compile(source, "<stamp-codegen>", "exec"), namespace)
+
+    if errors is None:
+        iter_errors = _no_errors
+    else:
+        entry = namespace[errors]
+        iter_errors = lambda instance: entry(instance, ())  # noqa: E731
+
+    return CompiledSchema(
+        schema=schema,
+        source=source,
+        iter_errors=iter_errors,
+        is_valid=namespace[valid],
+    )
+
+
+# -----------------------------
+# Runtime helpers
+# -----------------------------
+
+def _error(
+    message: str,
+    validator: str,
+    validator_value: Any,
+    instance: Any,
+    schema: Any,
+    path: Tuple[Any, ...],
+    schema_path: Tuple[Any, ...],
+) -> ValidationError:
+    return ValidationError(
+        message,
+        validator=validator,
+        path=path,
+        schema_path=schema_path,
+        instance=instance,
+        validator_value=validator_value,
+        schema=schema,
+        type_checker=_TYPE_CHECKER,
+    )
+
+
+def _false(instance: Any, path: Tuple[Any, ...], schema_path: Tuple[Any, ...]) -> ValidationError:
+    # jsonschema reports a `false` subschema without its own path segments
+    return ValidationError(
+        f"False schema does not allow {instance!r}",
+        validator=None,
+        path=path,
+        schema_path=schema_path,
+        instance=instance,
+        validator_value=None,
+        schema=False,
+        type_checker=_TYPE_CHECKER,
+    )
+
+
+def _no_errors(instance: Any) -> Iterator[ValidationError]:
+    return iter(())
+
+
+# Equality and messages as jsonschema's private _utils define them
+# (4.19 to 4.26), kept here so generated code cannot drift with them
+
+_TRUE = object()
+_FALSE = object()
+
+
+def _unbool(element: Any) -> Any:
+    if element is True:
+        return _TRUE
+    if element is False:
+        return _FALSE
+    return element
+
+
+def _equal(one: Any, two: Any) -> bool:
+    """
+    JSON equality for `enum` and `const`: True and 1 differ, also
+    inside arrays and objects.
+    """
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key]) for key, value in one.items()
+        )
+    return _unbool(one) == _unbool(two)
+
+
+def _extras_msg(extras: List[Any]) -> Tuple[str, str]:
+    verb = "was" if len(extras) == 1 else "were"
+    return ", ".join(repr(extra) for extra in extras), verb
+
+
+# -----------------------------
+# Code generation
+# -----------------------------
+
+class _Generator:
+    """
+    Emits one generator function (errors) and one predicate (valid)
+    per subschema. Schema paths are static and baked into the code;
+    instance paths are threaded through as tuples.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("_c")
+        self.constants[name] = value
+        return name
+
+    def _check(self, schema: Any, root: bool) -> None:
+        if not isinstance(schema, dict):
+            return
+        for keyword in schema:
+            if keyword in _UNSUPPORTED_KEYWORDS:
+                raise _Unsupported(keyword)
+        if not root and "$schema" in schema:
+            # A nested $schema may switch jsonschema to another draft
+            raise _Unsupported("$schema")
+        if "type" in schema:
+            types = schema["type"]
+            for name in [types] if isinstance(types, str) else types:
+                if name not in _TYPE_CHECKS:
+                    raise _Unsupported(f"type {name!r}")
+
+    def _type_test(self, types: Any, x: str) -> str:
+        names = [types] if isinstance(types, str) else types
+        if not names:
+            return "False"
+        return " or ".join(_TYPE_CHECKS[name].format(x) for name in names)
+
+    # --- Errors -----------------------------------------------------------
+
+    def errors_function(self, schema: Any, schema_path: Tuple[Any, ...]) -> Optional[str]:
+        """
+        Name of a generator function (instance, path) yielding the
+        errors for `schema`, or None for `true` and schemas without
+        checks. A `false` schema is handled by the caller.
+        """
+        if schema is True:
+            return None
+        self._check(schema, root=not schema_path)
+        if schema is False:
+            # Only reachable for a root `false` schema
+            name = self._name("_e")
+            self.lines += [
+                f"def {name}(instance, path):",
+                f"    yield _false(instance, path, {schema_path!r})",
+                "",
+            ]
+            return name
+
+        s = self._constant(schema)
+        body: List[str] = []
+        for keyword, value in schema.items():
+            emit = getattr(self, "_errors_" + keyword, None)
+            if keyword in SUPPORTED_KEYWORDS and emit is not None:
+                body += emit(schema, s, value, schema_path)
+
+        if not body:
+            return None
+
+        name = self._name("_e")
+        self.lines.append(f"def {name}(instance, path):")
+        self.lines += ["    " + line for line in body]
+        self.lines.append("")
+        return name
+
+    def _descend(
+        self,
+        subschema: Any,
+        instance: str,
+        path: str,
+        schema_path: Tuple[Any, ...],
+        parent_schema_path: Tuple[Any, ...],
+    ) -> List[str]:
+        # Statements that yield the errors of `subschema` for `instance`
+        if subschema is False:
+            return [f"yield _false({instance}, path, {parent_schema_path!r})"]
+        name = self.errors_function(subschema, schema_path)
+        if name is None:
+            return []
+        return [f"yield from {name}({instance}, {path})"]
+
+    def _raise(self, message: str, keyword: str, value: str, s: str, schema_path: Tuple[Any, ...]) -> str:
+        return (
+            f"yield _error({message}, {keyword!r}, {value}, instance, {s}, path, "
+            f"{schema_path + (keyword,)!r})"
+        )
+
+    def _errors_type(self, schema, s, types, schema_path) -> List[str]:
+        names = [types] if isinstance(types, str) else types
+        suffix = " is not of type " + ", ".join(repr(name) for name in names)
+        return [
+            f"if not ({self._type_test(types, 'instance')}):",
+            "    " + self._raise(f"repr(instance) + {suffix!r}", "type", self._constant(types), s, schema_path),
+        ]
+
+    def _errors_required(self, schema, s, required, schema_path) -> List[str]:
+        if not required:
+            return []
+        value = self._constant(required)
+        lines = ["if isinstance(instance, dict):"]
+        for prop in required:
+            message = f"{prop!r} is a required property"
+            lines += [
+                f"    if {self._constant(prop)} not in instance:",
+                "        " + self._raise(repr(message), "required", value, s, schema_path),
+            ]
+        return lines
+
+    def _errors_enum(self, schema, s, enums, schema_path) -> List[str]:
+        value = self._constant(enums)
+        suffix = f" is not one of {enums!r}"
+        raise_ = "    " + self._raise(f"repr(instance) + {suffix!r}", "enum", value, s, schema_path)
+        if enums and all(isinstance(each, str) for each in enums):
+            # _equal() compares strings with ==, and nothing else to them
+            members = self._constant(frozenset(enums))
+            return [f"if not (isinstance(instance, str) and instance in {members}):", raise_]
+        return [f"if all(not _equal(each, instance) for each in {value}):", raise_]
+
+    def _errors_const(self, schema, s, const, schema_path) -> List[str]:
+        message = f"{const!r} was expected"
+        return [
+            f"if not {self._const_test(const)}:",
+            "    " + self._raise(repr(message), "const", self._constant(const), s, schema_path),
+        ]
+
+    def _const_test(self, const: Any) -> str:
+        value = self._constant(const)
+        if isinstance(const, str):
+            # _equal() compares with == whenever either side is a string
+            return f"(instance == {value})"
+        return f"_equal(instance, {value})"
+
+    def _errors_pattern(self, schema, s, pattern, schema_path) -> List[str]:
+        regex = self._constant(re.compile(pattern))
+        suffix = f" does not match {pattern!r}"
+        return [
+            f"if isinstance(instance, str) and not {regex}.search(instance):",
+            "    " + self._raise(f"repr(instance) + {suffix!r}", "pattern", self._constant(pattern), s, schema_path),
+        ]
+
+    def _errors_properties(self, schema, s, properties, schema_path) -> List[str]:
+        lines: List[str] = []
+        here = schema_path + ("properties",)
+        for prop, subschema in properties.items():
+            key = self._constant(prop)
+            descend = self._descend(
+                subschema,
+                f"instance[{key}]",
+                f"path + ({key},)",
+                here + (prop,),
+                here,
+            )
+            if descend:
+                lines.append(f"    if {key} in instance:")
+                lines += ["        " + line for line in descend]
+        if not lines:
+            return []
+        return ["if isinstance(instance, dict):"] + lines
+
+    def _errors_additionalProperties(self, schema, s, additional, schema_path) -> List[str]:
+        here = schema_path + ("additionalProperties",)
+        known = self._constant(schema.get("properties", {}))
+        extras = f"set(key for key in instance if key not in {known})"
+
+        if isinstance(additional, dict):
+            descend = self._descend(additional, "instance[extra]", "path + (extra,)", here, here)
+            if not descend:
+                return []
+            return [
+                "if isinstance(instance, dict):",
+                f"    for extra in {extras}:",
+            ] + ["        " + line for line in descend]
+
+        if additional:
+            return []
+
+        message = '"Additional properties are not allowed (%s %s unexpected)" % _extras_msg(sorted(extras, key=str))'
+        return [
+            "if isinstance(instance, dict):",
+            "    for key in instance:",
+            f"        if key not in {known}:",
+            f"            extras = {extras}",
+            "            " + self._raise(message, "additionalProperties", "False", s, schema_path),
+            "            break",
+        ]
+
+    def _errors_items(self, schema, s, items, schema_path) -> List[str]:
+        here = schema_path + ("items",)
+        if items is False:
+            message = (
+                "f\"Expected at most 0 items but found {len(instance)} extra: "
+                "{(instance if len(instance) != 1 else instance[0])!r}\""
+            )
+            return [
+                "if isinstance(instance, list) and instance:",
+                "    " + self._raise(message, "items", "False", s, schema_path),
+            ]
+        descend = self._descend(items, "item", "path + (index,)", here, here)
+        if not descend:
+            return []
+        return [
+            "if isinstance(instance, list):",
+            "    for index, item in enumerate(instance):",
+        ] + ["        " + line for line in descend]
+
+    def _errors_if(self, schema, s, condition, schema_path) -> List[str]:
+        # The condition is compiled (and checked) even without branches
+        test = self.valid_function(condition)
+        branches = [
+            self._descend(schema[branch], "instance", "path", schema_path + (branch,), schema_path)
+            if branch in schema
+            else []
+            for branch in ("then", "else")
+        ]
+        return _branch(test, *branches)
+
+    # --- Validity ---------------------------------------------------------
+
+    def valid_function(self, schema: Any, root: bool = False) -> str:
+        """
+        Name of a predicate (instance) -> bool, True iff `schema` yields
+        no errors for the instance.
+        """
+        name = self._name("_v")
+        if isinstance(schema, bool):
+            self.lines += [f"def {name}(instance):", f"    return {schema!r}", ""]
+            return name
+
+        self._check(schema, root=root)
+        body: List[str] = []
+        for keyword, value in schema.items():
+            emit = getattr(self, "_valid_" + keyword, None)
+            if keyword in SUPPORTED_KEYWORDS and emit is not None:
+                body += emit(schema, value)
+
+        self.lines.append(f"def {name}(instance):")
+        self.lines += ["    " + line for line in body]
+        self.lines += ["    return True", ""]
+        return name
+
+    def _valid_subschema(self, subschema: Any, instance: str) -> List[str]:
+        # Statements returning False if `subschema` rejects `instance`
+        if subschema is True:
+            return []
+        if subschema is False:
+            return ["return False"]
+        test = self.valid_function(subschema)
+        return [f"if not {test}({instance}):", "    return False"]
+
+    def _valid_type(self, schema, types) -> List[str]:
+        return [f"if not ({self._type_test(types, 'instance')}):", "    return False"]
+
+    def _valid_required(self, schema, required) -> List[str]:
+        if not required:
+            return []
+        lines = ["if isinstance(instance, dict):"]
+        for prop in required:
+            lines += [f"    if {self._constant(prop)} not in instance:", "        return False"]
+        return lines
+
+    def _valid_enum(self, schema, enums) -> List[str]:
+        if enums and all(isinstance(each, str) for each in enums):
+            members = self._constant(frozenset(enums))
+            return [f"if not (isinstance(instance, str) and instance in {members}):", "    return False"]
+        value = self._constant(enums)
+        return [f"if all(not _equal(each, instance) for each in {value}):", "    return False"]
+
+    def _valid_const(self, schema, const) -> List[str]:
+        return [f"if not {self._const_test(const)}:", "    return False"]
+
+    def _valid_pattern(self, schema, pattern) -> List[str]:
+        regex = self._constant(re.compile(pattern))
+        return [f"if isinstance(instance, str) and not {regex}.search(instance):", "    return False"]
+
+    def _valid_properties(self, schema, properties) -> List[str]:
+        lines: List[str] = []
+        for prop, subschema in properties.items():
+            key = self._constant(prop)
+            check = self._valid_subschema(subschema, f"instance[{key}]")
+            if check:
+                lines.append(f"    if {key} in instance:")
+                lines += ["        " + line for line in check]
+        if not lines:
+            return []
+        return ["if isinstance(instance, dict):"] + lines
+
+    def _valid_additionalProperties(self, schema, additional) -> List[str]:
+        known = self._constant(schema.get("properties", {}))
+        if isinstance(additional, dict):
+            check = self._valid_subschema(additional, "instance[key]")
+        elif additional:
+            check = []
+        else:
+            check = ["return False"]
+        if not check:
+            return []
+        return [
+            "if isinstance(instance, dict):",
+            "    for key in instance:",
+            f"        if key not in {known}:",
+        ] + ["            " + line for line in check]
+
+    def _valid_items(self, schema, items) -> List[str]:
+        if items is False:
+            return ["if isinstance(instance, list) and instance:", "    return False"]
+        check = self._valid_subschema(items, "item")
+        if not check:
+            return []
+        return [
+            "if isinstance(instance, list):",
+            "    for item in instance:",
+        ] + ["        " + line for line in check]
+
+    def _valid_if(self, schema, condition) -> List[str]:
+        test = self.valid_function(condition)
+        then = self._valid_subschema(schema.get("then", True), "instance")
+        else_ = self._valid_subschema(schema.get("else", True), "instance")
+        return _branch(test, then, else_)
+
+
+def _branch(test: str, then: List[str], else_: List[str]) -> List[str]:
+    # `if test(instance)` with either branch possibly empty
+    if not then and not else_:
+        return []
+    if not then:
+        return [f"if not {test}(instance):"] + ["    " + line for line in else_]
+    lines = [f"if {test}(instance):"] + ["    " + line for line in then]
+    if else_:
+        lines += ["else:"] + ["    " + line for line in else_]
+    return lines
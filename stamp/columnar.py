@@ -0,0 +1,240 @@
+"""
+<!--
+title: "Stamp — Columnar Batch Validation Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-17"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of column-wise batch screening for flat object schemas, with human-defined equivalence guarantees, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, FrozenSet, List, Optional, Sequence, Tuple
+
+from jsonschema import Draft202012Validator
+
+from stamp.codegen import compile_schema
+
+
+# Root keywords evaluated column-wise. Any other keyword jsonschema acts
+# on at the root leaves the schema to the per-instance path; property
+# subschemas may use anything.
+ROOT_KEYWORDS = frozenset({"type", "required", "properties", "additionalProperties"})
+
+_UNSUPPORTED_ROOT_KEYWORDS = frozenset(Draft202012Validator.VALIDATORS) - ROOT_KEYWORDS
+
+# Subschemas that open a new resolution scope are not evaluated apart
+# from their parents
+_SCOPE_KEYWORDS = frozenset({"$id", "$dynamicAnchor", "$dynamicRef"})
+
+# Keywords that do not constrain a property value. `format` is an
+# annotation unless a format checker is configured, which Stamp never does.
+_ANNOTATION_ONLY = frozenset({"format"})
+
+
+class _Missing:
+    """
+    Column value of an instance without the property.
+    """
+
+
+_MISSING = _Missing()
+
+# Values of these exact types that compare equal validate alike, so a
+# column of them is deduplicated by (type, value)
+_SCALAR_TYPES = frozenset(
+    {str, int, float, bool, type(None), datetime.date, datetime.datetime, _Missing}
+)
+
+
+@dataclass(frozen=True)
+class _Column:
+    name: Any
+    is_valid: Callable[[Any], bool]
+    # Validity depends only on the value's type: settled once per type
+    by_type: bool
+    # is_valid is generated code, cheaper to run than freezing a container
+    generated: bool
+
+
+@dataclass(frozen=True)
+class ColumnarSchema:
+    """
+    A flat object schema split into per-property columns.
+
+    passing() settles a batch of instances at once: `required` and
+    `additionalProperties: false` are key-set comparisons across the
+    batch, and each property subschema is evaluated once per distinct
+    value in its column (once per distinct type for a subschema that
+    only checks `type`). True means Draft202012Validator(schema) finds
+    the instance valid. False means it does not, or, for an instance
+    that is not an object, that it was not screened; either way its
+    errors must come from the per-instance path.
+    """
+    schema: Any
+    required: FrozenSet[Any]
+    # Property names, when additional properties are not allowed
+    allowed: Optional[FrozenSet[Any]]
+    columns: Tuple[_Column, ...]
+
+    def passing(self, instances: Sequence[Any]) -> List[bool]:
+        positions = [i for i, instance in enumerate(instances) if isinstance(instance, dict)]
+        objects = [instances[i] for i in positions]
+        ok = [True] * len(objects)
+
+        keys = list(map(dict.keys, objects))
+        if self.required:
+            _reject(ok, map(operator.ge, keys, itertools.repeat(self.required)))
+        if self.allowed is not None:
+            _reject(ok, map(operator.le, keys, itertools.repeat(self.allowed)))
+
+        for spec in self.columns:
+            column = list(map(dict.get, objects, itertools.repeat(spec.name), itertools.repeat(_MISSING)))
+            kinds = list(map(type, column))
+            if spec.by_type:
+                values = kinds
+            elif _SCALAR_TYPES.issuperset(kinds):
+                values = list(zip(kinds, column))
+            elif spec.generated:
+                _reject(ok, (value is _MISSING or spec.is_valid(value) for value in column))
+                continue
+            else:
+                # Lists and mappings are compared by their frozen form
+                values = list(map(_freeze, column))
+            representatives = dict(zip(values, column))
+            invalid = {
+                key for key, value in representatives.items()
+                if value is not _MISSING and not spec.is_valid(value)
+            }
+            if invalid:
+                _reject(ok, (value not in invalid for value in values))
+
+        passed = [False] * len(instances)
+        for position, good in zip(positions, ok):
+            passed[position] = good
+        return passed
+
+
+def compile_columnar(schema: Any) -> Optional[ColumnarSchema]:
+    """
+    Split a schema already checked against the Draft 2020-12
+    meta-schema into columns.
+
+    Returns None unless the schema is an object whose root uses only
+    ROOT_KEYWORDS, with a boolean `additionalProperties`; such schemas
+    are left to the per-instance path.
+    """
+    if not isinstance(schema, dict) or _UNSUPPORTED_ROOT_KEYWORDS & schema.keys():
+        return None
+
+    types = schema.get("type", "object")
+    if types != "object" and not (isinstance(types, list) and "object" in types):
+        return None
+
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(additional, bool):
+        return None
+
+    properties = schema.get("properties", {})
+    if any(_opens_scope(subschema) for subschema in properties.values()):
+        return None
+
+    root = Draft202012Validator(schema)
+    columns = []
+    for name, subschema in properties.items():
+        if isinstance(subschema, dict):
+            keywords = (subschema.keys() & Draft202012Validator.VALIDATORS) - _ANNOTATION_ONLY
+            if not keywords:
+                # Nothing to check: every value passes
+                continue
+            types = subschema.get("type")
+            types = [types] if isinstance(types, str) else types or []
+            # Whether a float is an integer depends on its value
+            by_type = keywords == {"type"} and ("integer" not in types or "number" in types)
+        elif subschema is True:
+            continue
+        else:
+            by_type = True
+
+        # Generated code where it exists; otherwise the subschema is
+        # evaluated as jsonschema descends into it, with the root's
+        # references in scope
+        compiled = compile_schema(subschema)
+        if compiled is not None:
+            is_valid = compiled.is_valid
+        else:
+            is_valid = root.evolve(schema=subschema).is_valid
+        columns.append(
+            _Column(name=name, is_valid=is_valid, by_type=by_type, generated=compiled is not None)
+        )
+
+    return ColumnarSchema(
+        schema=schema,
+        required=frozenset(schema.get("required", ())),
+        allowed=None if additional else frozenset(properties),
+        columns=tuple(columns),
+    )
+
+
+# ----------------------------
+# Internals
+# ----------------------------
+
+def _reject(ok: List[bool], checks: Any) -> None:
+    """
+    Clear `ok` wherever `checks` is false.
+    """
+    checks = list(checks)
+    if all(checks):
+        return
+    for position, good in enumerate(checks):
+        if not good:
+            ok[position] = False
+
+
+def _freeze(value: Any) -> Any:
+    """
+    A hashable key that is equal only for values of the same types and
+    structure that compare equal.
+    """
+    kind = type(value)
+    if kind in _SCALAR_TYPES:
+        return (kind, value)
+    if isinstance(value, (list, tuple)):
+        return (kind, tuple(map(_freeze, value)))
+    if isinstance(value, dict):
+        return (kind, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    # Anything else is checked on its own
+    return (kind, id(value))
+
+
+def _opens_scope(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return bool(_SCOPE_KEYWORDS & schema.keys()) or any(map(_opens_scope, schema.values()))
+    if isinstance(schema, list):
+        return any(map(_opens_scope, schema))
+    return False
@@ -0,0 +1,192 @@
+"""
+<!--
+title: "Stamp — Metadata Block Deduplication Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of run-wide block deduplication, with human-defined equivalence guarantees, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from stamp.extract import (
+    DEFAULT_RESOURCE_LIMITS,
+    ExtractedMetadata,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    load_yaml_block,
+)
+from stamp.schema import ResolvedSchema
+from stamp.validate import ValidationResult, validate_artifact
+
+
+# Stands in for the metadata of a block parsed earlier in the run: the
+# tree itself is not kept
+_PARSED = object()
+
+
+def block_digest(raw_block: str) -> bytes:
+    """
+    SHA-256 of a metadata block's text.
+    """
+    return hashlib.sha256(raw_block.encode("utf-8")).digest()
+
+
+class BlockDeduplicator:
+    """
+    Run-wide memo of metadata blocks.
+
+    Generated reports, vendored copies and templated documents often
+    carry byte-identical metadata blocks. Metadata is a function of the
+    block alone and diagnostics are a function of the metadata and the
+    schema, so each unique block is parsed once (load_yaml) and
+    validated once per schema (validate); the shared diagnostics are
+    returned under each artifact's own path.
+
+    Only small outcomes are kept, so memory does not grow with the
+    metadata of the tree: the result per block and schema, and the
+    parse error or breached limit per block. A block parsed before
+    loads as a placeholder that validate() answers from its results,
+    parsing the block again only for a schema it has not seen.
+
+    Blocks whose result an incremental run reuses are counted with
+    count_reused(), so `blocks` and `unique` match a full run.
+    """
+
+    def __init__(self, limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS):
+        self.limits = limits
+        # Per block: None or _PARSED, or the error (a limit's details
+        # or None, and the message)
+        self._parsed: Dict[bytes, Tuple[Any, Optional[Tuple[Optional[Dict[str, Any]], str]]]] = {}
+        self._results: Dict[Tuple[Optional[str], bytes, str], ValidationResult] = {}
+        self._seen: Set[Tuple[Optional[str], bytes, str]] = set()
+        self.blocks = 0
+        self.unique = 0
+
+    def load_yaml(self, raw_block: str) -> Any:
+        """
+        Parse a block, or return the earlier outcome for the same block.
+
+        Parse errors and resource limit breaches are memoized too and
+        raised again, with the same message, so every copy of a block
+        reports the same outcome.
+        """
+        digest = block_digest(raw_block)
+        outcome = self._parsed.get(digest)
+        if outcome is None:
+            try:
+                data = load_yaml_block(raw_block, self.limits)
+            except ResourceLimitExceeded as e:
+                self._parsed[digest] = (None, (e.details, str(e)))
+                raise
+            except Exception as e:
+                # Not the exception itself: its traceback would keep the
+                # parser's frames, and the partial tree, alive
+                self._parsed[digest] = (None, (None, str(e)))
+                raise
+            self._parsed[digest] = (None if data is None else _PARSED, None)
+            return data
+
+        data, error = outcome
+        if error is not None:
+            details, message = error
+            if details is not None:
+                raise ResourceLimitExceeded(details["limit"], details["maximum"], message)
+            raise ValueError(message)
+        return data
+
+    def validate(
+        self,
+        *,
+        extracted: ExtractedMetadata,
+        resolved_schema: ResolvedSchema,
+        compute: Callable[..., ValidationResult] = validate_artifact,
+    ) -> ValidationResult:
+        """
+        `compute` (validate_artifact() or a cache in front of it) for the
+        first artifact with a given block and schema; the same
+        result, under its own path, for every later one.
+        """
+        if extracted.raw_block is None:
+            self.blocks += 1
+            self.unique += 1
+            return compute(extracted=extracted, resolved_schema=resolved_schema)
+
+        # The same text may mean different things in YAML, TOML and JSON
+        key = (
+            extracted.block_format,
+            block_digest(extracted.raw_block),
+            resolved_schema.fingerprint,
+        )
+        self._count(key)
+        shared = self._results.get(key)
+        if shared is not None:
+            return dataclasses.replace(shared, artifact_path=extracted.artifact_path)
+
+        if extracted.metadata is _PARSED:
+            # Parsed before, but not validated against this schema
+            extracted = dataclasses.replace(
+                extracted,
+                metadata=load_yaml_block(extracted.raw_block, self.limits),
+            )
+
+        result = compute(extracted=extracted, resolved_schema=resolved_schema)
+        # Kept without the path, which would keep the artifact's Path alive
+        self._results[key] = dataclasses.replace(result, artifact_path=None)
+        return result
+
+    def count_reused(
+        self,
+        block_format: Optional[str],
+        digest: Optional[bytes],
+        resolved_schema: ResolvedSchema,
+    ) -> None:
+        """
+        Count a governed block whose result was reused from an earlier
+        run rather than validated; `digest` is its block_digest(), or
+        None for an artifact without a raw block.
+        """
+        if digest is None:
+            self.blocks += 1
+            self.unique += 1
+            return
+        self._count((block_format, digest, resolved_schema.fingerprint))
+
+    def _count(self, key: Tuple[Optional[str], bytes, str]) -> None:
+        self.blocks += 1
+        if key not in self._seen:
+            self._seen.add(key)
+            self.unique += 1
+
+    @property
+    def ratio(self) -> float:
+        """
+        Validated blocks per unique block (1.0: nothing was shared).
+        """
+        if self.unique == 0:
+            return 1.0
+        return self.blocks / self.unique
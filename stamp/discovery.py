@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-27"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -29,9 +29,16 @@ anchors: []
 
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Union
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from stamp.gitchanges import ChangeSet
+from stamp.gitindex import find_work_tree, read_index
+from stamp.ignore import IGNORE_FILENAMES, IgnoreMatcher
 
 
 EXCLUDED_DIRS = {
@@ -64,9 +71,30 @@ class DiscoveredArtifact:
     - no schema awareness
 
     This defines the epistemic boundary of governable artifacts.
+
+    mtime_ns and inode are carried through from the stat call discovery
+    already made, when it made one; they are None for artifacts
+    enumerated without a stat (e.g. from the git index).
     """
     path: Path
     size_bytes: int
+    mtime_ns: Optional[int] = None
+    inode: Optional[int] = None
+
+
+def _is_excluded_name(name: str) -> bool:
+    """
+    Determine whether a file name alone excludes it from discovery.
+    """
+    # Exact filename exclusions
+    if name in EXCLUDED_FILENAMES:
+        return True
+
+    # Suffix-based exclusions (e.g. execution traces)
+    if any(name.endswith(suffix) for suffix in EXCLUDED_SUFFIXES):
+        return True
+
+    return False
 
 
 def _is_excluded(path: Path) -> bool:
@@ -79,32 +107,128 @@ def _is_excluded(path: Path) -> bool:
     if any(part in EXCLUDED_DIRS for part in path.parts):
         return True
 
-    name = path.name
+    return _is_excluded_name(path.name)
 
-    # Exact filename exclusions
-    if name in EXCLUDED_FILENAMES:
-        return True
 
-    # Suffix-based exclusions (e.g. execution traces)
-    if any(name.endswith(suffix) for suffix in EXCLUDED_SUFFIXES):
-        return True
+def _list_directory(
+    directory: str,
+    matcher: Optional[IgnoreMatcher],
+) -> Tuple[List[os.DirEntry], Optional[IgnoreMatcher]]:
+    """
+    List a directory in deterministic (name-sorted) order, together
+    with the ignore matcher that applies to its entries.
 
-    return False
+    Unreadable directories are treated as empty.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return [], matcher
 
+    entries.sort(key=lambda entry: entry.name)
 
-def discover_artifacts(
-    roots: Iterable[Union[str, Path]]
-) -> List[DiscoveredArtifact]:
+    if matcher is not None:
+        matcher = matcher.descend(directory, [entry.name for entry in entries])
+
+    return entries, matcher
+
+
+def _is_dir_entry(entry: os.DirEntry) -> bool:
     """
-    Recursively discover candidate artifacts starting from given root paths.
+    Directory symlinks are not followed and count as non-directories.
+    """
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
 
-    This function performs filesystem traversal only.
-    It does not parse files, inspect contents, or apply schemas.
 
-    Exclusion rules define the universe of governable artifacts.
+def _admits_dir(entry: os.DirEntry, matcher: Optional[IgnoreMatcher]) -> bool:
     """
-    artifacts: List[DiscoveredArtifact] = []
+    A directory is entered iff it is neither excluded nor ignored.
+    """
+    if entry.name in EXCLUDED_DIRS:
+        return False
+    return not (matcher and matcher.is_ignored(entry.path, is_dir=True))
+
+
+def _file_artifact(
+    entry: os.DirEntry,
+    matcher: Optional[IgnoreMatcher],
+) -> Optional[DiscoveredArtifact]:
+    """
+    Build an artifact from a non-directory entry, or None if the entry
+    is not a regular file or is excluded or ignored.
+    """
+    try:
+        if not entry.is_file():
+            return None
+
+        if _is_excluded_name(entry.name):
+            return None
+
+        if matcher and matcher.is_ignored(entry.path, is_dir=False):
+            return None
+
+        stat = entry.stat()
+    except OSError:
+        return None
+
+    return DiscoveredArtifact(
+        path=Path(entry.path),
+        size_bytes=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        inode=stat.st_ino,
+    )
+
+
+def _walk_directory(
+    root_path: Path,
+    matcher: Optional[IgnoreMatcher],
+) -> Iterator[DiscoveredArtifact]:
+    """
+    Walk a directory tree with os.scandir, pruning excluded and ignored
+    directories before they are entered.
 
+    Traversal is depth-first with entries sorted per directory, so the
+    yield order is deterministic. Only the directories on the current
+    path are held in memory.
+
+    Entry type information comes from the directory listing itself, so
+    only files that survive exclusion cost a stat call. Directory
+    symlinks are not followed.
+    """
+    entries, matcher = _list_directory(os.fspath(root_path), matcher)
+    stack = [(iter(entries), matcher)]
+
+    while stack:
+        it, matcher = stack[-1]
+        entry = next(it, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        if _is_dir_entry(entry):
+            if _admits_dir(entry, matcher):
+                entries, child_matcher = _list_directory(entry.path, matcher)
+                stack.append((iter(entries), child_matcher))
+            continue
+
+        artifact = _file_artifact(entry, matcher)
+        if artifact is not None:
+            yield artifact
+
+
+def _root_units(
+    roots: Iterable[Union[str, Path]],
+    respect_ignore_files: bool,
+) -> Iterator[Union[DiscoveredArtifact, Tuple[Path, Optional[IgnoreMatcher]]]]:
+    """
+    Resolve discovery roots into single-file artifacts and directories
+    to walk (with the ignore matcher inherited from their ancestors),
+    in the order given.
+    """
     for root in roots:
         root_path = Path(root).resolve()
 
@@ -113,38 +237,468 @@ def discover_artifacts(
             if _is_excluded(root_path):
                 continue
             try:
-                artifacts.append(
-                    DiscoveredArtifact(
-                        path=root_path,
-                        size_bytes=root_path.stat().st_size,
-                    )
-                )
+                stat = root_path.stat()
             except OSError:
                 continue
+            yield DiscoveredArtifact(
+                path=root_path,
+                size_bytes=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                inode=stat.st_ino,
+            )
             continue
 
         # Non-directory root
         if not root_path.is_dir():
             continue
 
-        # Directory traversal
-        for path in root_path.rglob("*"):
-            if not path.is_file():
+        # A root inside an excluded directory has nothing governable
+        if any(part in EXCLUDED_DIRS for part in root_path.parts):
+            continue
+
+        matcher = IgnoreMatcher.above(root_path) if respect_ignore_files else None
+        yield root_path, matcher
+
+
+def _select_paths(
+    root_path: Path,
+    work_tree: Path,
+    matcher: Optional[IgnoreMatcher],
+    candidates: Iterable[Tuple[str, Optional[int]]],
+) -> List[DiscoveredArtifact]:
+    """
+    Apply discovery rules to a list of work-tree-relative paths.
+
+    Candidates are (path, size) pairs with '/' separators; a None size
+    is filled in with a stat, and candidates that no longer exist are
+    dropped. Paths outside `root_path` are ignored. Exclusion and
+    ignore rules are applied exactly as the walker applies them, and
+    the result is returned in walker order.
+    """
+    if root_path == work_tree:
+        prefix = ""
+    else:
+        prefix = root_path.relative_to(work_tree).as_posix() + "/"
+
+    # Per-directory decision: (entered, matcher for its entries)
+    dir_states = {"": (True, matcher)}
+
+    def dir_state(rel_dir: str):
+        state = dir_states.get(rel_dir)
+        if state is not None:
+            return state
+
+        parent, _, name = rel_dir.rpartition("/")
+        entered, parent_matcher = dir_state(parent)
+        directory = os.path.join(os.fspath(root_path), *rel_dir.split("/"))
+
+        if not entered or name in EXCLUDED_DIRS:
+            state = (False, None)
+        elif parent_matcher and parent_matcher.is_ignored(directory, is_dir=True):
+            state = (False, None)
+        elif parent_matcher is None:
+            state = (True, None)
+        else:
+            present = [f for f in IGNORE_FILENAMES if os.path.isfile(os.path.join(directory, f))]
+            state = (True, parent_matcher.descend(directory, present))
+
+        dir_states[rel_dir] = state
+        return state
+
+    if matcher is not None:
+        present = [f for f in IGNORE_FILENAMES if (root_path / f).is_file()]
+        dir_states[""] = (True, matcher.descend(os.fspath(root_path), present))
+
+    root_prefix = os.fspath(root_path) + os.sep
+    selected: List[Tuple[List[str], str, Optional[int]]] = []
+
+    for candidate, size in candidates:
+        if not candidate.startswith(prefix):
+            continue
+
+        rel_path = candidate[len(prefix):]
+        rel_dir, _, name = rel_path.rpartition("/")
+
+        if _is_excluded_name(name):
+            continue
+
+        entered, dir_matcher = dir_state(rel_dir)
+        if not entered:
+            continue
+
+        path = root_prefix + (rel_path if os.sep == "/" else rel_path.replace("/", os.sep))
+        if dir_matcher and dir_matcher.is_ignored(path, is_dir=False):
+            continue
+
+        selected.append((rel_path.split("/"), path, size))
+
+    # Git lists paths in byte order of full paths; the walker sorts per directory
+    selected.sort(key=lambda item: item[0])
+
+    artifacts: List[DiscoveredArtifact] = []
+    for _, path, size in selected:
+        if size is not None:
+            artifacts.append(DiscoveredArtifact(path=Path(path), size_bytes=size))
+            continue
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if not os.path.isfile(path):
+            continue
+        artifacts.append(
+            DiscoveredArtifact(
+                path=Path(path),
+                size_bytes=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                inode=stat.st_ino,
+            )
+        )
+
+    return artifacts
+
+
+def _index_artifacts(
+    root_path: Path,
+    matcher: Optional[IgnoreMatcher],
+) -> Optional[List[DiscoveredArtifact]]:
+    """
+    Enumerate artifacts under a directory root from the git index.
+
+    Paths and sizes come straight from the index: no directory listing
+    and no per-file stat. Returns None outside a git work tree or when
+    the index cannot be read, so the caller can fall back to walking.
+    """
+    located = find_work_tree(root_path)
+    if located is None:
+        return None
+    work_tree, git_dir = located
+
+    entries = read_index(git_dir)
+    if entries is None:
+        return None
+
+    return _select_paths(
+        root_path,
+        work_tree,
+        matcher,
+        ((entry.path, entry.size_bytes) for entry in entries),
+    )
+
+
+def _iter_parallel(
+    roots: Iterable[Union[str, Path]],
+    workers: int,
+    respect_ignore_files: bool,
+) -> Iterator[DiscoveredArtifact]:
+    """
+    Walk the top-level subtrees of every root on a bounded thread pool.
+
+    Each subtree is walked serially by one worker; results are yielded
+    in submission order, so the output is identical to a serial walk.
+    At most a small multiple of `workers` subtrees are in flight.
+    """
+    window = workers * 2
+    pending: Deque[Union[DiscoveredArtifact, Future]] = deque()
+    in_flight = 0
+
+    pool = ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="stamp-discovery",
+    )
+
+    def drain_head() -> Iterator[DiscoveredArtifact]:
+        nonlocal in_flight
+        item = pending.popleft()
+        if isinstance(item, Future):
+            in_flight -= 1
+            yield from item.result()
+        else:
+            yield item
+
+    try:
+        for unit in _root_units(roots, respect_ignore_files):
+            if isinstance(unit, DiscoveredArtifact):
+                pending.append(unit)
                 continue
 
-            if _is_excluded(path):
+            root_path, matcher = unit
+            entries, matcher = _list_directory(os.fspath(root_path), matcher)
+
+            for entry in entries:
+                if _is_dir_entry(entry):
+                    if not _admits_dir(entry, matcher):
+                        continue
+                    pending.append(
+                        pool.submit(list, _walk_directory(Path(entry.path), matcher))
+                    )
+                    in_flight += 1
+                else:
+                    artifact = _file_artifact(entry, matcher)
+                    if artifact is None:
+                        continue
+                    pending.append(artifact)
+
+                while in_flight > window:
+                    yield from drain_head()
+
+        while pending:
+            yield from drain_head()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_artifacts(
+    roots: Iterable[Union[str, Path]],
+    *,
+    workers: int = 1,
+    respect_ignore_files: bool = True,
+    from_git_index: bool = False,
+) -> Iterator[DiscoveredArtifact]:
+    """
+    Lazily discover candidate artifacts starting from given root paths.
+
+    Artifacts are yielded as the walk proceeds, in deterministic order:
+    roots in the order given, then depth-first with entries sorted by
+    name within each directory.
+
+    With workers > 1, top-level subtrees of every root are walked on a
+    bounded thread pool. This helps on high-latency filesystems (e.g.
+    NFS) and does not change the yield order.
+
+    This function performs filesystem traversal only.
+    It does not parse files, inspect contents, or apply schemas.
+
+    Exclusion rules define the universe of governable artifacts:
+    the built-in EXCLUDED_* sets plus, unless respect_ignore_files is
+    False, any .gitignore / .stampignore files in the walked tree and
+    its ancestors up to the enclosing git work tree. Excluded and
+    ignored directories are pruned during traversal and never entered.
+
+    With from_git_index, directory roots inside a git work tree are
+    enumerated from the git index instead of the filesystem: only
+    tracked files are candidates and sizes are the index's cached
+    sizes. Roots outside a work tree are walked as usual.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    if from_git_index:
+        for unit in _root_units(roots, respect_ignore_files):
+            if isinstance(unit, DiscoveredArtifact):
+                yield unit
                 continue
+            indexed = _index_artifacts(*unit)
+            if indexed is not None:
+                yield from indexed
+            elif workers > 1:
+                yield from _iter_parallel([unit[0]], workers, respect_ignore_files)
+            else:
+                yield from _walk_directory(*unit)
+        return
 
+    if workers > 1:
+        yield from _iter_parallel(roots, workers, respect_ignore_files)
+        return
+
+    for unit in _root_units(roots, respect_ignore_files):
+        if isinstance(unit, DiscoveredArtifact):
+            yield unit
+        else:
+            yield from _walk_directory(*unit)
+
+
+def iter_changed_artifacts(
+    roots: Iterable[Union[str, Path]],
+    changes: ChangeSet,
+    *,
+    respect_ignore_files: bool = True,
+) -> Iterator[DiscoveredArtifact]:
+    """
+    Discover only the artifacts in a git change set.
+
+    Changed paths are intersected with the roots and with the same
+    exclusion and ignore rules iter_artifacts() applies, and yielded in
+    the same order. Single-file roots are yielded only if changed.
+    """
+    changed = set(changes.paths)
+
+    for unit in _root_units(roots, respect_ignore_files):
+        if isinstance(unit, DiscoveredArtifact):
             try:
-                size = path.stat().st_size
-            except OSError:
+                rel_path = unit.path.relative_to(changes.work_tree).as_posix()
+            except ValueError:
                 continue
+            if rel_path in changed:
+                yield unit
+            continue
 
-            artifacts.append(
-                DiscoveredArtifact(
-                    path=path,
-                    size_bytes=size,
-                )
-            )
+        root_path, matcher = unit
+        if root_path != changes.work_tree and changes.work_tree not in root_path.parents:
+            continue
 
-    return artifacts
+        yield from _select_paths(
+            root_path,
+            changes.work_tree,
+            matcher,
+            ((rel_path, None) for rel_path in changes.paths),
+        )
+
+
+def iter_selected_artifacts(
+    root: Union[str, Path],
+    paths: Iterable[str],
+    *,
+    respect_ignore_files: bool = True,
+) -> List[DiscoveredArtifact]:
+    """
+    The given paths that iter_artifacts([root]) would discover, in
+    walker order, without walking the tree.
+
+    Paths outside `root`, excluded or ignored paths, and paths that are
+    not regular files are dropped.
+    """
+    paths = list(paths)
+    for unit in _root_units([root], respect_ignore_files):
+        if isinstance(unit, DiscoveredArtifact):
+            return [unit] if os.fspath(unit.path) in paths else []
+
+        root_path, matcher = unit
+        candidates = []
+        for path in paths:
+            rel_path = os.path.relpath(path, root_path)
+            if rel_path != os.curdir and not _is_outside(rel_path):
+                candidates.append((rel_path.replace(os.sep, "/"), None))
+        return _select_paths(root_path, root_path, matcher, candidates)
+    return []
+
+
+def _is_outside(rel_path: str) -> bool:
+    return rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep)
+
+
+def _subtree_unit(
+    root: Union[str, Path],
+    directory: Union[str, Path],
+    respect_ignore_files: bool,
+) -> Optional[Tuple[Path, Optional[IgnoreMatcher]]]:
+    """
+    `directory` with the ignore matcher the walker from `root` would
+    enter it with, or None if the walker would never enter it.
+    """
+    for unit in _root_units([root], respect_ignore_files):
+        if isinstance(unit, DiscoveredArtifact):
+            return None
+
+        root_path, matcher = unit
+        rel_path = os.path.relpath(directory, root_path)
+        if rel_path == os.curdir:
+            return root_path, matcher
+        if _is_outside(rel_path):
+            return None
+
+        current = os.fspath(root_path)
+        for name in rel_path.split(os.sep):
+            if matcher is not None:
+                present = [f for f in IGNORE_FILENAMES if os.path.isfile(os.path.join(current, f))]
+                matcher = matcher.descend(current, present)
+            current = os.path.join(current, name)
+            if name in EXCLUDED_DIRS or not os.path.isdir(current) or os.path.islink(current):
+                return None
+            if matcher and matcher.is_ignored(current, is_dir=True):
+                return None
+        return Path(current), matcher
+    return None
+
+
+def iter_subtree_artifacts(
+    root: Union[str, Path],
+    directory: Union[str, Path],
+    *,
+    respect_ignore_files: bool = True,
+) -> Iterator[DiscoveredArtifact]:
+    """
+    Yield the artifacts iter_artifacts([root]) would discover under
+    `directory`, in walker order, without walking the rest of `root`.
+
+    Nothing is yielded if the walker would not enter `directory`
+    (outside `root`, excluded, ignored, or not a directory).
+    """
+    unit = _subtree_unit(root, directory, respect_ignore_files)
+    if unit is not None:
+        yield from _walk_directory(*unit)
+
+
+def iter_directories(
+    roots: Iterable[Union[str, Path]],
+    *,
+    respect_ignore_files: bool = True,
+) -> Iterator[Path]:
+    """
+    Yield every directory the walker would enter under the given roots,
+    roots included, in walker order.
+
+    Used to register filesystem watches on exactly the governable tree.
+    """
+    for unit in _root_units(roots, respect_ignore_files):
+        if isinstance(unit, DiscoveredArtifact):
+            continue
+        yield from _walk_directories(*unit)
+
+
+def iter_subtree_directories(
+    root: Union[str, Path],
+    directory: Union[str, Path],
+    *,
+    respect_ignore_files: bool = True,
+) -> Iterator[Path]:
+    """
+    Yield the directories iter_directories([root]) would yield under
+    `directory`, `directory` included.
+    """
+    unit = _subtree_unit(root, directory, respect_ignore_files)
+    if unit is not None:
+        yield from _walk_directories(*unit)
+
+
+def _walk_directories(root_path: Path, matcher: Optional[IgnoreMatcher]) -> Iterator[Path]:
+    yield root_path
+
+    entries, matcher = _list_directory(os.fspath(root_path), matcher)
+    stack = [(iter(entries), matcher)]
+
+    while stack:
+        it, matcher = stack[-1]
+        entry = next(it, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        if _is_dir_entry(entry) and _admits_dir(entry, matcher):
+            yield Path(entry.path)
+            entries, child_matcher = _list_directory(entry.path, matcher)
+            stack.append((iter(entries), child_matcher))
+
+
+def discover_artifacts(
+    roots: Iterable[Union[str, Path]],
+    *,
+    workers: int = 1,
+    respect_ignore_files: bool = True,
+    from_git_index: bool = False,
+) -> List[DiscoveredArtifact]:
+    """
+    Recursively discover candidate artifacts starting from given root paths.
+
+    Materialized form of iter_artifacts(); see it for ordering and
+    exclusion semantics.
+    """
+    return list(
+        iter_artifacts(
+            roots,
+            workers=workers,
+            respect_ignore_files=respect_ignore_files,
+            from_git_index=from_git_index,
+        )
+    )
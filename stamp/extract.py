@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-27"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -29,31 +29,722 @@ anchors: []
 
 from __future__ import annotations
 
+import codecs
+import functools
+import io
+import itertools
+import json
+import mmap
+import os
+import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import ruamel.yaml
+import ruamel.yaml.composer
+import ruamel.yaml.constructor
+import ruamel.yaml.resolver
+import ruamel.yaml.util
+
+try:
+    import yaml
+    import yaml.composer
+    _CSafeLoader = yaml.CSafeLoader
+except (ImportError, AttributeError):  # PyYAML built without libyaml
+    _CSafeLoader = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
 
 
 @dataclass(frozen=True)
 class ExtractedMetadata:
-    artifact_path: Path
+    # None for in-memory records (stamp.records)
+    artifact_path: Optional[Path]
     metadata: Optional[Any]
     raw_block: Optional[str]
     error: Optional[str]
+    # Set when the file was classified as not worth decoding:
+    # "binary", "oversized" or "unsupported"
+    skip_reason: Optional[str] = None
+    # Language of raw_block: "yaml", "toml" or "json"
+    block_format: Optional[str] = None
+    # Set when the block exceeded a resource limit:
+    # {"limit": <ResourceLimits field>, "maximum": <its value>}
+    limit_exceeded: Optional[Dict[str, Any]] = None
+
+
+SKIP_BINARY = "binary"
+SKIP_OVERSIZED = "oversized"
+SKIP_UNSUPPORTED = "unsupported"
+
+# -----------------------------
+# YAML parser backends
+# -----------------------------
+#
+# Backends take an optional ResourceLimits; the block is held to it
+# while its nodes are composed, before anything is constructed.
+
+class _RuamelComposer(ruamel.yaml.composer.Composer):
+    """
+    ruamel's composer, counting each node against `budget` if set.
+    """
+
+    budget: Optional["_ComposeBudget"] = None
+
+    def compose_node(self, parent, index):
+        if self.budget is None:
+            return super().compose_node(parent, index)
+        return self.budget.compose(super().compose_node, self.parser.peek_event(), parent, index)
+
+
+def _new_ruamel() -> ruamel.yaml.YAML:
+    # Pure: a C parser would compose without the budget
+    loader = ruamel.yaml.YAML(typ="safe", pure=True)
+    loader.Composer = _RuamelComposer
+    return loader
+
+
+_yaml = _new_ruamel()
+
+
+def _load_ruamel(raw_block: str, limits: Optional[ResourceLimits] = None) -> Any:
+    """
+    Reference backend: ruamel.yaml's safe loader (YAML 1.2).
+    """
+    global _yaml
+    _yaml.composer.budget = None if limits is None else _ComposeBudget(limits)
+    try:
+        return _yaml.load(raw_block)
+    except Exception:
+        # A failed load can leave constructor state behind that changes
+        # the next error message; continue with a fresh loader
+        _yaml = _new_ruamel()
+        raise
+
+
+YAML_BACKENDS: Dict[str, Callable[..., Any]] = {"ruamel": _load_ruamel}
+
+
+class _RuamelOnly(Exception):
+    """
+    A construct whose result could differ from ruamel's.
+    """
+
+
+_RUAMEL = ruamel.yaml.constructor.SafeConstructor
+
+
+# Scalar construction as ruamel does it for the YAML 1.2 core tags,
+# shared by the libyaml backend and the flat fast path
+
+def _yaml12_bool(value_s: str) -> bool:
+    return _RUAMEL.bool_values[value_s.lower()]
+
+
+def _yaml12_int(value_s: str) -> int:
+    value_s = value_s.replace("_", "")
+    sign = +1
+    if value_s[0] == "-":
+        sign = -1
+    if value_s[0] in "+-":
+        value_s = value_s[1:]
+    if value_s == "0":
+        return 0
+    if value_s.startswith("0b"):
+        return sign * int(value_s[2:], 2)
+    if value_s.startswith("0x"):
+        return sign * int(value_s[2:], 16)
+    if value_s.startswith("0o"):
+        return sign * int(value_s[2:], 8)
+    return sign * int(value_s)
+
+
+def _yaml12_float(value_s: str) -> float:
+    value_s = value_s.replace("_", "").lower()
+    sign = +1
+    if value_s[0] == "-":
+        sign = -1
+    if value_s[0] in "+-":
+        value_s = value_s[1:]
+    if value_s == ".inf":
+        return sign * _RUAMEL.inf_value
+    if value_s == ".nan":
+        return _RUAMEL.nan_value
+    return sign * float(value_s)
+
+
+def _yaml12_timestamp(value_s: str) -> Any:
+    match = _RUAMEL.timestamp_regexp.match(value_s)
+    if match is None:
+        raise _RuamelOnly("tag:yaml.org,2002:timestamp")
+    return ruamel.yaml.util.create_timestamp(**match.groupdict())
+
+
+if _CSafeLoader is not None:
+
+    # Syntax libyaml reads differently from ruamel's scanner:
+    # directives (%YAML 1.1), anchor or alias names with characters
+    # libyaml stops at, comments glued to |/> headers, tabs, and the
+    # Unicode line breaks libyaml starts a new line at
+    _RUAMEL_ONLY_SYNTAX = re.compile(
+        r"^%"
+        r"|(?:^|[\s\[\]{},])[&*][A-Za-z0-9_-]*[^A-Za-z0-9_\s\[\]{},-]"
+        r"|[|>][-+0-9]*#"
+        r"|[\t\x85\u2028\u2029]",
+        re.M,
+    )
+
+    _MERGE_TAG = "tag:yaml.org,2002:merge"
+    _VALUE_TAG = "tag:yaml.org,2002:value"
+
+    class _LibyamlLoader(yaml.composer.Composer, _CSafeLoader):
+        """
+        libyaml parsing with ruamel's YAML 1.2 resolution rules.
+
+        Scalars are resolved by ruamel's own 1.2 implicit resolvers and
+        constructed the way ruamel constructs them. Merge keys, duplicate
+        keys and the less common collection tags raise _RuamelOnly, so
+        those blocks are left to ruamel.
+
+        libyaml's events are composed in Python, so each node can be
+        counted against `budget`.
+        """
+
+        yaml_implicit_resolvers: Dict[Any, Any] = {}
+
+        def __init__(self, stream, budget: Optional["_ComposeBudget"] = None):
+            _CSafeLoader.__init__(self, stream)
+            yaml.composer.Composer.__init__(self)
+            self.budget = budget
+
+        def compose_node(self, parent, index):
+            if self.budget is None:
+                return super().compose_node(parent, index)
+            return self.budget.compose(super().compose_node, self.peek_event(), parent, index)
+
+        def flatten_mapping(self, node):
+            for key_node, _ in node.value:
+                if key_node.tag in (_MERGE_TAG, _VALUE_TAG):
+                    raise _RuamelOnly(key_node.tag)
+
+        def construct_mapping(self, node, deep=False):
+            mapping = super().construct_mapping(node, deep=deep)
+            if len(mapping) != len(node.value):
+                # ruamel rejects duplicate keys
+                raise _RuamelOnly("duplicate key")
+            return mapping
+
+    def _scalar_constructor(construct):
+        return lambda loader, node: construct(loader.construct_scalar(node))
+
+    def _refuse(loader, node):
+        raise _RuamelOnly(node.tag)
+
+    for _versions, _tag, _regexp, _first in ruamel.yaml.resolver.implicit_resolvers:
+        if (1, 2) in _versions:
+            _LibyamlLoader.add_implicit_resolver(_tag, _regexp, _first)
+
+    _LibyamlLoader.add_constructor("tag:yaml.org,2002:bool", _scalar_constructor(_yaml12_bool))
+    _LibyamlLoader.add_constructor("tag:yaml.org,2002:int", _scalar_constructor(_yaml12_int))
+    _LibyamlLoader.add_constructor("tag:yaml.org,2002:float", _scalar_constructor(_yaml12_float))
+    _LibyamlLoader.add_constructor("tag:yaml.org,2002:timestamp", _scalar_constructor(_yaml12_timestamp))
+    for _tag in ("binary", "omap", "pairs", "set", "value"):
+        _LibyamlLoader.add_constructor(f"tag:yaml.org,2002:{_tag}", _refuse)
+
+    def _load_libyaml(raw_block: str, limits: Optional[ResourceLimits] = None) -> Any:
+        """
+        libyaml backend (PyYAML's C extension).
+
+        Blocks libyaml rejects, and constructs left to ruamel, are
+        re-parsed by ruamel, so values and error messages are always
+        the reference backend's.
+        """
+        if _RUAMEL_ONLY_SYNTAX.search(raw_block):
+            return _load_ruamel(raw_block, limits)
+        loader = _LibyamlLoader(raw_block, None if limits is None else _ComposeBudget(limits))
+        try:
+            return loader.get_single_data()
+        except ResourceLimitExceeded:
+            raise
+        except Exception:
+            return _load_ruamel(raw_block, limits)
+        finally:
+            loader.dispose()
+
+    YAML_BACKENDS["libyaml"] = _load_libyaml
+
+
+# Fastest available backend, used by extract_metadata()
+YAML_BACKEND = "libyaml" if "libyaml" in YAML_BACKENDS else "ruamel"
+
+
+# Metadata must sit at the top of a file; only this much is ever read
+DEFAULT_MAX_HEADER_BYTES = 1024 * 1024
+
+# -----------------------------
+# Resource limits
+# -----------------------------
+
+class ResourceLimitExceeded(Exception):
+    """
+    A metadata block needs more work than ResourceLimits allow.
+    """
+
+    def __init__(self, limit: str, maximum: Any, message: str):
+        super().__init__(message)
+        self.limit = limit
+        self.maximum = maximum
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"limit": self.limit, "maximum": self.maximum}
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """
+    Bounds on the work a single metadata block may cause.
+
+    Node count and nesting depth are measured as if every YAML alias
+    were expanded, since validation walks the expanded structure; an
+    alias expansion bomb is caught without being expanded.
+    `max_parse_seconds` bounds the YAML parse of one block.
+    """
+    max_block_bytes: int = DEFAULT_MAX_HEADER_BYTES
+    max_aliases: int = 1000
+    max_depth: int = 64
+    max_nodes: int = 200_000
+    max_parse_seconds: float = 10.0
+
+    def check_block(self, raw_block: str) -> None:
+        if len(raw_block) * 4 > self.max_block_bytes:
+            size = len(raw_block.encode("utf-8"))
+            if size > self.max_block_bytes:
+                raise ResourceLimitExceeded(
+                    "max_block_bytes",
+                    self.max_block_bytes,
+                    f"Metadata block of {size} bytes exceeds the limit of "
+                    f"{self.max_block_bytes} bytes",
+                )
+
+    def check_tree(self, data: Any) -> None:
+        """
+        Count the nodes and nesting depth of constructed metadata (keys
+        count as nodes, as YAML scalars do).
+        """
+        nodes = 0
+        stack = [(data, 0)]
+        while stack:
+            node, depth = stack.pop()
+            nodes += 1
+            if isinstance(node, dict):
+                nodes += len(node)
+                children = node.values()
+            elif isinstance(node, list):
+                children = node
+            else:
+                continue
+            self._check_depth(depth + 1)
+            self._check_nodes(nodes + len(stack))
+            stack.extend((child, depth + 1) for child in children)
+        self._check_nodes(nodes)
+
+    def _check_aliases(self, aliases: int) -> None:
+        if aliases > self.max_aliases:
+            raise ResourceLimitExceeded(
+                "max_aliases",
+                self.max_aliases,
+                f"Metadata block uses more than {self.max_aliases} YAML aliases",
+            )
+
+    def _check_depth(self, depth: int) -> None:
+        if depth > self.max_depth:
+            raise ResourceLimitExceeded(
+                "max_depth",
+                self.max_depth,
+                f"Metadata nesting exceeds the limit of {self.max_depth} levels",
+            )
+
+    def _check_nodes(self, nodes: int) -> None:
+        if nodes > self.max_nodes:
+            raise ResourceLimitExceeded(
+                "max_nodes",
+                self.max_nodes,
+                f"Metadata exceeds the limit of {self.max_nodes} nodes",
+            )
+
+    def _check_deadline(self, deadline: float) -> None:
+        if time.monotonic() > deadline:
+            raise ResourceLimitExceeded(
+                "max_parse_seconds",
+                self.max_parse_seconds,
+                f"Parsing the metadata block took longer than {self.max_parse_seconds} s",
+            )
+
+
+DEFAULT_RESOURCE_LIMITS = ResourceLimits()
+
+# Composed nodes between wall-clock checks
+_DEADLINE_EVERY = 256
+
+
+class _ComposeBudget:
+    """
+    Holds one YAML block to ResourceLimits while a backend composes it,
+    before anything is constructed. compose() wraps the composer's
+    compose_node(), so nodes are counted in parser event order and an
+    alias counts the expanded size of its anchored node.
+    """
+
+    def __init__(self, limits: ResourceLimits):
+        self.limits = limits
+        self.deadline = time.monotonic() + limits.max_parse_seconds
+        # Open collections: [expanded node count, depth below]
+        self.open: List[List[int]] = []
+        # Anchor -> (expanded node count, depth) of the anchored node
+        self.anchors: Dict[Any, Tuple[int, int]] = {}
+        self.nodes = 0
+        self.aliases = 0
+        self.composed = 0
+
+    def compose(self, compose_node: Callable[[Any, Any], Any], event: Any, parent: Any, index: Any) -> Any:
+        limits = self.limits
+        self.composed += 1
+        if self.composed % _DEADLINE_EVERY == 0:
+            limits._check_deadline(self.deadline)
+
+        kind = type(event).__name__
+        if kind == "ScalarEvent":
+            # Most nodes: no deeper than the collection holding them,
+            # which was checked when it opened
+            node = compose_node(parent, index)
+            self.nodes += 1
+            if event.anchor is not None:
+                self.anchors[event.anchor] = (1, 0)
+            if self.open:
+                self.open[-1][0] += 1
+            limits._check_nodes(self.nodes)
+            return node
 
+        if kind == "AliasEvent":
+            self.aliases += 1
+            limits._check_aliases(self.aliases)
+            node = compose_node(parent, index)
+            size, depth = self.anchors.get(event.anchor, (1, 0))
+            self.nodes += size
+        else:
+            self.open.append([1, 0])
+            self.nodes += 1
+            limits._check_depth(len(self.open))
+            limits._check_nodes(self.nodes)
+            node = compose_node(parent, index)
+            size, depth = self.open.pop()
+            depth += 1
 
-_yaml = ruamel.yaml.YAML(typ="safe")
+        if kind != "AliasEvent" and event.anchor is not None:
+            self.anchors[event.anchor] = (size, depth)
+        if self.open:
+            enclosing = self.open[-1]
+            enclosing[0] += size
+            enclosing[1] = max(enclosing[1], depth)
+        limits._check_depth(len(self.open) + depth)
+        limits._check_nodes(self.nodes)
+        return node
 
 
-def extract_metadata(path: Path) -> ExtractedMetadata:
+# -----------------------------
+# Flat frontmatter fast path
+# -----------------------------
+
+class _NotFlat(Exception):
+    """
+    The block leaves the flat subset; parse it with a YAML backend.
+    """
+
+
+# ruamel's YAML 1.2 implicit resolvers, keyed by first character
+# (None: resolvers tried for every scalar, after the keyed ones)
+_PLAIN_RESOLVERS: Dict[Optional[str], list] = {}
+for _versions, _tag, _regexp, _first in ruamel.yaml.resolver.implicit_resolvers:
+    if (1, 2) in _versions:
+        for _ch in _first or [None]:
+            _PLAIN_RESOLVERS.setdefault(_ch, []).append((_tag, _regexp))
+for _ch in _PLAIN_RESOLVERS:
+    if _ch is not None:
+        _PLAIN_RESOLVERS[_ch] += _PLAIN_RESOLVERS.get(None, [])
+
+_PLAIN_CONSTRUCTORS: Dict[str, Callable[[str], Any]] = {
+    "tag:yaml.org,2002:bool": _yaml12_bool,
+    "tag:yaml.org,2002:int": _yaml12_int,
+    "tag:yaml.org,2002:float": _yaml12_float,
+    "tag:yaml.org,2002:null": lambda value_s: None,
+    "tag:yaml.org,2002:timestamp": _yaml12_timestamp,
+}
+
+# An entry key with nothing but an optional comment after the colon
+_NO_VALUE = object()
+
+_FLAT_ENTRY = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?")
+# YAML caps implicit keys at 1024 characters; longer ones are scanner
+# errors in both backends
+_MAX_IMPLICIT_KEY_CHARS = 1024
+# Keys the entry pattern admits that may resolve to something other
+# than a string (true, False, null, ...)
+_RESOLVABLE_KEY_START = frozenset(
+    _ch for _ch in _PLAIN_RESOLVERS if _ch and (_ch.isalpha() or _ch == "_")
+)
+
+# Characters that open something other than a plain scalar, or that
+# plain scalars in the subset never contain
+_NOT_PLAIN_START = frozenset("[]{},#&*!|>'\"%@`")
+_NOT_PLAIN_ANYWHERE = frozenset("[]{}")
+
+
+def _load_flat(raw_block: str) -> Dict[str, Any]:
+    """
+    Strict parser for the frontmatter most artifacts declare.
+
+    The subset is a top-level mapping of single-line scalars (plain,
+    or quoted without escapes), empty `[]`/`{}` collections, and keys
+    holding one level of such entries, either a mapping (author,
+    maintainer) or a list. Whole-line and trailing comments are
+    allowed.
+
+    Anything else (anchors, tags, flow collections, multi-line
+    scalars, duplicate keys, tabs) raises _NotFlat. Within the subset
+    the result is the same object ruamel builds.
+    """
+    # Tabs, other line breaks, BOMs and control characters
+    if not raw_block.replace("\n", "").replace(" ", "").isprintable():
+        raise _NotFlat()
+
+    result: Dict[str, Any] = {}
+    parent: Optional[str] = None
+    nested: Union[Dict[str, Any], list, None] = None
+    nested_indent = 0
+
+    for line in raw_block.split("\n"):
+        stripped = line.lstrip(" ")
+        if not stripped or stripped[0] == "#":
+            continue
+        indent = len(line) - len(stripped)
+        is_item = stripped[0] == "-" and stripped[1:2] in ("", " ")
+
+        if indent == 0 and not is_item:
+            key, value = _flat_entry(stripped, result)
+            parent, nested = (key, None) if value is _NO_VALUE else (None, None)
+            result[key] = None if value is _NO_VALUE else value
+            continue
+
+        if parent is None:
+            raise _NotFlat()
+        if nested is None:
+            if indent == 0 and not is_item:
+                raise _NotFlat()
+            nested = [] if is_item else {}
+            nested_indent = indent
+            result[parent] = nested
+        elif indent != nested_indent:
+            raise _NotFlat()
+
+        if isinstance(nested, list):
+            if not is_item:
+                raise _NotFlat()
+            value = _flat_value(stripped[1:].lstrip(" "))
+            if value is _NO_VALUE:
+                raise _NotFlat()
+            nested.append(value)
+        else:
+            if is_item:
+                raise _NotFlat()
+            key, value = _flat_entry(stripped, nested)
+            nested[key] = None if value is _NO_VALUE else value
+
+    if not result:
+        raise _NotFlat()
+    return result
+
+
+def _flat_entry(stripped: str, mapping: Dict[str, Any]) -> Tuple[str, Any]:
+    match = _FLAT_ENTRY.fullmatch(stripped)
+    if match is None:
+        raise _NotFlat()
+    key, text = match.groups()
+    if len(key) > _MAX_IMPLICIT_KEY_CHARS:
+        raise _NotFlat()
+    if key in mapping or (key[0] in _RESOLVABLE_KEY_START and not isinstance(_flat_plain(key), str)):
+        raise _NotFlat()
+    return key, _flat_value(text or "")
+
+
+def _flat_value(text: str) -> Any:
+    """
+    A single-line scalar or empty collection; _NO_VALUE if the line
+    holds nothing but an optional comment.
+    """
+    if not text or text[0] == "#":
+        return _NO_VALUE
+
+    quote = text[0]
+    if quote in "\"'":
+        end = text.find(quote, 1)
+        if end == -1:
+            raise _NotFlat()
+        value, rest = text[1:end], text[end + 1:].rstrip(" ")
+        if rest and not rest.startswith(" #"):
+            raise _NotFlat()
+        if "\\" in value:
+            raise _NotFlat()
+        return value
+
+    comment = text.find(" #")
+    if comment != -1:
+        text = text[:comment]
+    text = text.rstrip(" ")
+
+    if text == "[]":
+        return []
+    if text == "{}":
+        return {}
+    if (
+        text[0] in _NOT_PLAIN_START
+        or (text[0] in "-?:" and text[1:2] in ("", " "))
+        or ": " in text
+        or text.endswith(":")
+        or not _NOT_PLAIN_ANYWHERE.isdisjoint(text)
+    ):
+        raise _NotFlat()
+    return _flat_plain(text)
+
+
+def _flat_plain(text: str) -> Any:
+    """
+    Resolve and construct a plain scalar with ruamel's 1.2 rules.
+    """
+    resolvers = _PLAIN_RESOLVERS.get(text[0])
+    if resolvers is None:
+        resolvers = _PLAIN_RESOLVERS.get(None, [])
+    for tag, regexp in resolvers:
+        if regexp.match(text):
+            construct = _PLAIN_CONSTRUCTORS.get(tag)
+            if construct is None:
+                raise _NotFlat()
+            try:
+                return construct(text)
+            except Exception:
+                raise _NotFlat()
+    return text
+
+
+def load_yaml_block(raw_block: str, limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS) -> Any:
+    """
+    Parse a YAML metadata block: the flat fast path, falling back to
+    the configured backend, which holds the block to `limits` as it
+    composes it.
+
+    Raises ResourceLimitExceeded for a block over a limit, and the
+    backend's error for invalid YAML.
+    """
+    try:
+        data = _load_flat(raw_block)
+    except _NotFlat:
+        return YAML_BACKENDS[YAML_BACKEND](raw_block, limits)
+
+    # Flat metadata has no aliases and at most two levels
+    limits.check_tree(data)
+    return data
+
+_FIRST_READ_BYTES = 8 * 1024
+
+# Leading bytes of common binary formats found next to documents
+_BINARY_MAGIC = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",        # JPEG
+    b"GIF87a",
+    b"GIF89a",
+    b"%PDF-",
+    b"PK\x03\x04",          # zip, docx/xlsx, jar, torch checkpoints
+    b"\x1f\x8b",            # gzip
+    b"BZh",                 # bzip2
+    b"\xfd7zXZ\x00",        # xz
+    b"\x28\xb5\x2f\xfd",    # zstd
+    b"7z\xbc\xaf\x27\x1c",
+    b"PAR1",                # Parquet
+    b"\x89HDF\r\n\x1a\n",   # HDF5
+    b"\x7fELF",
+    b"\x93NUMPY",
+    b"SQLite format 3\x00",
+)
+
+# First tokens of the metadata forms; a block opening with one of them
+# is always decoded, even if it contains NUL bytes
+_METADATA_OPENERS = ("---", "+++", "<!--", '"""', "'''")
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+@functools.lru_cache(maxsize=None)
+def _delimiter_patterns(delimiter: str) -> Tuple["re.Pattern[bytes]", "re.Pattern[bytes]"]:
+    """
+    Byte lines that may strip to a frontmatter delimiter ("---", "+++")
+    with only ASCII whitespace or non-ASCII (possibly Unicode
+    whitespace) bytes between it and a possible str.splitlines()
+    boundary on either side. This over-approximates; candidates are
+    confirmed on the decoded line.
+
+    Returns the pattern for a delimiter line at the start of the file,
+    and the pattern for one after a line break. The latter consumes the
+    leading boundary byte (last byte of a line break) instead of
+    looking behind: a literal first character lets the regex engine
+    skip ahead.
+    """
+    body = (
+        rb"[ \t\x0b\x0c\x1c-\x1f\x80-\xff]*(" + re.escape(delimiter.encode("utf-8")) + rb")"
+        rb"[ \t\x0b\x0c\x1c-\x1f\x80-\xff]*?(?=[\r\n\x0b\x0c\x1c-\x1e\xc2\xe2]|\Z)"
+    )
+    return (
+        re.compile(body),
+        re.compile(rb"[\r\n\x0b\x0c\x1c-\x1e\x85\xa8\xa9]" + body),
+    )
+
+
+def extract_metadata(
+    path: Path,
+    *,
+    max_header_bytes: int = DEFAULT_MAX_HEADER_BYTES,
+    max_file_bytes: Optional[int] = None,
+    size_bytes: Optional[int] = None,
+    limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS,
+    load_yaml: Optional[Callable[[str], Any]] = None,
+    sniff_unknown: bool = False,
+    extractors: Optional[Mapping[str, Extractor]] = None,
+    sniff_frontmatter: bool = False,
+) -> ExtractedMetadata:
     """
     Extract metadata from an artifact.
 
-    Deterministic priority rules:
+    Each file is handled by exactly one extractor, chosen from
+    `extractors` (default EXTRACTORS) by suffix (see extractor_for()).
+    Files without a suffix are matched by their first characters
+    against SIGNATURES (comment and docstring forms), and, with
+    `sniff_frontmatter`, FRONTMATTER_SIGNATURES. Files whose suffix has
+    no extractor are skipped unread with `skip_reason` "unsupported",
+    unless `sniff_unknown` is set (explicitly named artifacts), in
+    which case they are matched like files without a suffix.
+
+    Head extractors apply deterministic priority rules, e.g. for
+    Markdown:
 
-      1. Markdown YAML frontmatter (if present)
+      1. YAML (---) or TOML (+++) frontmatter (if present)
          - If valid: returned immediately
          - If malformed: error returned, no fallback
 
@@ -62,22 +753,304 @@ def extract_metadata(path: Path) -> ExtractedMetadata:
          - Used only if no frontmatter exists
 
       3. No metadata
+
+    Only the head of the file is read: reading stops as soon as the
+    first content rules out metadata or the metadata block is closed.
+    A block that is not closed within `max_header_bytes` is an error.
+
+    Files are classified before anything is decoded. Files larger than
+    `max_file_bytes` (if set) are skipped unread, and files whose first
+    block looks binary are skipped after that block; both come back
+    without metadata and with `skip_reason` set. `size_bytes` (e.g. from
+    discovery) saves a stat call.
+
+    Most files are settled by their first block. Otherwise the file is
+    memory-mapped and searched for the block terminator as bytes, so
+    only the metadata slice is decoded; files that cannot be mapped are
+    read in growing chunks instead.
+
+    Metadata blocks are held to `limits` (size, YAML aliases, nesting
+    depth, node count, parse time). A block that exceeds one comes back
+    without metadata and with `limit_exceeded` set.
+
+    `load_yaml` parses YAML metadata blocks (default: the flat fast path
+    and YAML backend, held to `limits`); a run may pass a memoizing
+    loader so identical blocks are parsed once.
     """
+    if load_yaml is None:
+        load_yaml = functools.partial(load_yaml_block, limits=limits)
+    parsing = _Parsing(load_yaml, limits)
+
+    extractor = extractor_for(path, EXTRACTORS if extractors is None else extractors)
+    if extractor is None and path.suffix and not sniff_unknown:
+        return _skipped(path, SKIP_UNSUPPORTED)
+
+    try:
+        with open(path, "rb", buffering=0) as f:
+            if max_file_bytes is not None:
+                if size_bytes is None:
+                    size_bytes = os.fstat(f.fileno()).st_size
+                if size_bytes > max_file_bytes:
+                    return _skipped(path, SKIP_OVERSIZED)
+
+            block = f.read(min(_FIRST_READ_BYTES, max_header_bytes))
+            if _looks_binary(block):
+                return _skipped(path, SKIP_BINARY)
 
-    # Markdown frontmatter has absolute priority
-    if path.suffix.lower() == ".md":
-        md_result = _extract_markdown_frontmatter(path)
+            if extractor is not None and extractor.read_document is not None:
+                return extractor.read_document(path, block, f, max_header_bytes, limits)
+
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(),
+                translate=True,
+            )
+            text = decoder.decode(block, final=not block)
+
+            if extractor is None:
+                extractor = _sniff(text, complete=not block, frontmatter=sniff_frontmatter)
+                if extractor is None:
+                    return _no_metadata(path)
+
+            parsers = extractor.head_parsers
+            result = _parse_head(path, text, not block, parsers, parsing)
+            if isinstance(result, ExtractedMetadata):
+                return result
+
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Pipes, special files, platforms without mmap
+                return _scan_buffered(
+                    path, f, decoder, text, len(block), parsers, max_header_bytes, parsing,
+                )
+
+            with mapped:
+                return _scan_mapped(
+                    path, mapped, decoder, text, len(block), result, parsers, max_header_bytes,
+                    parsing,
+                )
+    except Exception as e:
+        return ExtractedMetadata(
+            artifact_path=path,
+            metadata=None,
+            raw_block=None,
+            error=str(e),
+        )
+
+
+@dataclass(frozen=True)
+class _NeedMore:
+    """
+    The outcome depends on content not decoded yet.
+
+    `terminator` is the text whose next occurrence can settle it (None:
+    any further content may), and `unterminated` is the outcome if the
+    rest of the file does not contain it. With `whole_line`, only a line
+    that is the terminator once stripped counts.
+    """
+    terminator: Optional[str] = None
+    unterminated: Optional[ExtractedMetadata] = None
+    whole_line: bool = False
+
+
+_HeadResult = Union[ExtractedMetadata, _NeedMore]
+
+
+@dataclass(frozen=True)
+class _Parsing:
+    """
+    How settled blocks are parsed: the YAML loader and the limits every
+    block is held to.
+    """
+    load_yaml: Callable[[str], Any]
+    limits: ResourceLimits
 
-        # Frontmatter exists (valid or invalid)
-        if md_result.raw_block is not None or md_result.error is not None:
-            return md_result
+# (path, text, complete, parsing) -> outcome, or None if the form the
+# parser looks for is absent
+HeadParser = Callable[[Path, str, bool, "_Parsing"], Optional[_HeadResult]]
 
-    # Fallback: HTML comment metadata (raw or docstring-wrapped)
-    html_result = _extract_html_comment_metadata(path)
-    if html_result.metadata is not None or html_result.error is not None:
-        return html_result
+
+def _scan_buffered(
+    path: Path,
+    f,
+    decoder: io.IncrementalNewlineDecoder,
+    text: str,
+    read_bytes: int,
+    parsers: Tuple[HeadParser, ...],
+    max_header_bytes: int,
+    parsing: _Parsing,
+) -> ExtractedMetadata:
+    """
+    Keep reading in doubling chunks until the head is settled.
+    """
+    chunk_size = 2 * _FIRST_READ_BYTES
+
+    while read_bytes < max_header_bytes:
+        chunk = f.read(min(chunk_size, max_header_bytes - read_bytes))
+        read_bytes += len(chunk)
+        complete = not chunk
+        text += decoder.decode(chunk, final=complete)
+
+        result = _parse_head(path, text, complete, parsers, parsing)
+        if isinstance(result, ExtractedMetadata):
+            return result
+
+        chunk_size *= 2
+
+    return _header_too_large(path, max_header_bytes)
+
+
+def _scan_mapped(
+    path: Path,
+    mapped: mmap.mmap,
+    decoder: io.IncrementalNewlineDecoder,
+    text: str,
+    pos: int,
+    need: _NeedMore,
+    parsers: Tuple[HeadParser, ...],
+    max_header_bytes: int,
+    parsing: _Parsing,
+) -> ExtractedMetadata:
+    """
+    Settle the head of a memory-mapped file.
+
+    The bytes are searched for the terminator the parsers are waiting
+    for; only the span up to the end of the line holding the next
+    candidate is decoded. Spans at least double, so files with many
+    false candidates are still parsed a logarithmic number of times.
+    """
+    size = len(mapped)
+    limit = min(size, max_header_bytes)
+
+    while True:
+        if pos >= limit:
+            if size > limit:
+                return _header_too_large(path, max_header_bytes)
+            text += decoder.decode(b"", final=True)
+            return _parse_head(path, text, True, parsers, parsing)
+
+        # A terminator may start on the line that is still incomplete
+        start = mapped.rfind(b"\n", 0, pos) + 1
+
+        if need.terminator is None:
+            found = pos
+        else:
+            found = _find_terminator(mapped, need, start, limit)
+            if found == -1:
+                if size > limit:
+                    return _header_too_large(path, max_header_bytes)
+                return need.unterminated
+            found += len(need.terminator)
+
+        end = mapped.find(b"\n", found, limit)
+        end = limit if end == -1 else end + 1
+        end = max(end, min(limit, 2 * pos))
+
+        text += decoder.decode(mapped[pos:end])
+        pos = end
+
+        result = _parse_head(path, text, False, parsers, parsing)
+        if isinstance(result, ExtractedMetadata):
+            return result
+        need = result
+
+
+def _find_terminator(mapped: mmap.mmap, need: _NeedMore, start: int, limit: int) -> int:
+    """
+    Offset of the next occurrence of `need.terminator` in the mapped
+    bytes, skipping lines that cannot be a delimiter line. Returns -1
+    if there is none before `limit`.
+    """
+    if not need.whole_line:
+        return mapped.find(need.terminator.encode("utf-8"), start, limit)
+
+    at_start, after_break = _delimiter_patterns(need.terminator)
+    candidates = after_break.finditer(mapped, max(start - 1, 0), limit)
+    if start == 0:
+        candidates = itertools.chain(
+            filter(None, [at_start.match(mapped, 0, limit)]),
+            candidates,
+        )
+
+    for match in candidates:
+        found = match.start(1)
+        line_start = mapped.rfind(b"\n", 0, found) + 1
+        line_end = mapped.find(b"\n", found, limit)
+        if line_end == -1:
+            # Runs into the header limit: let the parser decide
+            return found
+
+        # A byte line may hold several str.splitlines() lines
+        line = mapped[line_start:line_end].decode("utf-8", errors="replace")
+        if any(part.strip() == need.terminator for part in line.splitlines()):
+            return found
+
+    return -1
+
+
+def _looks_binary(block: bytes) -> bool:
+    """
+    Classify a file by its first block: a known binary signature, or a
+    NUL byte in a block that does not open a metadata form.
+    """
+    if block.startswith(_BINARY_MAGIC):
+        return True
+    if b"\x00" not in block:
+        return False
+    head = block.decode("utf-8", errors="replace").lstrip()
+    return not head.startswith(_METADATA_OPENERS)
+
+
+def _skipped(path: Path, reason: str) -> ExtractedMetadata:
+    return ExtractedMetadata(
+        artifact_path=path,
+        metadata=None,
+        raw_block=None,
+        error=None,
+        skip_reason=reason,
+    )
+
+
+def _error(path: Path, message: str) -> ExtractedMetadata:
+    return ExtractedMetadata(
+        artifact_path=path,
+        metadata=None,
+        raw_block=None,
+        error=message,
+    )
+
+
+def _header_too_large(path: Path, max_header_bytes: int) -> ExtractedMetadata:
+    return _error(
+        path,
+        f"Metadata block exceeds the maximum header size of {max_header_bytes} bytes",
+    )
+
+
+def _parse_head(
+    path: Path,
+    text: str,
+    complete: bool,
+    parsers: Tuple[HeadParser, ...],
+    parsing: _Parsing,
+) -> _HeadResult:
+    """
+    Apply the priority rules to the head of a file: the first parser
+    whose form is present decides.
+
+    `complete` is True when `text` is the whole file. Returns _NeedMore
+    when the outcome depends on content that has not been decoded yet.
+    """
+    for parse in parsers:
+        result = parse(path, text, complete, parsing)
+        if result is not None:
+            return result
 
     # No metadata found
+    return _no_metadata(path)
+
+
+def _no_metadata(path: Path) -> ExtractedMetadata:
     return ExtractedMetadata(
         artifact_path=path,
         metadata=None,
@@ -86,63 +1059,134 @@ def extract_metadata(path: Path) -> ExtractedMetadata:
     )
 
 
-def _extract_markdown_frontmatter(path: Path) -> ExtractedMetadata:
+def load_block(
+    path: Optional[Path],
+    raw_block: str,
+    load: Callable[[str], Any],
+    block_format: str,
+    limits: ResourceLimits,
+) -> ExtractedMetadata:
     """
-    Extract YAML frontmatter from a Markdown file.
+    Extracted metadata for a metadata block already cut from its file
+    (`path`, or None for an in-memory record), parsed with `load`
+    (e.g. load_yaml_block, load_toml_block, json.loads).
 
-    Frontmatter must be the first block in the file.
+    The block is held to `limits`. Parse errors and exceeded limits
+    are returned in the result rather than raised.
     """
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as e:
+        limits.check_block(raw_block)
+        data = load(raw_block)
+        if block_format != "yaml":
+            # YAML backends check the block while composing it
+            limits.check_tree(data)
+    except ResourceLimitExceeded as e:
         return ExtractedMetadata(
             artifact_path=path,
             metadata=None,
-            raw_block=None,
+            raw_block=raw_block,
             error=str(e),
+            block_format=block_format,
+            limit_exceeded=e.details,
         )
-
-    lines = text.splitlines()
-
-    if not lines or lines[0].strip() != "---":
+    except Exception as e:
         return ExtractedMetadata(
             artifact_path=path,
             metadata=None,
-            raw_block=None,
-            error=None,
+            raw_block=raw_block,
+            error=str(e),
+            block_format=block_format,
         )
 
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            raw_block = "\n".join(lines[1:i])
-            try:
-                data = _yaml.load(raw_block)
-            except Exception as e:
-                return ExtractedMetadata(
-                    artifact_path=path,
-                    metadata=None,
-                    raw_block=raw_block,
-                    error=str(e),
-                )
-
-            return ExtractedMetadata(
-                artifact_path=path,
-                metadata=data,
-                raw_block=raw_block,
-                error=None,
-            )
-
     return ExtractedMetadata(
         artifact_path=path,
-        metadata=None,
-        raw_block=None,
-        error="Unterminated YAML frontmatter block",
+        metadata=data,
+        raw_block=raw_block,
+        error=None,
+        block_format=block_format,
     )
 
 
-def _extract_html_comment_metadata(path: Path) -> ExtractedMetadata:
+def load_toml_block(raw_block: str) -> Any:
+    """
+    Parse a TOML metadata block.
+    """
+    if tomllib is None:
+        raise RuntimeError("TOML frontmatter requires Python 3.11+ or the tomli package")
+    return tomllib.loads(raw_block)
+
+
+def _parse_yaml_frontmatter(
+    path: Path,
+    text: str,
+    complete: bool,
+    parsing: _Parsing,
+) -> Optional[_HeadResult]:
+    """
+    YAML frontmatter between "---" lines.
     """
-    Extract metadata from an HTML comment block at the top of a file.
+    return _parse_frontmatter(path, text, complete, "---", "yaml", parsing.load_yaml, parsing.limits)
+
+
+def _parse_toml_frontmatter(
+    path: Path,
+    text: str,
+    complete: bool,
+    parsing: _Parsing,
+) -> Optional[_HeadResult]:
+    """
+    TOML frontmatter between "+++" lines.
+    """
+    return _parse_frontmatter(path, text, complete, "+++", "toml", load_toml_block, parsing.limits)
+
+
+def _parse_frontmatter(
+    path: Path,
+    text: str,
+    complete: bool,
+    delimiter: str,
+    block_format: str,
+    load: Callable[[str], Any],
+    limits: ResourceLimits,
+) -> Optional[_HeadResult]:
+    """
+    Extract frontmatter from the head of a file.
+
+    Frontmatter must be the first block in the file.
+    """
+    lines = text.splitlines()
+
+    partial = None
+    if not complete and text and text[-1] not in _LINE_BREAKS:
+        # The last line may continue in the unread part of the file
+        partial = lines.pop()
+
+    if not lines:
+        if partial is not None and delimiter.startswith(partial.strip()):
+            return _NeedMore()
+        return None
+
+    if lines[0].strip() != delimiter:
+        return None
+
+    for i in range(1, len(lines)):
+        if lines[i].strip() == delimiter:
+            return load_block(path, "\n".join(lines[1:i]), load, block_format, limits)
+
+    unterminated = _error(path, f"Unterminated {block_format.upper()} frontmatter block")
+    if not complete:
+        return _NeedMore(delimiter, unterminated, whole_line=True)
+    return unterminated
+
+
+def _parse_html_comment_metadata(
+    path: Path,
+    text: str,
+    complete: bool,
+    parsing: _Parsing,
+) -> Optional[_HeadResult]:
+    """
+    Extract metadata from an HTML comment block at the head of a file.
 
     Supported forms (must be first non-whitespace content):
 
@@ -156,65 +1200,244 @@ def _extract_html_comment_metadata(path: Path) -> ExtractedMetadata:
       <!-- ... -->
       '''
     """
-    try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as e:
-        return ExtractedMetadata(
-            artifact_path=path,
-            metadata=None,
-            raw_block=None,
-            error=str(e),
-        )
-
     stripped = text.lstrip()
 
+    # Too little content yet to recognise an opening token
+    if not complete and len(stripped) < len("<!--"):
+        return _NeedMore()
+
     # Unwrap top-level docstring if present
     for quote in ('"""', "'''"):
         if stripped.startswith(quote):
             end = stripped.find(quote, len(quote))
             if end == -1:
-                return ExtractedMetadata(
-                    artifact_path=path,
-                    metadata=None,
-                    raw_block=None,
-                    error="Unterminated docstring metadata block",
-                )
+                unterminated = _error(path, "Unterminated docstring metadata block")
+                if not complete:
+                    return _NeedMore(quote, unterminated)
+                return unterminated
             stripped = stripped[len(quote):end].lstrip()
+            # The whole docstring has been read
+            complete = True
             break
 
     # Expect HTML comment at top
     if not stripped.startswith("<!--"):
-        return ExtractedMetadata(
-            artifact_path=path,
-            metadata=None,
-            raw_block=None,
-            error=None,
-        )
+        return None
 
     end_idx = stripped.find("-->")
     if end_idx == -1:
-        return ExtractedMetadata(
-            artifact_path=path,
-            metadata=None,
-            raw_block=None,
-            error="Unterminated HTML comment metadata block",
-        )
+        unterminated = _error(path, "Unterminated HTML comment metadata block")
+        if not complete:
+            return _NeedMore("-->", unterminated)
+        return unterminated
 
-    raw_block = stripped[4:end_idx].strip()
+    result = load_block(path, stripped[4:end_idx].strip(), parsing.load_yaml, "yaml", parsing.limits)
+    if result.metadata is None and result.error is None:
+        # An empty comment declares nothing
+        return None
+    return result
 
-    try:
-        data = _yaml.load(raw_block)
-    except Exception as e:
-        return ExtractedMetadata(
-            artifact_path=path,
-            metadata=None,
-            raw_block=raw_block,
-            error=str(e),
-        )
 
-    return ExtractedMetadata(
-        artifact_path=path,
-        metadata=data,
-        raw_block=raw_block,
-        error=None,
-    )
+# -----------------------------
+# Whole-document extractors
+# -----------------------------
+
+# Key under a notebook's top-level metadata that holds artifact metadata
+NOTEBOOK_METADATA_KEY = "stamp"
+
+
+def _read_whole(block: bytes, f, max_header_bytes: int) -> Optional[bytes]:
+    """
+    The whole file, given its first block, or None if it is longer
+    than `max_header_bytes`.
+    """
+    data = block + f.read(max_header_bytes - len(block) + 1) if block else block
+    if len(data) > max_header_bytes:
+        return None
+    return data
+
+
+def _read_notebook(
+    path: Path,
+    block: bytes,
+    f,
+    max_header_bytes: int,
+    limits: ResourceLimits,
+) -> ExtractedMetadata:
+    """
+    Jupyter notebook: metadata lives under the notebook's top-level
+    `metadata` object, at NOTEBOOK_METADATA_KEY. nbformat writes that
+    object after the cells, so the whole file is read, within
+    `max_header_bytes`.
+    """
+    data = _read_whole(block, f, max_header_bytes)
+    if data is None:
+        return _header_too_large(path, max_header_bytes)
+    notebook = json.loads(data.decode("utf-8"))
+
+    metadata = None
+    if isinstance(notebook, dict) and isinstance(notebook.get("metadata"), dict):
+        metadata = notebook["metadata"].get(NOTEBOOK_METADATA_KEY)
+    if metadata is None:
+        return _no_metadata(path)
+
+    raw_block = json.dumps(metadata, indent=2, ensure_ascii=False)
+    return load_block(path, raw_block, json.loads, "json", limits)
+
+
+def _read_sidecar(
+    path: Path,
+    block: bytes,
+    f,
+    max_header_bytes: int,
+    limits: ResourceLimits,
+) -> ExtractedMetadata:
+    """
+    JSON sidecar (`<name>.stamp.json`): the whole file is the metadata
+    of `<name>`, which may itself be in a format that cannot carry any.
+    The sidecar is the governed artifact.
+    """
+    data = _read_whole(block, f, max_header_bytes)
+    if data is None:
+        return _header_too_large(path, max_header_bytes)
+
+    return load_block(path, data.decode("utf-8"), json.loads, "json", limits)
+
+
+# -----------------------------
+# Extractor registry
+# -----------------------------
+
+@dataclass(frozen=True)
+class Extractor:
+    """
+    How metadata is found in one kind of file.
+
+    Head extractors look for a block at the top of a text file: their
+    `head_parsers` are tried in priority order and the first one whose
+    form is present decides. Document extractors parse the whole file
+    with `read_document(path, first_block, f, max_header_bytes, limits)`
+    instead.
+    """
+    name: str
+    head_parsers: Tuple[HeadParser, ...] = ()
+    read_document: Optional[Callable[..., ExtractedMetadata]] = None
+
+
+MARKDOWN_EXTRACTOR = Extractor(
+    "markdown",
+    head_parsers=(_parse_yaml_frontmatter, _parse_toml_frontmatter, _parse_html_comment_metadata),
+)
+COMMENT_EXTRACTOR = Extractor("comment", head_parsers=(_parse_html_comment_metadata,))
+NOTEBOOK_EXTRACTOR = Extractor("notebook", read_document=_read_notebook)
+SIDECAR_EXTRACTOR = Extractor("sidecar", read_document=_read_sidecar)
+
+# Extractors by name, for registrations such as `--extractor .vue=comment`
+EXTRACTOR_NAMES: Dict[str, Extractor] = {
+    extractor.name: extractor
+    for extractor in (MARKDOWN_EXTRACTOR, COMMENT_EXTRACTOR, NOTEBOOK_EXTRACTOR, SIDECAR_EXTRACTOR)
+}
+
+# Registered under this key, an extractor reads every file whose suffix
+# has no extractor of its own
+ANY_SUFFIX = "*"
+
+# Lower-case suffix (possibly compound, e.g. ".stamp.json") -> extractor.
+# Register further formats here or with with_extractors(); files with
+# other suffixes are skipped.
+EXTRACTORS: Dict[str, Extractor] = {
+    ".md": MARKDOWN_EXTRACTOR,
+    ".markdown": MARKDOWN_EXTRACTOR,
+    ".mdx": MARKDOWN_EXTRACTOR,
+    ".qmd": MARKDOWN_EXTRACTOR,
+    ".rmd": MARKDOWN_EXTRACTOR,
+    ".py": COMMENT_EXTRACTOR,
+    ".pyi": COMMENT_EXTRACTOR,
+    ".html": COMMENT_EXTRACTOR,
+    ".htm": COMMENT_EXTRACTOR,
+    ".xhtml": COMMENT_EXTRACTOR,
+    ".xml": COMMENT_EXTRACTOR,
+    ".svg": COMMENT_EXTRACTOR,
+    ".txt": COMMENT_EXTRACTOR,
+    ".ipynb": NOTEBOOK_EXTRACTOR,
+    ".stamp.json": SIDECAR_EXTRACTOR,
+}
+
+# Opening characters -> extractor, for files without a suffix
+SIGNATURES: List[Tuple[str, Extractor]] = [
+    ("<!--", COMMENT_EXTRACTOR),
+    ('"""', COMMENT_EXTRACTOR),
+    ("'''", COMMENT_EXTRACTOR),
+]
+
+# Also matched with `sniff_frontmatter`. Off by default: suffixless
+# dotfiles such as .clang-format are YAML documents opening with ---.
+FRONTMATTER_SIGNATURES: List[Tuple[str, Extractor]] = [
+    ("---", MARKDOWN_EXTRACTOR),
+    ("+++", MARKDOWN_EXTRACTOR),
+]
+
+
+def extractor_for(path: Path, extractors: Mapping[str, Extractor] = EXTRACTORS) -> Optional[Extractor]:
+    """
+    The extractor registered for a path's suffix; the longest
+    registered compound suffix wins. A path with an unregistered
+    suffix gets the ANY_SUFFIX extractor, if there is one.
+    """
+    suffixes = path.suffixes
+    for i in range(len(suffixes)):
+        extractor = extractors.get("".join(suffixes[i:]).lower())
+        if extractor is not None:
+            return extractor
+    if suffixes:
+        return extractors.get(ANY_SUFFIX)
+    return None
+
+
+def extractor_table(extractors: Mapping[str, Extractor] = EXTRACTORS) -> Dict[str, str]:
+    """
+    Registered suffixes and extractor names, e.g. for cache contexts.
+    """
+    return {suffix: extractor.name for suffix, extractor in sorted(extractors.items())}
+
+
+def with_extractors(
+    registrations: Iterable[str],
+    extractors: Mapping[str, Extractor] = EXTRACTORS,
+) -> Dict[str, Extractor]:
+    """
+    A copy of `extractors` with `SUFFIX=NAME` registrations added, e.g.
+    ".vue=comment", or "*=comment" for every unregistered suffix.
+    NAME is a key of EXTRACTOR_NAMES.
+
+    Raises ValueError for a malformed registration or unknown name.
+    """
+    table = dict(extractors)
+    for registration in registrations:
+        suffix, sep, name = registration.partition("=")
+        suffix = suffix.strip().lower()
+        name = name.strip()
+        if not sep or not (suffix == ANY_SUFFIX or (suffix.startswith(".") and len(suffix) > 1)):
+            raise ValueError(f"Expected SUFFIX=NAME (e.g. .vue=comment), got {registration!r}")
+        if name not in EXTRACTOR_NAMES:
+            raise ValueError(
+                f"Unknown extractor {name!r} (expected one of: {', '.join(sorted(EXTRACTOR_NAMES))})"
+            )
+        table[suffix] = EXTRACTOR_NAMES[name]
+    return table
+
+
+def _sniff(text: str, complete: bool, frontmatter: bool = False) -> Optional[Extractor]:
+    """
+    Match the head of a file without a suffix against SIGNATURES (and
+    FRONTMATTER_SIGNATURES with `frontmatter`).
+    """
+    signatures = FRONTMATTER_SIGNATURES + SIGNATURES if frontmatter else SIGNATURES
+    stripped = text.lstrip()
+    for signature, extractor in signatures:
+        if stripped.startswith(signature):
+            return extractor
+    if not complete and len(stripped) < max(len(signature) for signature, _ in signatures):
+        # Too little content to tell; every head form is still possible
+        return MARKDOWN_EXTRACTOR if frontmatter else COMMENT_EXTRACTOR
+    return None
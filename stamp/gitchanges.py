@@ -0,0 +1,115 @@
+"""
+<!--
+title: "Stamp — Git Change Set Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-16"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of changed-path collection via the local git client, with human-defined scope rules, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+from stamp.gitindex import find_work_tree
+
+
+class GitError(RuntimeError):
+    """
+    Raised when a change set cannot be computed with the local git.
+    """
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """
+    Paths changed relative to the merge base of `since` and HEAD.
+
+    `paths` are relative to `work_tree`, use '/' separators, and cover
+    committed, staged and unstaged changes (renames by their new path)
+    plus untracked, non-ignored files. Deleted paths are not included.
+    """
+    work_tree: Path
+    since: str
+    merge_base: str
+    paths: Tuple[str, ...]
+
+
+def collect_changes(path: Path, since: str) -> ChangeSet:
+    """
+    Ask the local git which files changed since `since` for the work
+    tree containing `path`.
+    """
+    located = find_work_tree(path)
+    if located is None:
+        raise GitError(f"{path} is not inside a git work tree")
+    work_tree, _ = located
+
+    merge_base = _git(work_tree, "merge-base", since, "HEAD").strip()
+
+    changed = _git(
+        work_tree,
+        "diff", "--name-only", "-z", "-M", "--diff-filter=d",
+        merge_base, "--",
+    )
+    untracked = _git(
+        work_tree,
+        "ls-files", "-z", "--others", "--exclude-standard",
+    )
+
+    paths: List[str] = []
+    seen = set()
+    for output in (changed, untracked):
+        for rel_path in output.split("\0"):
+            if rel_path and rel_path not in seen:
+                seen.add(rel_path)
+                paths.append(rel_path)
+
+    return ChangeSet(
+        work_tree=work_tree,
+        since=since,
+        merge_base=merge_base,
+        paths=tuple(paths),
+    )
+
+
+def _git(work_tree: Path, *args: str) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=work_tree,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as e:
+        raise GitError(f"could not run git: {e}") from e
+
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", "replace").strip()
+        raise GitError(f"git {args[0]} failed: {message}")
+
+    return os.fsdecode(completed.stdout)
@@ -0,0 +1,237 @@
+"""
+<!--
+title: "Stamp — Git Index Reader Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-16"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of git index parsing against the documented on-disk format, with human-defined fallback rules, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Mode bits of regular files in the index (0o100644 / 0o100755)
+_MODE_TYPE_MASK = 0o170000
+_MODE_REGULAR = 0o100000
+
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE_MASK = 0x3000
+_FLAG_NAME_MASK = 0x0FFF
+_EXTENDED_SKIP_WORKTREE = 0x4000
+
+# Fixed-size entry head: ctime, mtime (s + ns), dev, ino, mode, uid, gid,
+# size, object id (skipped), flags
+_ENTRY_HEADS = {
+    hash_size: struct.Struct(f">10I{hash_size}xH")
+    for hash_size in (20, 32)
+}
+
+# Extensions whose presence means the entry list is incomplete
+_UNSUPPORTED_EXTENSIONS = {
+    b"link",  # split index
+    b"sdir",  # sparse index (directory entries)
+}
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """
+    A tracked regular file as recorded in the git index.
+
+    `path` is relative to the work tree and uses '/' separators.
+    `size_bytes` is the size cached at the last `git add` / checkout.
+    """
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    inode: int
+
+
+def find_work_tree(path: Path) -> Optional[Tuple[Path, Path]]:
+    """
+    Locate the git work tree containing `path`.
+
+    Returns (work_tree, git_dir), or None outside a git repository.
+    Linked work trees and submodules (`.git` files) are followed.
+    """
+    for candidate in (path, *path.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            git_dir = Path(text[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = (candidate / git_dir).resolve()
+            return candidate, git_dir
+    return None
+
+
+def read_index(git_dir: Path) -> Optional[List[IndexEntry]]:
+    """
+    Read tracked regular files from `git_dir/index`.
+
+    Only stage-0 regular files present in the work tree are returned;
+    submodules, symlinks, unmerged and skip-worktree entries are
+    dropped. Returns None when the index is missing, malformed, or uses
+    a layout this reader does not support, so callers can fall back to
+    walking the filesystem.
+    """
+    try:
+        data = (git_dir / "index").read_bytes()
+    except OSError:
+        return None
+
+    try:
+        return _parse_index(data, _hash_size(git_dir))
+    except (struct.error, ValueError, IndexError):
+        return None
+
+
+# --- Internals ---------------------------------------------------------
+
+def _hash_size(git_dir: Path) -> int:
+    """
+    Object id width: 32 bytes for sha256 repositories, 20 otherwise.
+    """
+    common_dir = git_dir
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        common_dir = (git_dir / common).resolve()
+    except OSError:
+        pass
+
+    try:
+        config = (common_dir / "config").read_text(encoding="utf-8")
+    except OSError:
+        return 20
+
+    for line in config.splitlines():
+        key, _, value = line.partition("=")
+        if key.strip().lower() == "objectformat" and value.strip().lower() == "sha256":
+            return 32
+    return 20
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """
+    Decode the offset-encoded varint used by index v4 path compression.
+    """
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _parse_index(data: bytes, hash_size: int) -> Optional[List[IndexEntry]]:
+    if data[:4] != b"DIRC":
+        return None
+
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        return None
+
+    head = _ENTRY_HEADS[hash_size]
+    entries: List[IndexEntry] = []
+    pos = 12
+    previous = b""
+
+    for _ in range(count):
+        start = pos
+        (
+            _ctime_s, _ctime_ns,
+            mtime_s, mtime_ns,
+            _dev, ino, mode,
+            _uid, _gid, size,
+            flags,
+        ) = head.unpack_from(data, pos)
+        pos += head.size
+
+        extended = 0
+        if flags & _FLAG_EXTENDED:
+            if version < 3:
+                return None
+            (extended,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+
+        if version == 4:
+            strip, pos = _read_varint(data, pos)
+            end = data.index(b"\0", pos)
+            name = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            name_length = flags & _FLAG_NAME_MASK
+            if name_length < _FLAG_NAME_MASK:
+                end = pos + name_length
+            else:
+                end = data.index(b"\0", pos)
+            name = data[pos:end]
+            # Entries are NUL-padded to a multiple of eight bytes
+            pos = start + ((end - start + 8) & ~7)
+
+        previous = name
+
+        if mode & _MODE_TYPE_MASK == 0o040000:
+            # Sparse directory entry: the file list is incomplete
+            return None
+
+        if flags & _FLAG_STAGE_MASK:
+            continue
+        if extended & _EXTENDED_SKIP_WORKTREE:
+            continue
+        if mode & _MODE_TYPE_MASK != _MODE_REGULAR:
+            continue
+
+        entries.append(
+            IndexEntry(
+                path=os.fsdecode(name),
+                size_bytes=size,
+                mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+                inode=ino,
+            )
+        )
+
+    # Extensions: 4-byte signature + 4-byte length, up to the trailing hash
+    while pos + 8 <= len(data) - hash_size:
+        signature = data[pos:pos + 4]
+        (length,) = struct.unpack_from(">I", data, pos + 4)
+        if signature in _UNSUPPORTED_EXTENSIONS:
+            return None
+        pos += 8 + length
+
+    return entries
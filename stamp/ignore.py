@@ -0,0 +1,383 @@
+"""
+<!--
+title: "Stamp — Ignore File Matching Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of ignore pattern compilation and matching rules, with human-defined discovery semantics, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+
+IGNORE_FILENAMES = (
+    ".gitignore",
+    ".stampignore",
+)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    regex: Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+@dataclass(frozen=True)
+class IgnoreFile:
+    """
+    The compiled patterns of one ignore file.
+
+    Patterns use .gitignore syntax and are matched against paths
+    relative to the directory containing the file (`base`).
+    """
+    base: str
+    rules: Tuple[_Rule, ...]
+    any_rule: Pattern[str]
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Return True (ignored), False (re-included by a negation), or
+        None when no pattern in this file matches.
+
+        The last matching pattern wins, as in git.
+        """
+        if not self.any_rule.match(rel_path):
+            return None
+
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel_path):
+                return not rule.negated
+
+        return None
+
+
+class IgnoreMatcher:
+    """
+    An immutable chain of ignore files applying to one directory.
+
+    Deeper files take precedence over shallower ones. Matchers are
+    extended per directory during traversal, so every ignore file is
+    read and compiled exactly once.
+    """
+
+    __slots__ = ("_files",)
+
+    def __init__(self, files: Tuple[IgnoreFile, ...] = ()):
+        self._files = files
+
+    def __bool__(self) -> bool:
+        return bool(self._files)
+
+    def descend(self, directory: str, names: Iterable[str]) -> "IgnoreMatcher":
+        """
+        Return the matcher for `directory`, given the names it contains.
+
+        Only directories that actually contain an ignore file allocate
+        a new matcher.
+        """
+        loaded: List[IgnoreFile] = []
+        for filename in IGNORE_FILENAMES:
+            if filename in names:
+                ignore_file = load_ignore_file(os.path.join(directory, filename), directory)
+                if ignore_file is not None:
+                    loaded.append(ignore_file)
+
+        if not loaded:
+            return self
+
+        return IgnoreMatcher(self._files + tuple(loaded))
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """
+        Decide whether `path` (an absolute path inside the matcher's
+        directory) is ignored.
+        """
+        for ignore_file in reversed(self._files):
+            rel_path = _relative(path, ignore_file.base)
+            if rel_path is None:
+                continue
+            decision = ignore_file.match(rel_path, is_dir)
+            if decision is not None:
+                return decision
+        return False
+
+    @classmethod
+    def above(cls, root: Path) -> "IgnoreMatcher":
+        """
+        Build the matcher contributed by ancestors of `root`.
+
+        Ignore files in ancestor directories are honoured up to the
+        enclosing git work tree, so validating a subdirectory sees the
+        same rules as validating the whole repository. Ignore files in
+        `root` itself are picked up when the walk enters it.
+        """
+        if (root / ".git").exists():
+            return cls()
+
+        chain: List[Path] = []
+        for parent in root.parents:
+            chain.append(parent)
+            if (parent / ".git").exists():
+                break
+        else:
+            return cls()
+
+        matcher = cls()
+        for directory in reversed(chain):
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            matcher = matcher.descend(os.fspath(directory), names)
+        return matcher
+
+
+def load_ignore_file(path: str, base: str) -> Optional[IgnoreFile]:
+    """
+    Read and compile an ignore file. Unreadable or empty files yield None.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    return compile_patterns(lines, base)
+
+
+def compile_patterns(lines: Iterable[str], base: str) -> Optional[IgnoreFile]:
+    """
+    Compile .gitignore-syntax lines into an IgnoreFile rooted at `base`.
+    """
+    rules: List[_Rule] = []
+    for line in lines:
+        translated = _translate(line)
+        if translated is None:
+            continue
+        regex, negated, dir_only = translated
+        try:
+            compiled = re.compile(regex)
+        except re.error:
+            # A pattern git cannot use never matches there either
+            continue
+        rules.append(_Rule(compiled, negated, dir_only))
+
+    if not rules:
+        return None
+
+    any_rule = re.compile("|".join(f"(?:{rule.regex.pattern})" for rule in rules))
+    return IgnoreFile(base=base, rules=tuple(rules), any_rule=any_rule)
+
+
+# --- Internals ---------------------------------------------------------
+
+def _relative(path: str, base: str) -> Optional[str]:
+    """
+    Express `path` relative to `base` with '/' separators, or None if it
+    is not inside `base`.
+    """
+    prefix = base.rstrip(os.sep) + os.sep
+    if not path.startswith(prefix):
+        return None
+    rel_path = path[len(prefix):]
+    if os.sep != "/":
+        rel_path = rel_path.replace(os.sep, "/")
+    return rel_path
+
+
+def _strip_trailing_spaces(line: str) -> str:
+    """
+    Trailing spaces are ignored unless escaped with a backslash.
+    """
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    return stripped
+
+
+def _translate(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Translate one .gitignore line into (regex, negated, dir_only).
+
+    Returns None for blank lines, comments, and patterns that never
+    match in git (an unclosed bracket expression or an unknown
+    character class).
+    """
+    line = _strip_trailing_spaces(line.rstrip("\r"))
+    if not line or line.startswith("#"):
+        return None
+
+    negated = False
+    if line.startswith("!"):
+        negated = True
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to the base
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    parts: List[str] = []
+    i = 0
+    n = len(line)
+    while i < n:
+        c = line[i]
+        if line.startswith("**/", i) and (i == 0 or line[i - 1] == "/"):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif line.startswith("/**", i) and i + 3 == n:
+            parts.append("/.*")
+            i += 3
+        elif c == "*":
+            while i < n and line[i] == "*":
+                i += 1
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+            i += 1
+        elif c == "[":
+            translated_class = _translate_class(line, i)
+            if translated_class is None:
+                return None
+            regex, i = translated_class
+            parts.append(regex)
+        elif c == "\\" and i + 1 < n:
+            parts.append(re.escape(line[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+
+    body = "".join(parts)
+    prefix = "" if anchored else "(?:.*/)?"
+    return f"{prefix}{body}$", negated, dir_only
+
+
+# ASCII sets of the POSIX classes git's wildmatch accepts
+_POSIX_CLASSES = {
+    "alnum": "0-9A-Za-z",
+    "alpha": "A-Za-z",
+    "blank": " \\t",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": "".join(re.escape(c) for c in "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"),
+    "space": " \\t\\n\\r\\f\\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+def _translate_class(line: str, start: int) -> Optional[Tuple[str, int]]:
+    """
+    Translate the bracket expression opening at `line[start]` into a
+    regex, returning it with the index just past the closing `]`.
+
+    Follows git's wildmatch: `!` or `^` negates, a `]` first in the set
+    is literal, `\\` escapes the next character, `a-z` is a range
+    (only `a` if reversed) and `[:digit:]` a POSIX class. A bracket
+    expression never matches `/`. Returns None for an unclosed
+    expression or an unknown class, which never match.
+    """
+    n = len(line)
+    i = start + 1
+    negated = i < n and line[i] in "!^"
+    if negated:
+        i += 1
+
+    items: List[str] = []
+    # Last literal character, the start of a possible range
+    previous: Optional[str] = None
+    first = True
+    while True:
+        if i >= n:
+            return None
+        c = line[i]
+        if c == "]" and not first:
+            break
+        first = False
+
+        if c == "\\":
+            i += 1
+            if i >= n:
+                return None
+            c = line[i]
+            items.append(re.escape(c))
+            previous = c
+        elif c == "-" and previous is not None and i + 1 < n and line[i + 1] != "]":
+            i += 1
+            high = line[i]
+            if high == "\\":
+                i += 1
+                if i >= n:
+                    return None
+                high = line[i]
+            # The low end already matched on its own, as in git
+            if previous <= high:
+                items.append(re.escape(previous) + "-" + re.escape(high))
+            previous = None
+            i += 1
+            continue
+        elif line.startswith("[:", i):
+            end = line.find("]", i + 2)
+            if end == -1:
+                return None
+            if end - 1 < i + 2 or line[end - 1] != ":":
+                # Not a class after all: a literal `[`
+                items.append(re.escape(c))
+                previous = c
+            else:
+                posix = _POSIX_CLASSES.get(line[i + 2:end - 1])
+                if posix is None:
+                    return None
+                items.append(posix)
+                previous = None
+                i = end
+        else:
+            items.append(re.escape(c))
+            previous = c
+        i += 1
+
+    body = "".join(items)
+    if negated:
+        return "[^/" + body + "]", i + 1
+    if not body:
+        return "(?!)", i + 1
+    return "(?!/)[" + body + "]", i + 1
@@ -0,0 +1,303 @@
+"""
+<!--
+title: "Stamp — Incremental Discovery Manifest Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of the incremental manifest format and invalidation rules, with human-defined equivalence guarantees, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from stamp.discovery import DiscoveredArtifact
+
+
+MANIFEST_VERSION = 4
+MANIFEST_DIRNAME = ".stamp"
+MANIFEST_FILENAME = "manifest.json"
+
+# The process umask, read once: reading it means setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def set_default_mode(path: str) -> None:
+    """
+    Give a file made by tempfile.mkstemp() (always 0600) the mode open()
+    would have given it, 0666 less the umask, so jobs running as other
+    users can read what this one writes.
+    """
+    os.chmod(path, 0o666 & ~_UMASK)
+
+
+# Stat signature: (size, mtime_ns, inode)
+Signature = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    The stat signature of an artifact and the outcome of its last run.
+
+    Ungoverned artifacts (no metadata) are recorded too, so unchanged
+    files are not re-extracted just to be skipped again; `skip_reason`
+    keeps why a binary or oversized file was skipped. `truncated`
+    records that diagnostics were cut off at --max-diagnostics.
+    `block_format` and `block_digest` (hex) identify a governed
+    artifact's metadata block, so reused entries still count towards
+    the run's dedup statistics.
+    """
+    signature: Signature
+    governed: bool
+    passed: bool
+    diagnostic_count: int
+    skip_reason: Optional[str] = None
+    truncated: bool = False
+    block_format: Optional[str] = None
+    block_digest: Optional[str] = None
+
+    def to_list(self) -> list:
+        return [
+            *self.signature,
+            self.governed,
+            self.passed,
+            self.diagnostic_count,
+            self.skip_reason,
+            self.truncated,
+            self.block_format,
+            self.block_digest,
+        ]
+
+    @classmethod
+    def from_list(cls, values: list) -> "ManifestEntry":
+        (
+            size, mtime_ns, inode, governed, passed, diagnostic_count, skip_reason, truncated,
+            block_format, block_digest,
+        ) = values
+        return cls(
+            signature=(int(size), int(mtime_ns), int(inode)),
+            governed=bool(governed),
+            passed=bool(passed),
+            diagnostic_count=int(diagnostic_count),
+            skip_reason=None if skip_reason is None else str(skip_reason),
+            truncated=bool(truncated),
+            block_format=None if block_format is None else str(block_format),
+            block_digest=None if block_digest is None else str(block_digest),
+        )
+
+
+class DiscoveryManifest:
+    """
+    Per-artifact stat signatures and results from the previous repo run.
+
+    A manifest is only reused when its context (tool version, schema
+    fingerprint, ...) equals the current run's; otherwise it starts
+    empty. An entry is reused only when the artifact's current stat
+    signature equals the recorded one and the file was not modified
+    during or after the run that recorded it.
+
+    A full run rewrites the manifest from scratch, so entries for
+    deleted artifacts disappear. A partial run (narrowed discovery, or
+    stopped early) keeps the previous entries of artifacts it did not
+    visit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        context: Dict[str, Any],
+        previous: Optional[Dict[str, ManifestEntry]] = None,
+        previous_started_ns: int = 0,
+    ):
+        self.path = path
+        self.context = context
+        self._previous = previous or {}
+        self._previous_started_ns = previous_started_ns
+        self._current: Dict[str, ManifestEntry] = {}
+        self._started_ns = time.time_ns()
+        self.reused = 0
+
+    @classmethod
+    def for_root(cls, root: Path, *, context: Dict[str, Any]) -> "DiscoveryManifest":
+        """
+        Load the manifest stored under `root/.stamp/`.
+        """
+        base = root if root.is_dir() else root.parent
+        return cls.load(base / MANIFEST_DIRNAME / MANIFEST_FILENAME, context=context)
+
+    @classmethod
+    def load(cls, path: Path, *, context: Dict[str, Any]) -> "DiscoveryManifest":
+        """
+        Load a manifest, discarding it if it is missing, unreadable, or
+        was written under a different context.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, context=context)
+
+        if (
+            not isinstance(data, dict)
+            or data.get("manifest_version") != MANIFEST_VERSION
+            or data.get("context") != context
+        ):
+            return cls(path, context=context)
+
+        try:
+            previous = {
+                key: ManifestEntry.from_list(values)
+                for key, values in data["entries"].items()
+            }
+            started_ns = int(data["started_ns"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return cls(path, context=context)
+
+        return cls(
+            path,
+            context=context,
+            previous=previous,
+            previous_started_ns=started_ns,
+        )
+
+    @staticmethod
+    def signature(artifact: DiscoveredArtifact) -> Optional[Signature]:
+        """
+        Stat signature of an artifact, reusing discovery's stat data
+        when available. Returns None if the file cannot be stat'ed.
+        """
+        if artifact.mtime_ns is not None and artifact.inode is not None:
+            return (artifact.size_bytes, artifact.mtime_ns, artifact.inode)
+
+        try:
+            stat = artifact.path.stat()
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def lookup(
+        self,
+        artifact: DiscoveredArtifact,
+        signature: Optional[Signature],
+    ) -> Optional[ManifestEntry]:
+        """
+        Return the previous outcome for an unchanged artifact, or None
+        if it must be re-extracted and re-validated.
+        """
+        if signature is None:
+            return None
+
+        entry = self._previous.get(str(artifact.path))
+        if entry is None or entry.signature != signature:
+            return None
+
+        # Racy entry: modified while (or after) the recording run started,
+        # possibly within the same timestamp tick as the recorded stat
+        if signature[1] >= self._previous_started_ns:
+            return None
+
+        self.reused += 1
+        return entry
+
+    def record(
+        self,
+        artifact: DiscoveredArtifact,
+        signature: Optional[Signature],
+        *,
+        governed: bool,
+        passed: bool = False,
+        diagnostic_count: int = 0,
+        skip_reason: Optional[str] = None,
+        truncated: bool = False,
+        block_format: Optional[str] = None,
+        block_digest: Optional[str] = None,
+    ) -> None:
+        """
+        Record the outcome of the current run for an artifact.
+        """
+        if signature is None:
+            return
+
+        self._current[str(artifact.path)] = ManifestEntry(
+            signature=signature,
+            governed=governed,
+            passed=passed,
+            diagnostic_count=diagnostic_count,
+            skip_reason=skip_reason,
+            truncated=truncated,
+            block_format=block_format,
+            block_digest=block_digest,
+        )
+
+    def save(self, *, partial: bool = False) -> None:
+        """
+        Atomically write the current run's manifest.
+
+        With `partial`, previous entries for artifacts this run did not
+        visit are carried forward, except racy ones: they were never
+        reusable, and would pass for settled under this run's start.
+        """
+        entries: Dict[str, ManifestEntry] = {}
+        if partial:
+            entries = {
+                key: entry
+                for key, entry in self._previous.items()
+                if entry.signature[1] < self._previous_started_ns
+            }
+        entries.update(self._current)
+
+        data = {
+            "manifest_version": MANIFEST_VERSION,
+            "context": self.context,
+            "started_ns": self._started_ns,
+            "entries": {
+                key: entry.to_list()
+                for key, entry in entries.items()
+            },
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=".manifest-",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            set_default_mode(tmp)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,237 @@
+"""
+<!--
+title: "Stamp — In-Memory Record Validation Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-17"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of the in-process validation API for metadata records, with human-defined output contracts, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from stamp.extract import (
+    DEFAULT_RESOURCE_LIMITS,
+    ExtractedMetadata,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    load_block,
+    load_toml_block,
+    load_yaml_block,
+)
+from stamp.normalize import StampNormalize, canonical_json
+from stamp.remediation import build_remediation_summary
+from stamp.schema import ResolvedSchema
+from stamp.validate import (
+    DEFAULT_VALIDATION_ENGINE,
+    ValidationResult,
+    validate_many,
+)
+
+
+# A record is parsed metadata (a dict) or metadata text in one of
+# RECORD_FORMATS
+Record = Union[Dict[str, Any], str]
+
+RECORD_FORMATS = ("yaml", "json", "toml")
+
+# Reported as the artifact of a record without a name
+RECORD_NAME = "<record>"
+
+
+# -----------------------------
+# Parsing
+# -----------------------------
+
+def parse_record(
+    record: Record,
+    format: str = "yaml",
+    *,
+    limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS,
+) -> ExtractedMetadata:
+    """
+    Extracted metadata for an in-memory record, without touching the
+    filesystem.
+
+    Text is parsed as the metadata block of a file would be, under the
+    same resource limits; a dict is used as-is once its tree is
+    within them. Either way, parse errors and exceeded limits are
+    reported as they are for files. `artifact_path` is None.
+    """
+    if format not in RECORD_FORMATS:
+        raise ValueError(f"Unknown record format: {format}")
+
+    if isinstance(record, str):
+        if format == "yaml":
+            load = functools.partial(load_yaml_block, limits=limits)
+        elif format == "json":
+            load = json.loads
+        else:
+            load = load_toml_block
+        return load_block(None, record, load, format, limits)
+
+    try:
+        limits.check_tree(record)
+    except ResourceLimitExceeded as e:
+        return ExtractedMetadata(
+            artifact_path=None,
+            metadata=None,
+            raw_block=None,
+            error=str(e),
+            limit_exceeded=e.details,
+        )
+    return ExtractedMetadata(
+        artifact_path=None,
+        metadata=record,
+        raw_block=None,
+        error=None,
+    )
+
+
+# -----------------------------
+# Validation
+# -----------------------------
+
+def validate_record(
+    record: Record,
+    resolved_schema: ResolvedSchema,
+    *,
+    format: str = "yaml",
+    engine: str = DEFAULT_VALIDATION_ENGINE,
+    max_diagnostics: Optional[int] = None,
+    limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS,
+) -> ValidationResult:
+    """
+    Validate one in-memory record and emit its CDOs.
+
+    The compiled validator for `resolved_schema` is shared with every
+    other caller validating against the same schema.
+    """
+    return next(
+        validate_records(
+            (record,),
+            resolved_schema,
+            format=format,
+            engine=engine,
+            max_diagnostics=max_diagnostics,
+            limits=limits,
+        )
+    )
+
+
+def validate_records(
+    records: Iterable[Record],
+    resolved_schema: ResolvedSchema,
+    *,
+    format: str = "yaml",
+    engine: str = DEFAULT_VALIDATION_ENGINE,
+    max_diagnostics: Optional[int] = None,
+    columnar: bool = False,
+    limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS,
+) -> Iterator[ValidationResult]:
+    """
+    validate_many() over in-memory records: a lazy iterator of results
+    in input order.
+
+    The schema is checked when validate_records() is called and raises
+    jsonschema.exceptions.SchemaError if it is invalid. A record that
+    does not parse is validated as missing metadata, as `validate run`
+    does for a file; its result's `error` says why.
+    """
+    if format not in RECORD_FORMATS:
+        raise ValueError(f"Unknown record format: {format}")
+
+    return validate_many(
+        (parse_record(record, format, limits=limits) for record in records),
+        resolved_schema,
+        engine=engine,
+        max_diagnostics=max_diagnostics,
+        columnar=columnar,
+    )
+
+
+# -----------------------------
+# Reports
+# -----------------------------
+
+def remediation_summary(
+    result: ValidationResult,
+    *,
+    name: str = RECORD_NAME,
+) -> Dict[str, Any]:
+    """
+    build_remediation_summary() for a record's result.
+    """
+    return build_remediation_summary(
+        diagnostics=result.diagnostics,
+        artifact=name,
+        schema=result.schema_id,
+    )
+
+
+def normalization_proposals(
+    result: ValidationResult,
+    resolved_schema: ResolvedSchema,
+    *,
+    stamp_version: str,
+    name: str = RECORD_NAME,
+    record: Optional[Record] = None,
+) -> Dict[str, Any]:
+    """
+    The Normalization Proposal Object (StampNormalize) for a record's
+    result.
+
+    With `record`, the NPO's source artifact carries its SHA-256: of
+    the text, or of the canonical JSON of a dict (omitted for a dict
+    with values JSON cannot represent).
+    """
+    source_artifact: Dict[str, Any] = {"path": name}
+    if record is not None:
+        digest = _record_hash(record)
+        if digest is not None:
+            source_artifact["hash"] = digest
+
+    schema_context: Dict[str, Any] = {"id": resolved_schema.identifier}
+    if resolved_schema.uri is not None:
+        schema_context["uri"] = resolved_schema.uri
+
+    return StampNormalize(stamp_version=stamp_version).normalize(
+        diagnostics=result.diagnostics,
+        source_artifact=source_artifact,
+        schema_context=schema_context,
+    )
+
+
+def _record_hash(record: Record) -> Optional[str]:
+    if isinstance(record, str):
+        text = record
+    else:
+        try:
+            text = canonical_json(record)
+        except (TypeError, ValueError):
+            return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
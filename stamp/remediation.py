@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -30,7 +30,7 @@ anchors: []
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 
 # -----------------------------
@@ -93,8 +93,8 @@ def _extract_field_path(diagnostic: Dict[str, Any]) -> str:
 def build_remediation_summary(
     *,
     diagnostics: List[Dict[str, Any]],
-    artifact: Path,
-    schema: Path,
+    artifact: Union[Path, str],
+    schema: Union[Path, str],
     fix_result: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
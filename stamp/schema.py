@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-16"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -29,7 +29,9 @@ anchors: []
 
 from pathlib import Path
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Union
+import hashlib
 import json
 import urllib.request
 
@@ -41,6 +43,25 @@ class ResolvedSchema:
     uri: Optional[str]
     schema: dict
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        schema_fingerprint() of the schema document, computed once.
+
+        Loaded schema documents are treated as immutable.
+        """
+        return schema_fingerprint(self.schema)
+
+
+def schema_fingerprint(schema: dict) -> str:
+    """
+    Canonical content hash of a schema document.
+
+    Key order and whitespace do not affect the fingerprint.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
 
 def load_schema(source: Union[Path, str, dict]) -> ResolvedSchema:
     """
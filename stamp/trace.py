@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-27"
-updated: "2026-01-31"
+updated: "2026-10-16"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -32,7 +32,7 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import json
 
 
@@ -41,6 +41,8 @@ class ArtifactTrace:
     artifact: str
     passed: bool
     diagnostic_count: int
+    # More diagnostics existed than the run's max_diagnostics allowed
+    truncated: bool = False
 
 
 @dataclass(frozen=True)
@@ -50,6 +52,11 @@ class ExecutionTrace:
 
     NOTE: This artifact intentionally does not embed diagnostics. It captures
     run context + per-artifact summaries suitable for audit, CI, and enforcement.
+
+    `scope` is present only for partial runs and records how the
+    validated artifact set was narrowed (e.g. changed files since a ref).
+    `truncation` is present only when --fail-fast or --max-diagnostics
+    was in effect and records whether results were cut short.
     """
     trace_version: str
     tool: str
@@ -60,9 +67,19 @@ class ExecutionTrace:
     finished_at: str
     exit_code: int
     artifacts: List[ArtifactTrace]
+    scope: Optional[Dict[str, Any]] = None
+    truncation: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = asdict(self)
+        # Optional run context is omitted when unused
+        for key in ("scope", "truncation"):
+            if data[key] is None:
+                del data[key]
+        for artifact in data["artifacts"]:
+            if not artifact["truncated"]:
+                del artifact["truncated"]
+        return data
 
     def write_json(self, path: Path) -> None:
         path.write_text(
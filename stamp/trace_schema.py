@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-27"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -34,12 +34,13 @@ from typing import Any, Dict, List
 from jsonschema import Draft202012Validator
 
 
-TRACE_SCHEMA_VERSION = "0.0.1"
-TRACE_SCHEMA_ID = "https://waveframelabs.org/schemas/stamp-trace-0.0.1.json"
+TRACE_SCHEMA_VERSION = "0.0.2"
+TRACE_SCHEMA_ID = "https://waveframelabs.org/schemas/stamp-trace-0.0.2.json"
 
+# Frozen: traces recorded as 0.0.1 keep validating against it
 STAMP_TRACE_SCHEMA_V0_0_1: Dict[str, Any] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
-    "$id": TRACE_SCHEMA_ID,
+    "$id": "https://waveframelabs.org/schemas/stamp-trace-0.0.1.json",
     "title": "Stamp Trace Schema v0.0.1",
     "description": "Schema for deterministic Stamp execution trace artifacts.",
     "type": "object",
@@ -81,13 +82,89 @@ STAMP_TRACE_SCHEMA_V0_0_1: Dict[str, Any] = {
 }
 
 
+# 0.0.2 adds optional run context: per-artifact `truncated`, and the
+# `scope` and `truncation` objects
+STAMP_TRACE_SCHEMA_V0_0_2: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": TRACE_SCHEMA_ID,
+    "title": "Stamp Trace Schema v0.0.2",
+    "description": "Schema for deterministic Stamp execution trace artifacts.",
+    "type": "object",
+    "additionalProperties": False,
+    "required": [
+        "trace_version",
+        "tool",
+        "tool_version",
+        "command",
+        "schema",
+        "started_at",
+        "finished_at",
+        "exit_code",
+        "artifacts",
+    ],
+    "properties": {
+        "trace_version": {"type": "string", "pattern": "^[0-9]+\\.[0-9]+\\.[0-9]+$"},
+        "tool": {"type": "string", "minLength": 1},
+        "tool_version": {"type": "string", "minLength": 1},
+        "command": {"type": "string", "minLength": 1},
+        "schema": {"type": "string", "minLength": 1},
+        "started_at": {"type": "string", "minLength": 1},
+        "finished_at": {"type": "string", "minLength": 1},
+        "exit_code": {"type": "integer"},
+        "artifacts": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["artifact", "passed", "diagnostic_count"],
+                "properties": {
+                    "artifact": {"type": "string", "minLength": 1},
+                    "passed": {"type": "boolean"},
+                    "diagnostic_count": {"type": "integer", "minimum": 0},
+                    "truncated": {"type": "boolean"},
+                },
+            },
+        },
+        "scope": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["partial"],
+            "properties": {
+                "partial": {"type": "boolean"},
+                "since": {"type": "string", "minLength": 1},
+                "merge_base": {"type": "string", "minLength": 1},
+            },
+        },
+        "truncation": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["fail_fast", "stopped_early", "truncated_artifacts"],
+            "properties": {
+                "fail_fast": {"type": "boolean"},
+                "stopped_early": {"type": "boolean"},
+                "max_diagnostics": {"type": "integer", "minimum": 1},
+                "truncated_artifacts": {"type": "integer", "minimum": 0},
+            },
+        },
+    },
+}
+
+
+TRACE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "0.0.1": STAMP_TRACE_SCHEMA_V0_0_1,
+    TRACE_SCHEMA_VERSION: STAMP_TRACE_SCHEMA_V0_0_2,
+}
+
+
 def validate_trace(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Validate a trace dict against the v0.0.1 schema.
+    Validate a trace dict against the schema of its `trace_version`
+    (the current schema if the version is unknown).
 
     Returns a list of jsonschema error objects (empty list means valid).
     """
-    validator = Draft202012Validator(STAMP_TRACE_SCHEMA_V0_0_1)
+    schema = TRACE_SCHEMAS.get(trace.get("trace_version"), STAMP_TRACE_SCHEMA_V0_0_2)
+    validator = Draft202012Validator(schema)
     errors = sorted(validator.iter_errors(trace), key=lambda e: (list(e.path), e.message))
     return [
         {
@@ -8,7 +8,7 @@ version: "0.1.0"
 doi: "10.5281/zenodo.18436622"
 status: "Active"
 created: "2026-01-16"
-updated: "2026-01-31"
+updated: "2026-10-17"
 author:
   name: "Shawn C. Wright"
   email: "swright@waveframelabs.org"
@@ -29,13 +29,21 @@ anchors: []
 
 from __future__ import annotations
 
+import itertools
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from jsonschema import Draft202012Validator
 
-from stamp.cdo import translate_validation_errors_to_cdos  # type: ignore
+from stamp.cdo import (  # type: ignore
+    count_cdos,
+    translate_resource_limit_to_cdo,
+    translate_validation_errors_to_cdos,
+)
+from stamp.codegen import CompiledSchema, compile_schema
+from stamp.columnar import ColumnarSchema, compile_columnar
 from stamp.extract import ExtractedMetadata
 from stamp.schema import ResolvedSchema
 
@@ -45,41 +53,259 @@ class ValidationResult:
     artifact_path: Optional[Path]
     schema_id: str
     diagnostics: List[Dict[str, Any]]
+    # More diagnostics existed than max_diagnostics allowed
+    truncated: bool = False
+    # Set, with no diagnostics, by counts-only validation
+    error_count: Optional[int] = None
+    # Why the metadata could not be read (ExtractedMetadata.error)
+    error: Optional[str] = None
 
+    @property
+    def diagnostic_count(self) -> int:
+        if self.error_count is not None:
+            return self.error_count
+        return len(self.diagnostics)
 
-def _validate_instance(instance: Any, schema: Dict[str, Any]) -> List[Any]:
+
+# Validation engines: jsonschema's Draft 2020-12 validator, or Python
+# code generated for the schema (stamp.codegen), which reports the same
+# errors and leaves schemas it cannot compile to jsonschema
+VALIDATION_ENGINES = ("jsonschema", "codegen")
+DEFAULT_VALIDATION_ENGINE = "jsonschema"
+
+Validator = Union[Draft202012Validator, CompiledSchema]
+
+# Compiled validators by engine and schema fingerprint. Validators are
+# immutable once built, so one instance is shared by every artifact and
+# thread.
+_VALIDATORS: Dict[Tuple[str, str], Validator] = {}
+_VALIDATORS_LOCK = threading.Lock()
+_MAX_VALIDATORS = 64
+
+# Artifacts screened together by validate_many(columnar=True)
+COLUMNAR_BATCH_SIZE = 4096
+
+
+def compiled_validator(
+    resolved_schema: ResolvedSchema,
+    engine: str = DEFAULT_VALIDATION_ENGINE,
+) -> Validator:
     """
-    Run Draft 2020-12 validation and collect ALL errors.
+    The validator for a schema, built once per engine and schema
+    fingerprint.
+
+    The schema is checked against the Draft 2020-12 meta-schema when
+    its validator is first built; an invalid schema raises
+    jsonschema.exceptions.SchemaError (and is checked again next time).
+    """
+    if engine not in VALIDATION_ENGINES:
+        raise ValueError(f"Unknown validation engine: {engine}")
+
+    key = (engine, resolved_schema.fingerprint)
+    validator = _VALIDATORS.get(key)
+    if validator is not None:
+        return validator
+
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            Draft202012Validator.check_schema(resolved_schema.schema)
+            if engine == "codegen":
+                validator = compile_schema(resolved_schema.schema)
+            if validator is None:
+                validator = Draft202012Validator(resolved_schema.schema)
+            if len(_VALIDATORS) >= _MAX_VALIDATORS:
+                # Evict the oldest schema
+                del _VALIDATORS[next(iter(_VALIDATORS))]
+            _VALIDATORS[key] = validator
+    return validator
+
+
+def _validate_instance(
+    instance: Any,
+    validator: Validator,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """
+    Run Draft 2020-12 validation and collect ALL errors (or the first
+    `limit`; iteration stops there).
     Returns raw jsonschema error objects.
     """
-    validator = Draft202012Validator(schema)
-    return list(validator.iter_errors(instance))
+    return list(itertools.islice(validator.iter_errors(instance), limit))
 
 
-def validate_artifact(
-    *,
+def _validate_one(
     extracted: ExtractedMetadata,
     resolved_schema: ResolvedSchema,
+    validator: Validator,
+    max_diagnostics: Optional[int],
+    screened: bool = False,
+    counts_only: bool = False,
 ) -> ValidationResult:
     """
-    Validate extracted metadata against a resolved schema and emit
-    Canonical Diagnostic Objects (CDOs).
+    Validate one artifact with an already resolved validator.
+    `screened` metadata is already known to be invalid.
     """
+    if extracted.limit_exceeded is not None:
+        return ValidationResult(
+            artifact_path=extracted.artifact_path,
+            schema_id=resolved_schema.identifier,
+            diagnostics=[
+                translate_resource_limit_to_cdo(
+                    limit_exceeded=extracted.limit_exceeded,
+                    message=extracted.error or "Resource limit exceeded",
+                )
+            ],
+            error=extracted.error,
+        )
+
     instance = extracted.metadata
 
-    raw_errors = _validate_instance(
-        instance=instance,
-        schema=resolved_schema.schema,
-    )
+    # Most artifacts pass. A generated predicate settles them without
+    # building error objects; errors are then collected only on failure.
+    # jsonschema's is_valid() is the same traversal as iter_errors(),
+    # which builds nothing for a passing artifact, so it is not run first.
+    truncated = False
+    error_count = 0 if counts_only else None
+    if not screened and isinstance(validator, CompiledSchema) and validator.is_valid(instance):
+        diagnostics: List[Dict[str, Any]] = []
+    else:
+        # One error past the limit tells whether anything was cut
+        raw_errors = _validate_instance(
+            instance=instance,
+            validator=validator,
+            limit=None if max_diagnostics is None else max_diagnostics + 1,
+        )
+        if max_diagnostics is not None and len(raw_errors) > max_diagnostics:
+            raw_errors = raw_errors[:max_diagnostics]
+            truncated = True
 
-    diagnostics = translate_validation_errors_to_cdos(
-        errors=raw_errors,
-        instance=instance,
-        schema=resolved_schema.schema,
-    )
+        if counts_only:
+            diagnostics = []
+            error_count = count_cdos(errors=raw_errors)
+        else:
+            diagnostics = translate_validation_errors_to_cdos(
+                errors=raw_errors,
+                instance=instance,
+                schema=resolved_schema.schema,
+            )
 
     return ValidationResult(
         artifact_path=extracted.artifact_path,
         schema_id=resolved_schema.identifier,
         diagnostics=diagnostics,
+        truncated=truncated,
+        error_count=error_count,
+        error=extracted.error,
+    )
+
+
+def validate_artifact(
+    *,
+    extracted: ExtractedMetadata,
+    resolved_schema: ResolvedSchema,
+    engine: str = DEFAULT_VALIDATION_ENGINE,
+    max_diagnostics: Optional[int] = None,
+    counts_only: bool = False,
+) -> ValidationResult:
+    """
+    Validate extracted metadata against a resolved schema and emit
+    Canonical Diagnostic Objects (CDOs).
+
+    With `max_diagnostics`, error iteration stops after that many
+    errors and the result is marked `truncated` if more existed.
+
+    With `counts_only`, for outputs that report only pass/fail and
+    diagnostic counts, schema errors are counted instead of translated:
+    the result carries their `error_count` in place of CDOs, and its
+    `diagnostic_count` and pass/fail are those of the full result.
+
+    `engine` is one of VALIDATION_ENGINES; all engines produce the
+    same diagnostics. With generated code, passing metadata is settled
+    by a boolean check alone.
+
+    A metadata block that exceeded a resource limit is not validated;
+    its single diagnostic is `resource.limit_exceeded`.
+    """
+    return _validate_one(
+        extracted,
+        resolved_schema,
+        compiled_validator(resolved_schema, engine),
+        max_diagnostics,
+        counts_only=counts_only,
     )
+
+
+def validate_many(
+    artifacts: Iterable[ExtractedMetadata],
+    resolved_schema: ResolvedSchema,
+    *,
+    engine: str = DEFAULT_VALIDATION_ENGINE,
+    max_diagnostics: Optional[int] = None,
+    columnar: bool = False,
+    counts_only: bool = False,
+) -> Iterator[ValidationResult]:
+    """
+    Validate many artifacts against one schema, lazily.
+
+    The validator is resolved (and the schema checked) once, when
+    validate_many() is called, so an invalid schema raises here rather
+    than at the first artifact. Each result is the one
+    validate_artifact() would return, produced in input order as the
+    iterator is advanced: artifacts may be streamed from discovery,
+    and a caller that stops early validates nothing further.
+
+    With `columnar`, artifacts are read COLUMNAR_BATCH_SIZE at a time
+    and a flat object schema (stamp.columnar) settles passing ones
+    column-wise; the rest, and every artifact of a schema it cannot
+    split, take the per-instance path of `engine`. Results are the
+    same either way. `counts_only` is as for validate_artifact().
+    """
+    validator = compiled_validator(resolved_schema, engine)
+    screen = compile_columnar(resolved_schema.schema) if columnar else None
+    if screen is not None:
+        return _validate_columnar(
+            artifacts, resolved_schema, validator, screen, max_diagnostics, counts_only
+        )
+    return (
+        _validate_one(extracted, resolved_schema, validator, max_diagnostics, counts_only=counts_only)
+        for extracted in artifacts
+    )
+
+
+def _validate_columnar(
+    artifacts: Iterable[ExtractedMetadata],
+    resolved_schema: ResolvedSchema,
+    validator: Validator,
+    screen: ColumnarSchema,
+    max_diagnostics: Optional[int],
+    counts_only: bool,
+) -> Iterator[ValidationResult]:
+    artifacts = iter(artifacts)
+    while True:
+        batch = list(itertools.islice(artifacts, COLUMNAR_BATCH_SIZE))
+        if not batch:
+            return
+
+        # Blocks over a resource limit were never parsed: not screened
+        passing = screen.passing(
+            [None if e.limit_exceeded is not None else e.metadata for e in batch]
+        )
+        for extracted, passed in zip(batch, passing):
+            if passed:
+                yield ValidationResult(
+                    artifact_path=extracted.artifact_path,
+                    schema_id=resolved_schema.identifier,
+                    diagnostics=[],
+                    error_count=0 if counts_only else None,
+                )
+            else:
+                # A screened object failed; anything else was not screened
+                yield _validate_one(
+                    extracted,
+                    resolved_schema,
+                    validator,
+                    max_diagnostics,
+                    screened=isinstance(extracted.metadata, dict),
+                    counts_only=counts_only,
+                )
@@ -0,0 +1,495 @@
+"""
+<!--
+title: "Stamp — Watch Mode Module"
+filetype: "operational"
+type: "specification"
+domain: "methodology"
+version: "0.1.0"
+doi: "10.5281/zenodo.18436622"
+status: "Active"
+created: "2026-10-16"
+updated: "2026-10-17"
+author:
+  name: "Shawn C. Wright"
+  email: "swright@waveframelabs.org"
+  orcid: "https://orcid.org/0009-0006-6043-9295"
+maintainer:
+  name: "Waveframe Labs"
+  url: "https://waveframelabs.org"
+license: "Apache-2.0"
+copyright:
+  holder: "Waveframe Labs"
+  year: "2026"
+ai_assisted: "partial"
+ai_assistance_details: "AI-assisted drafting of change notification backends, debouncing, and incremental revalidation, with human-defined output semantics, review, and final validation."
+dependencies: []
+anchors: []
+-->
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+from stamp.discovery import (
+    DiscoveredArtifact,
+    iter_artifacts,
+    iter_directories,
+    iter_selected_artifacts,
+    iter_subtree_artifacts,
+    iter_subtree_directories,
+)
+from stamp.extract import Extractor, extract_metadata
+from stamp.ignore import IGNORE_FILENAMES
+from stamp.schema import ResolvedSchema
+from stamp.validate import validate_artifact
+
+
+# Stat signature: (size, mtime_ns, inode)
+Signature = Tuple[int, int, int]
+
+
+@dataclass
+class ChangeBatch:
+    """
+    Paths reported changed by a watcher.
+
+    `directories` were created, moved or removed, so their subtrees
+    must be rediscovered. `rescan` means the watcher lost track (e.g.
+    event queue overflow) and the whole tree must be rediscovered.
+    """
+    paths: Set[str] = field(default_factory=set)
+    directories: Set[str] = field(default_factory=set)
+    rescan: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.paths) or bool(self.directories) or self.rescan
+
+    def merge(self, other: "ChangeBatch") -> None:
+        self.paths |= other.paths
+        self.directories |= other.directories
+        self.rescan = self.rescan or other.rescan
+
+
+# -----------------------------
+# Watcher backends
+# -----------------------------
+
+class PollingWatcher:
+    """
+    Portable watcher: re-walks the tree every `interval` seconds and
+    reports artifacts whose stat signature changed.
+    """
+
+    def __init__(self, root: Path, *, interval: float = 1.0, respect_ignore_files: bool = True):
+        self.root = root
+        self.interval = interval
+        self.respect_ignore_files = respect_ignore_files
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> Dict[str, Signature]:
+        return {
+            str(a.path): _artifact_signature(a)
+            for a in iter_artifacts([self.root], respect_ignore_files=self.respect_ignore_files)
+        }
+
+    def wait(self, timeout: Optional[float]) -> ChangeBatch:
+        delay = max(0.0, self._next_scan - time.monotonic())
+        if timeout is not None and timeout < delay:
+            time.sleep(timeout)
+            return ChangeBatch()
+
+        time.sleep(delay)
+        self._next_scan = time.monotonic() + self.interval
+
+        current = self._scan()
+        changed = {
+            path
+            for path in current.keys() | self._snapshot.keys()
+            if current.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = current
+        return ChangeBatch(paths=changed)
+
+    def rewatch(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Linux watcher backed by inotify (via libc, no extra dependency).
+
+    Watches every directory the walker would enter. File writes, moves
+    and deletions are reported by path. Directories created, moved or
+    deleted are reported as directories, and new ones are watched at
+    once; queue overflows and the loss of the root request a rescan.
+    """
+
+    _IN_ATTRIB = 0x00000004
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_DELETE_SELF = 0x00000400
+    _IN_MOVE_SELF = 0x00000800
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_ISDIR = 0x40000000
+    _IN_ONLYDIR = 0x01000000
+
+    _MASK = (
+        _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+        | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+    )
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, root: Path, *, respect_ignore_files: bool = True):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OSError("inotify is not available on this platform")
+
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._fd = fd
+        self.root = root
+        self.respect_ignore_files = respect_ignore_files
+        self._watches: Dict[int, str] = {}
+        self.rewatch()
+
+    def rewatch(self) -> None:
+        """
+        (Re-)register watches on every directory in the governable tree.
+
+        Re-adding an existing watch is a no-op in the kernel, so this is
+        safe to call after every rescan.
+        """
+        self._add_watches(iter_directories([self.root], respect_ignore_files=self.respect_ignore_files))
+
+    def _add_watches(self, directories: Iterator[Path]) -> None:
+        for directory in directories:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+            if wd >= 0:
+                self._watches[wd] = os.fspath(directory)
+
+    def _directory_changed(self, path: str) -> None:
+        """
+        Watch the governable subtree of a new directory (or one whose
+        ignore rules changed), or drop the watches under a directory
+        that is gone (a moved one keeps reporting).
+        """
+        if os.path.isdir(path):
+            self._add_watches(
+                iter_subtree_directories(self.root, path, respect_ignore_files=self.respect_ignore_files)
+            )
+            return
+
+        prefix = path + os.sep
+        for wd, directory in list(self._watches.items()):
+            if directory == path or directory.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def wait(self, timeout: Optional[float]) -> ChangeBatch:
+        batch = ChangeBatch()
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return batch
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return batch
+
+        pos = 0
+        while pos + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, pos)
+            pos += self._EVENT.size
+            name = data[pos:pos + length].rstrip(b"\0")
+            pos += length
+
+            if mask & self._IN_Q_OVERFLOW:
+                batch.rescan = True
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+
+            if mask & (self._IN_DELETE_SELF | self._IN_MOVE_SELF):
+                # Reported by the parent's watch, except for the root
+                self._watches.pop(wd, None)
+                if directory == os.fspath(self.root):
+                    batch.rescan = True
+                continue
+
+            if not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+
+            if mask & self._IN_ISDIR:
+                # Directory created, moved or deleted: contents unknown
+                self._directory_changed(path)
+                batch.directories.add(path)
+                continue
+
+            if os.path.basename(path) in IGNORE_FILENAMES:
+                # Subdirectories may no longer be ignored
+                self._directory_changed(directory)
+
+            batch.paths.add(path)
+
+        return batch
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def open_watcher(
+    root: Path,
+    *,
+    polling: bool = False,
+    interval: float = 1.0,
+    respect_ignore_files: bool = True,
+):
+    """
+    Use inotify where available, falling back to polling.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root, respect_ignore_files=respect_ignore_files)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, interval=interval, respect_ignore_files=respect_ignore_files)
+
+
+def next_batch(watcher, debounce: float) -> ChangeBatch:
+    """
+    Block until something changes, then keep collecting until the tree
+    has been quiet for `debounce` seconds, so a burst of saves is
+    handled as one batch.
+    """
+    batch = ChangeBatch()
+    while not batch:
+        batch.merge(watcher.wait(None))
+
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return batch
+        batch.merge(more)
+
+
+# -----------------------------
+# Revalidation session
+# -----------------------------
+
+class WatchSession:
+    """
+    Keeps discovery state and the loaded schema for a watched root and
+    re-extracts and re-validates only artifacts that changed.
+
+    Each update is a record:
+      {"artifact", "passed", "diagnostic_count", "diagnostics"} for a
+      governed artifact, or {"artifact", "governed": false} /
+      {"artifact", "removed": true} when a previously governed artifact
+      stops being governed or disappears.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        resolved_schema: ResolvedSchema,
+        *,
+        respect_ignore_files: bool = True,
+        extractors: Optional[Mapping[str, Extractor]] = None,
+        sniff_frontmatter: bool = False,
+    ):
+        self.root = root
+        self.resolved_schema = resolved_schema
+        self.respect_ignore_files = respect_ignore_files
+        self.extractors = extractors
+        self.sniff_frontmatter = sniff_frontmatter
+        self._signatures: Dict[str, Signature] = {}
+        self._governed: Set[str] = set()
+
+    def start(self) -> Iterator[Dict[str, Any]]:
+        """
+        Discover the tree once and validate every governed artifact.
+        """
+        for path, signature in self._discover().items():
+            self._signatures[path] = signature
+            record = self._revalidate(path)
+            if record is not None:
+                yield record
+
+    def apply(self, batch: ChangeBatch) -> Iterator[Dict[str, Any]]:
+        """
+        Revalidate the artifacts affected by a change batch.
+
+        Only a rescan rediscovers the whole tree. Changed directories,
+        and directories whose ignore files changed, are rediscovered
+        alone; a path not seen before is checked against the exclusion
+        and ignore rules by itself.
+        """
+        if batch.rescan:
+            current = self._discover()
+            candidates = current.keys() | self._signatures.keys()
+        else:
+            current = dict(self._signatures)
+            candidates = set(batch.paths)
+
+            directories = set(batch.directories)
+            directories.update(
+                os.path.dirname(path) for path in batch.paths
+                if os.path.basename(path) in IGNORE_FILENAMES
+            )
+            for directory in sorted(directories):
+                prefix = directory + os.sep
+                stale = [path for path in current if path.startswith(prefix)]
+                for path in stale:
+                    del current[path]
+                candidates.update(stale)
+                for artifact in iter_subtree_artifacts(
+                    self.root, directory, respect_ignore_files=self.respect_ignore_files
+                ):
+                    current[str(artifact.path)] = _artifact_signature(artifact)
+                    candidates.add(str(artifact.path))
+
+            paths = [
+                path for path in batch.paths
+                if not any(path.startswith(directory + os.sep) for directory in directories)
+            ]
+            new = {
+                str(artifact.path): _artifact_signature(artifact)
+                for artifact in iter_selected_artifacts(
+                    self.root,
+                    [path for path in paths if path not in self._signatures],
+                    respect_ignore_files=self.respect_ignore_files,
+                )
+            }
+            for path in paths:
+                signature = _stat_signature(path) if path in self._signatures else new.get(path)
+                if signature is None:
+                    current.pop(path, None)
+                else:
+                    current[path] = signature
+
+        changed = sorted(
+            path for path in candidates
+            if current.get(path) != self._signatures.get(path)
+        )
+        self._signatures = current
+
+        for path in changed:
+            if path not in current:
+                if path in self._governed:
+                    self._governed.discard(path)
+                    yield {"artifact": path, "removed": True}
+                continue
+
+            record = self._revalidate(path)
+            if record is not None:
+                yield record
+
+    def _discover(self) -> Dict[str, Signature]:
+        return {
+            str(artifact.path): _artifact_signature(artifact)
+            for artifact in iter_artifacts([self.root], respect_ignore_files=self.respect_ignore_files)
+        }
+
+    def _revalidate(self, path: str) -> Optional[Dict[str, Any]]:
+        extracted = extract_metadata(
+            Path(path),
+            extractors=self.extractors,
+            sniff_frontmatter=self.sniff_frontmatter,
+        )
+
+        # GOVERNANCE GATE: only artifacts that declare metadata
+        if extracted.metadata is None and extracted.limit_exceeded is None:
+            if path in self._governed:
+                self._governed.discard(path)
+                return {"artifact": path, "governed": False}
+            return None
+
+        self._governed.add(path)
+        result = validate_artifact(
+            extracted=extracted,
+            resolved_schema=self.resolved_schema,
+        )
+        return {
+            "artifact": path,
+            "passed": not any(d.get("severity") == "error" for d in result.diagnostics),
+            "diagnostic_count": len(result.diagnostics),
+            "diagnostics": result.diagnostics,
+        }
+
+
+def _artifact_signature(artifact: DiscoveredArtifact) -> Signature:
+    return (artifact.size_bytes, artifact.mtime_ns or 0, artifact.inode or 0)
+
+
+def _stat_signature(path: str) -> Optional[Signature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def watch(
+    root: Path,
+    resolved_schema: ResolvedSchema,
+    *,
+    polling: bool = False,
+    interval: float = 1.0,
+    debounce: float = 0.2,
+    respect_ignore_files: bool = True,
+    extractors: Optional[Mapping[str, Extractor]] = None,
+    sniff_frontmatter: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate `root` once, then stream updated records as artifacts
+    change, until the consumer stops iterating.
+    """
+    session = WatchSession(
+        root,
+        resolved_schema,
+        respect_ignore_files=respect_ignore_files,
+        extractors=extractors,
+        sniff_frontmatter=sniff_frontmatter,
+    )
+    watcher = open_watcher(
+        root,
+        polling=polling,
+        interval=interval,
+        respect_ignore_files=respect_ignore_files,
+    )
+
+    try:
+        yield from session.start()
+
+        while True:
+            batch = next_batch(watcher, debounce)
+            if batch.rescan:
+                watcher.rewatch()
+            yield from session.apply(batch)
+    finally:
+        watcher.close()